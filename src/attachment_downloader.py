@@ -0,0 +1,230 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+첨부파일 다운로더
+게시물 상세 페이지에서 찾은 첨부파일을 청크 단위로 디스크에 스트리밍 저장합니다.
+중단된 다운로드는 HTTP Range로 이어받고, 파일은 SHA-256 내용 해시로 저장하여
+두 게시판에 같은 PDF/HWP가 올라와도 한 번만 보관합니다.
+학교 서버에 부담을 주지 않도록 전체 다운로드 속도를 초당 바이트 수로 제한합니다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+import http_client
+
+# 첨부파일 저장 경로 설정
+ATTACHMENT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'attachments')
+OBJECT_DIR = os.path.join(ATTACHMENT_DIR, 'objects')
+PARTIAL_DIR = os.path.join(ATTACHMENT_DIR, 'partial')
+INDEX_PATH = os.path.join(ATTACHMENT_DIR, 'index.json')
+
+CHUNK_SIZE = 64 * 1024
+DEFAULT_WORKERS = 3
+# 전체 다운로드 속도 제한 (초당 바이트)
+DEFAULT_RATE = 512 * 1024
+
+
+_index_lock = threading.Lock()
+
+
+def load_index():
+    """
+    다운로드 색인을 읽어옵니다.
+
+    Returns:
+        dict: {첨부파일 URL: {"sha256", "name", "size", "content_type", "path"}}
+    """
+    try:
+        with open(INDEX_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _update_index(url, entry):
+    with _index_lock:
+        index = load_index()
+        index[url] = entry
+        os.makedirs(ATTACHMENT_DIR, exist_ok=True)
+        tmp_path = f"{INDEX_PATH}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, INDEX_PATH)
+
+
+def _object_path(digest):
+    return os.path.join(OBJECT_DIR, digest[:2], digest)
+
+
+def _partial_path(url):
+    return os.path.join(PARTIAL_DIR, hashlib.sha1(url.encode('utf-8')).hexdigest() + '.part')
+
+
+def _hash_existing(path, hasher):
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            hasher.update(chunk)
+
+
+def _total_size(response):
+    """
+    응답 헤더로 알 수 있는 전체 파일 크기. 206/416은 Content-Range의 전체 크기,
+    200은 Content-Length를 씁니다. 알 수 없거나 본문이 압축되어 전송되면 None입니다.
+    """
+    if response.status_code in (206, 416):
+        total = response.headers.get('Content-Range', '').rpartition('/')[2]
+        return int(total) if total.isdigit() else None
+    if response.headers.get('Content-Encoding', 'identity') != 'identity':
+        # iter_content가 압축을 풀어 쓰므로 Content-Length와 저장한 크기가 다릅니다
+        return None
+    length = response.headers.get('Content-Length', '')
+    return int(length) if length.isdigit() else None
+
+
+def _fetch(url, part_path, limiter):
+    """
+    .part 파일에 첨부파일 본문을 받습니다 (있으면 Range로 이어받음).
+
+    Returns:
+        tuple: (sha256 hasher, Content-Type, 전체 크기 또는 None),
+               416 응답의 전체 크기가 받아 둔 크기와 다르면 None
+    """
+    offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+    headers = {'Range': f'bytes={offset}-'} if offset else None
+
+    hasher = hashlib.sha256()
+    response = http_client.get(url, headers=headers, stream=True)
+    with response:
+        total = _total_size(response)
+        if response.status_code == 416 and offset:
+            # 이전 실행에서 끝까지 받아 둔 경우에만 그대로 씁니다 (Content-Range: bytes */N)
+            if total != offset:
+                return None
+            _hash_existing(part_path, hasher)
+            mode = None
+        else:
+            response.raise_for_status()
+            if response.status_code == 206 and offset:
+                _hash_existing(part_path, hasher)
+                mode = 'ab'
+            else:
+                # 서버가 Range를 무시하면 처음부터 다시 받습니다
+                mode = 'wb'
+        content_type = response.headers.get('Content-Type', '')
+
+        if mode:
+            with open(part_path, mode) as f:
+                for chunk in http_client.iter_body(response, CHUNK_SIZE):
+                    if limiter:
+                        limiter.consume(len(chunk))
+                    f.write(chunk)
+                    hasher.update(chunk)
+    return hasher, content_type, total
+
+
+def download_attachment(url, name="", limiter=None):
+    """
+    첨부파일 하나를 내려받아 내용 해시 경로에 저장합니다.
+
+    Args:
+        url (str): 첨부파일 URL
+        name (str): 원래 파일 이름 (색인에 기록)
+        limiter (http_client.TokenBucket, optional): 공유 바이트 속도 제한기
+
+    Returns:
+        dict: 색인 항목, 실패 시 None
+    """
+    existing = load_index().get(url)
+    if existing and os.path.exists(_object_path(existing['sha256'])):
+        return existing
+
+    os.makedirs(PARTIAL_DIR, exist_ok=True)
+    part_path = _partial_path(url)
+    try:
+        fetched = _fetch(url, part_path, limiter)
+        if fetched is None:
+            # 받아 둔 부분이 서버 파일과 맞지 않으므로 지우고 처음부터 한 번 더 받습니다
+            os.remove(part_path)
+            fetched = _fetch(url, part_path, limiter)
+    except requests.RequestException as e:
+        # 받은 부분은 남겨 두고 다음 실행에서 이어받습니다
+        logging.error(f"첨부파일 다운로드 실패 ({url}): {e}")
+        return None
+    hasher, content_type, total = fetched
+
+    size = os.path.getsize(part_path)
+    if total is not None and size != total:
+        if size > total:
+            os.remove(part_path)
+        # 모자라면 받은 부분은 남겨 두고 다음 실행에서 이어받습니다
+        logging.error(f"첨부파일 크기 불일치 ({url}): {size}/{total}바이트")
+        return None
+
+    digest = hasher.hexdigest()
+    object_path = _object_path(digest)
+    if os.path.exists(object_path):
+        # 같은 내용의 파일이 이미 있으므로 하나만 보관합니다
+        os.remove(part_path)
+    else:
+        os.makedirs(os.path.dirname(object_path), exist_ok=True)
+        os.replace(part_path, object_path)
+
+    entry = {
+        "sha256": digest,
+        "name": name,
+        "size": size,
+        "content_type": content_type,
+        "path": os.path.relpath(object_path, ATTACHMENT_DIR)
+    }
+    _update_index(url, entry)
+    return entry
+
+
+def download_attachments(details, max_workers=DEFAULT_WORKERS, rate=DEFAULT_RATE):
+    """
+    상세 정보 목록에 포함된 모든 첨부파일을 스레드 풀로 내려받습니다.
+
+    Args:
+        details (iterable): post_detail.fetch_post_details()가 반환한 상세 정보들
+        max_workers (int): 동시 다운로드 수
+        rate (int): 전체 다운로드 속도 제한 (초당 바이트)
+
+    Returns:
+        dict: {첨부파일 URL: 색인 항목} (실패한 파일은 제외)
+    """
+    attachments = {}
+    for detail in details:
+        for attachment in detail.get('attachments', []):
+            attachments.setdefault(attachment['url'], attachment.get('name', ''))
+
+    if not attachments:
+        return {}
+
+    limiter = http_client.TokenBucket(rate)
+    results = {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(attachments))) as executor:
+        futures = {
+            executor.submit(download_attachment, url, name, limiter): url
+            for url, name in attachments.items()
+        }
+        for future, url in futures.items():
+            try:
+                entry = future.result()
+            except OSError as e:
+                # 디스크 오류 등은 해당 첨부파일만 실패로 처리하고 나머지는 계속 받습니다
+                logging.error(f"첨부파일 저장 실패 ({url}): {e}")
+                continue
+            if entry:
+                results[url] = entry
+
+    unique = len({entry['sha256'] for entry in results.values()})
+    logging.info(f"첨부파일 {len(results)}/{len(attachments)}개 준비, 고유 파일 {unique}개")
+    return results
@@ -0,0 +1,296 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+공용 게시판 목록 크롤러
+BoardSpec(mi, bbsId, 수집할 필드) 하나로 공지사항/가정통신문 등 같은 템플릿을 쓰는 모든 게시판을 크롤링합니다.
+열 위치는 표마다 헤더 행에서 한 번만 결정하고, 각 행은 정해진 열만 읽으므로
+행 하나를 처리하는 비용이 셀 개수와 무관하게 일정합니다.
+"""
+
+import logging
+import re
+from collections import namedtuple
+from datetime import datetime
+from urllib.parse import urljoin
+
+import requests
+
+import board_parser
+import http_cache
+import http_client
+
+# 게시판 설정
+#   name        - 로그/오류 메시지에 쓰는 게시판 이름 (예: 공지사항)
+#   result_key  - 결과 dict에서 게시물 목록을 담는 키 (예: notices)
+#   mi, bbs_id  - 학교 홈페이지 게시판 식별자 (상세보기 URL 생성에 사용)
+#   fields      - 게시물마다 기록할 필드
+#   skip_pinned - True이면 번호가 '공지'인 상단 고정 글을 건너뜁니다
+BoardSpec = namedtuple(
+    'BoardSpec',
+    ['name', 'result_key', 'mi', 'bbs_id', 'fields', 'skip_pinned'],
+    defaults=(('number', 'title', 'author', 'date', 'views', 'url', 'ntt_sn'), False)
+)
+
+# 헤더 텍스트 -> 필드 (공백을 제거한 뒤 비교합니다)
+HEADER_FIELDS = {
+    '번호': 'number',
+    '제목': 'title',
+    '작성자': 'author',
+    '글쓴이': 'author',
+    '작성부서': 'author',
+    '담당부서': 'author',
+    '부서': 'author',
+    '등록일': 'date',
+    '작성일': 'date',
+    '게시일': 'date',
+    '날짜': 'date',
+    '조회수': 'views',
+    '조회': 'views',
+    '첨부': 'attachment',
+    '첨부파일': 'attachment',
+    '파일': 'attachment',
+}
+
+PINNED_NUMBER = '공지'
+
+DATE_PATTERN = re.compile(r'(\d{4})\.(\d{2})\.(\d{2})')
+AUTHOR_PATTERN = re.compile(r'^[가-힣\*]{2,10}$')
+ONCLICK_SN_PATTERN = re.compile(r"['\"](\d+)['\"]")
+LINK_SN_PATTERN = re.compile(r'nttSn=(\d+)')
+
+# 헤더를 읽지 못했을 때 기존 템플릿(번호, 제목, 작성자, 등록일, [첨부], 조회수)의 최소 열 수
+MIN_CELLS = 4
+
+
+def _columns_from_headers(headers):
+    """
+    헤더 텍스트로 필드별 열 위치를 정합니다.
+    상단 고정 글은 첨부 열이 빠진 채로 오는 경우가 있으므로, 첨부 열보다 뒤에 있는 열은
+    행 끝에서부터 센 음수 위치로 기록합니다.
+    """
+    columns = {}
+    for index, header in enumerate(headers):
+        field = HEADER_FIELDS.get(''.join(header.split()))
+        if field and field not in columns:
+            columns[field] = index
+    if 'title' not in columns:
+        return None
+
+    attachment = columns.get('attachment')
+    if attachment is not None:
+        for field, index in columns.items():
+            if index > attachment:
+                columns[field] = index - len(headers)
+    return columns
+
+
+def _columns_from_row(cells):
+    """
+    헤더가 없는 표에서 첫 데이터 행의 내용으로 열 위치를 추정합니다 (기존 크롤러와 같은 규칙).
+    """
+    columns = {'number': 0}
+    columns['title'] = next((i for i, cell in enumerate(cells) if 'ta_l' in cell.classes), 1)
+
+    author = next((i for i, cell in enumerate(cells)
+                   if i not in (0, columns['title']) and AUTHOR_PATTERN.match(cell.text)), None)
+    if author is not None:
+        columns['author'] = author
+
+    if len(cells) > 3 and DATE_PATTERN.search(cells[3].text):
+        columns['date'] = 3
+    else:
+        date = next((i for i, cell in enumerate(cells) if DATE_PATTERN.search(cell.text)), None)
+        if date is not None:
+            columns['date'] = date
+
+    if len(cells) > 4:
+        columns['views'] = -1
+    return columns
+
+
+def _fits(cells, columns):
+    count = len(cells)
+    return count >= MIN_CELLS and all(-count <= index < count for index in columns.values())
+
+
+def _post_url(cell, list_url, spec):
+    """
+    제목 셀에서 상세보기 URL과 nttSn을 추출합니다.
+    """
+    link = cell.href
+    ntt_sn = ""
+    if link.startswith('javascript:'):
+        # onclick="fn_view('123456')" 형태에서 nttSn 추출 후 상세보기 URL 생성
+        match = ONCLICK_SN_PATTERN.search(cell.onclick)
+        if match:
+            ntt_sn = match.group(1)
+            link = f"selectNttView.do?mi={spec.mi}&bbsId={spec.bbs_id}&nttSn={ntt_sn}"
+        else:
+            link = ""
+    if link and not link.startswith('http'):
+        link = urljoin(list_url, link)
+    if not ntt_sn:
+        match = LINK_SN_PATTERN.search(link)
+        if match:
+            ntt_sn = match.group(1)
+    return link, ntt_sn
+
+
+def _parse_row(cells, columns, list_url, spec):
+    title_cell = cells[columns['title']]
+    if title_cell.link_text is not None:
+        title = title_cell.link_text
+        link, ntt_sn = _post_url(title_cell, list_url, spec)
+    else:
+        title = title_cell.text
+        link, ntt_sn = "", ""
+
+    date = ""
+    if 'date' in columns:
+        match = DATE_PATTERN.search(cells[columns['date']].text)
+        if match:
+            date = '-'.join(match.groups())
+        else:
+            logging.warning(f"날짜를 찾을 수 없습니다. 셀 내용: {[cell.text for cell in cells]}")
+
+    views = "0"
+    if 'views' in columns:
+        views_text = cells[columns['views']].text
+        if views_text.isdigit() and int(views_text) > 0:
+            views = views_text
+
+    if 'attachment' in columns:
+        has_attachment = cells[columns['attachment']].has_img
+    else:
+        has_attachment = any(cell.has_img for cell in cells)
+
+    post = {
+        "number": cells[columns['number']].text if 'number' in columns else "",
+        "title": title,
+        "author": cells[columns['author']].text if 'author' in columns else "",
+        "date": date,
+        "views": views,
+        "url": link,
+        "ntt_sn": ntt_sn,
+        "has_attachment": has_attachment
+    }
+    return {field: post[field] for field in spec.fields}
+
+
+def _error_result(spec, url, site_name, message):
+    return {
+        spec.result_key: [],
+        "meta": {
+            "total_count": 0,
+            "last_updated": datetime.now().strftime("%Y-%m-%d"),
+            "source": site_name,
+            "url": url,
+            "error": message
+        }
+    }
+
+
+def crawl_board(url, spec, site_name=None, backend=None, limit=None):
+    """
+    게시판 목록 페이지를 크롤링합니다.
+
+    Args:
+        url (str): 게시판 목록 페이지 URL
+        spec (BoardSpec): 게시판 설정
+        site_name (str, optional): 사이트 이름, 없으면 URL에서 추출
+        backend (str, optional): 목록 파서 백엔드 (board_parser.BACKENDS), 없으면 기본값
+        limit (int, optional): 지정하면 응답을 스트리밍으로 파싱하고 이 개수만큼 모은 뒤 읽기를 멈춥니다
+
+    Returns:
+        dict: {spec.result_key: 게시물 목록, "meta": 메타 정보}
+    """
+    if not site_name:
+        # URL에서 도메인 추출하여 사이트 이름으로 사용
+        match = re.search(r'https?://(?:www\.)?([^/]+)', url)
+        site_name = match.group(1) if match else "unknown_site"
+
+    logging.info(f"{site_name} {spec.name} HTML 크롤러 시작...")
+
+    # 웹 페이지 요청 (공용 세션 사용, 이전 실행의 ETag/Last-Modified로 조건부 요청)
+    # 개수 제한 결과는 전체 결과와 따로 캐시합니다
+    cache_key = f"{url}#limit={limit}" if limit else url
+    cached = http_cache.load(cache_key)
+    try:
+        response = http_client.get(url, headers=http_cache.conditional_headers(cached), stream=bool(limit))
+        if response.status_code == 304 and cached:
+            response.close()
+            return http_cache.reuse(cached, "304")
+        response.raise_for_status()
+    except requests.RequestException as e:
+        logging.error(f"요청 중 오류 발생: {e}")
+        # 일시적인 장애로 페이지가 비지 않도록 마지막으로 성공한 결과가 있으면 그것을 사용합니다
+        if cached:
+            return http_cache.stale(cached, str(e))
+        return _error_result(spec, url, site_name, str(e))
+
+    try:
+        if limit:
+            # 스트리밍 모드: 필요한 행을 모으면 소켓 읽기를 멈추므로 본문 전체 해시는 비교하지 않습니다
+            digest = None
+            headers = []
+            table = board_parser.BoardTable(headers, board_parser.iter_board_rows(http_client.iter_body(response), headers))
+        else:
+            # 서버가 검증자를 무시하는 경우 본문 해시로 변경 여부를 먼저 확인
+            digest = http_cache.body_digest(response.content)
+            if cached and cached.get('digest') == digest:
+                return http_cache.reuse(cached, "digest")
+            table = board_parser.parse_board_table(response.content, backend)
+
+        if table is None:
+            logging.error(f"{spec.name} 테이블을 찾을 수 없습니다.")
+            return _error_result(spec, url, site_name, f"{spec.name} 테이블을 찾을 수 없습니다.")
+
+        posts = []
+        columns = None
+        for cells in table.rows:
+            # 열 위치는 표마다 한 번만 정합니다 (스트리밍 모드에서는 첫 행이 도착한 뒤 헤더가 채워져 있습니다)
+            if columns is None:
+                columns = _columns_from_headers(table.headers) or _columns_from_row(cells)
+                logging.debug(f"{spec.name} 열 위치: {columns}")
+            if not _fits(cells, columns):
+                continue
+
+            try:
+                if spec.skip_pinned and 'number' in columns and cells[columns['number']].text == PINNED_NUMBER:
+                    continue
+                posts.append(_parse_row(cells, columns, url, spec))
+            except Exception as e:
+                logging.error(f"행 파싱 중 오류 발생: {e}")
+                continue
+
+            if limit and len(posts) >= limit:
+                break
+
+        if limit and columns is None:
+            # 스트리밍 모드는 표가 없는 페이지와 행이 없는 표를 구분하지 못하므로 둘 다 오류로 처리합니다
+            logging.error(f"{spec.name} 목록 행을 찾을 수 없습니다.")
+            return _error_result(spec, url, site_name, f"{spec.name} 목록 행을 찾을 수 없습니다.")
+
+    except Exception as e:
+        logging.error(f"HTML 파싱 오류: {e}")
+        return _error_result(spec, url, site_name, f"HTML 파싱 오류: {str(e)}")
+    finally:
+        response.close()
+
+    # 메타 정보 추가
+    result = {
+        spec.result_key: posts,
+        "meta": {
+            "total_count": len(posts),
+            "last_updated": datetime.now().strftime("%Y-%m-%d"),
+            "source": site_name,
+            "url": url
+        }
+    }
+
+    # 빈 결과를 검증자와 함께 저장하면 이후 304 응답마다 빈 목록을 재사용하게 되므로 저장하지 않습니다
+    if posts:
+        http_cache.store(cache_key, response, digest, result)
+    logging.info(f"{spec.name} HTML 크롤링 완료: {len(posts)}개")
+    return result
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+게시판 변경분(delta)
+게시판을 크롤링할 때마다 이전 실행과 비교한 새 게시물, 수정된 게시물(제목/날짜 변경), 삭제된 게시물을
+data/deltas/<학교 ID>-<게시판 종류>.json에 기록하는 모듈입니다.
+새/수정 게시물은 게시물 저장소의 row_hash와 nttSn으로 판단하고(post_store.diff_posts),
+삭제된 게시물은 이전 실행의 목록에 있었지만 이번 목록에서 사라진 게시물입니다.
+상세 페이지 수집, 피드, 페이지 생성은 이 문서를 보고 바뀐 게시물만 처리합니다.
+
+변경분 문서:
+    {
+        "board": {"url", "kind", "name", "school_id"},
+        "run_at", "previous_run_at", "status",
+        "new": [게시물], "edited": [게시물 + "previous"], "removed": [게시물],
+        "listing": [이번 목록의 nttSn (상단 고정 글 제외)]
+    }
+"""
+
+import json
+import os
+
+import post_store
+
+DELTA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'deltas')
+
+PINNED_NUMBER = '공지'
+
+
+def delta_path(kind, school_id=''):
+    return os.path.join(DELTA_DIR, f"{school_id or 'default'}-{kind}.json")
+
+
+def load_delta(kind, school_id=''):
+    """
+    게시판의 마지막 변경분 문서를 읽어옵니다.
+
+    Returns:
+        dict: 변경분 문서, 없으면 None
+    """
+    try:
+        with open(delta_path(kind, school_id), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_delta(path, delta):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(delta, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _listing(posts):
+    """
+    목록에 보인 게시물의 nttSn을 목록 순서대로 반환합니다. 상단 고정 글은 오래된 글이 섞여 있으므로 제외합니다.
+    """
+    return [str(post['ntt_sn']) for post in posts
+            if str(post.get('ntt_sn') or '').isdigit() and post.get('number') != PINNED_NUMBER]
+
+
+def _removed(url, previous_listing, listing, path=None):
+    """
+    이전 목록에 있던 게시물 중 이번 목록에서 사라진 게시물을 찾습니다.
+    이번 목록의 가장 오래된 게시물보다 오래된 글은 뒤 페이지로 밀려난 것이므로 삭제로 보지 않습니다.
+    """
+    if not previous_listing or not listing:
+        return []
+    oldest = min(int(ntt_sn) for ntt_sn in listing)
+    current = set(listing)
+    gone = [ntt_sn for ntt_sn in previous_listing if ntt_sn not in current and int(ntt_sn) >= oldest]
+    if not gone:
+        return []
+    stored = post_store.get_posts(url, gone, path)
+    return [stored.get(ntt_sn, {"ntt_sn": ntt_sn}) for ntt_sn in gone]
+
+
+def record_delta(url, kind, result, changes, name='', school_id='', path=None):
+    """
+    이번 크롤링의 변경분 문서를 만들어 저장합니다.
+
+    Args:
+        url (str): 게시판 목록 URL
+        kind (str): 게시판 종류이자 결과 키 (notices, letters)
+        result (dict): crawl_board() 결과
+        changes (dict): post_store.save_board_result()의 반환값
+        name (str): 게시판 이름
+        school_id (str): 학교 ID
+        path (str, optional): 게시물 저장소 경로
+
+    Returns:
+        dict: 변경분 문서
+    """
+    previous = load_delta(kind, school_id) or {}
+    previous_listing = previous.get('listing', [])
+    if changes['status'] == 'ok':
+        listing = _listing(result.get(kind, []))
+        removed = _removed(url, previous_listing, listing, path)
+    else:
+        # 목록을 새로 읽지 못했으면 이전 목록을 그대로 이어받습니다
+        listing = previous_listing
+        removed = []
+
+    delta = {
+        "board": {"url": url, "kind": kind, "name": name, "school_id": school_id},
+        "run_at": changes['run_at'],
+        "previous_run_at": previous.get('run_at'),
+        "status": changes['status'],
+        "new": changes['new'],
+        "edited": changes['edited'],
+        "removed": removed,
+        "listing": listing
+    }
+    _save_delta(delta_path(kind, school_id), delta)
+    return delta
+
+
+def has_changes(delta):
+    """
+    변경분에 새/수정/삭제 게시물이 하나라도 있으면 True를 반환합니다.
+    """
+    return bool(delta and (delta['new'] or delta['edited'] or delta['removed']))
+
+
+def changed_posts(delta):
+    """
+    상세 페이지를 새로 받아야 하는 게시물(새 게시물과 수정된 게시물)을 반환합니다.
+    """
+    if not delta:
+        return []
+    return list(delta['new']) + list(delta['edited'])
+
+
+def format_delta(delta):
+    """
+    변경분 요약 한 줄을 만듭니다.
+    """
+    return (f"{delta['board']['name'] or delta['board']['kind']}: 새 글 {len(delta['new'])}개, "
+            f"수정 {len(delta['edited'])}개, 삭제 {len(delta['removed'])}개")
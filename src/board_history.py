@@ -0,0 +1,242 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+게시판 전체 이력 크롤러
+selectNttList.do 목록을 pageIndex 순서로 넘기며 게시물을 모으고, 이미 본 가장 큰 nttSn을 기록하여
+다음 실행부터는 알려진 게시물을 만나는 즉시 멈추는 증분 크롤링 모듈입니다.
+첫 실행에서 전체 이력을 한 번 수집하고, 이후 실행은 보통 첫 페이지 하나만 읽습니다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# 이력 파일 경로 설정 (게시판 URL 하나당 파일 하나)
+HISTORY_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'board_history')
+
+# 한 번의 실행에서 넘길 최대 페이지 수 (첫 전체 수집 시 안전장치)
+DEFAULT_MAX_PAGES = 500
+
+
+def page_url(list_url, page_index):
+    """
+    목록 URL에 pageIndex 파라미터를 적용합니다. 첫 페이지는 원래 URL을 그대로 사용하여
+    화면 표시용 크롤링과 조건부 요청 캐시를 공유합니다.
+    """
+    if page_index <= 1:
+        return list_url
+    parts = urlsplit(list_url)
+    query = [(k, v) for k, v in parse_qsl(parts.query) if k != 'pageIndex']
+    query.append(('pageIndex', str(page_index)))
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def _history_path(list_url):
+    name = hashlib.sha1(list_url.encode('utf-8')).hexdigest()
+    return os.path.join(HISTORY_DIR, f"{name}.json")
+
+
+def load_history(list_url):
+    """
+    게시판의 저장된 이력을 읽어옵니다.
+
+    Returns:
+        dict: {"url", "last_seen", "items", "resume"(읽지 못한 구간이 있을 때만)} (없으면 빈 이력)
+    """
+    path = _history_path(list_url)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"url": list_url, "last_seen": 0, "items": []}
+
+
+def _save_history(list_url, history):
+    os.makedirs(HISTORY_DIR, exist_ok=True)
+    path = _history_path(list_url)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(history, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def _sn_of(item):
+    try:
+        return int(item.get('ntt_sn') or 0)
+    except ValueError:
+        return 0
+
+
+def _crawl_range(list_url, crawl_page, result_key, site_name, start_page, max_pages, upper, lower,
+                 known, seen_this_run):
+    """
+    start_page부터 목록을 넘기며 lower < nttSn < upper 범위의 새 게시물을 모읍니다 (upper가 None이면 위쪽 제한 없음).
+    nttSn이 lower 이하인 게시물(상단 고정 공지 제외)을 만나거나 더 읽을 게시물이 없으면 끝까지 읽은 것으로 봅니다.
+
+    Returns:
+        dict: {"items", "first_page", "pages", "error", "done", "next_page", "lowest"}
+              next_page는 다음에 읽을 페이지, lowest는 모은 게시물(고정 공지 제외) 중 가장 작은 nttSn
+    """
+    items = []
+    first_page = None
+    pages = 0
+    error = None
+    done = False
+    lowest = None
+    next_page = start_page
+
+    for page_index in range(start_page, start_page + max_pages):
+        result = crawl_page(page_url(list_url, page_index), site_name)
+        pages += 1
+        if page_index == 1:
+            first_page = result
+
+        if result.get('meta', {}).get('error'):
+            error = result['meta']['error']
+            break
+        next_page = page_index + 1
+
+        rows = result.get(result_key, [])
+
+        # 첫 페이지가 이전 실행과 동일하고 이력보다 새 게시물도 없으면 멈춥니다.
+        # 이전 실행이 뒤쪽 페이지에서 실패했다면 첫 페이지 캐시에는 이력에 없는 게시물이 남아 있으므로 계속 넘깁니다
+        if page_index == 1 and result.get('meta', {}).get('not_modified') and lower:
+            newest = max((_sn_of(row) for row in rows if row.get('number') != '공지'), default=0)
+            if newest <= lower:
+                done = True
+                break
+
+        page_rows = 0
+        for row in rows:
+            sn = _sn_of(row)
+            if not sn or sn in seen_this_run:
+                continue
+            # 상단 고정 공지는 모든 페이지에 반복되고 순서와 무관하므로 중단 기준으로 쓰지 않습니다
+            pinned = row.get('number') == '공지'
+            if not pinned and sn <= lower:
+                done = True
+                break
+            seen_this_run.add(sn)
+            page_rows += 1
+            if not pinned and upper is not None and sn >= upper:
+                # 이어받기 구간 위쪽은 이미 이력에 있습니다 (새 게시물로 페이지가 밀린 경우)
+                continue
+            if not pinned:
+                lowest = sn if lowest is None else min(lowest, sn)
+            if sn not in known:
+                items.append(row)
+
+        if done or page_rows == 0:
+            done = True
+            break
+
+    return {
+        "items": items,
+        "first_page": first_page,
+        "pages": pages,
+        "error": error,
+        "done": done,
+        "next_page": next_page,
+        "lowest": lowest
+    }
+
+
+def crawl_board_history(list_url, crawl_page, result_key, site_name=None, max_pages=DEFAULT_MAX_PAGES):
+    """
+    게시판 목록을 여러 페이지에 걸쳐 크롤링하고 이력에 새 게시물을 추가합니다.
+
+    첫 전체 수집처럼 긴 크롤링이 중간에 실패하거나 max_pages에 닿으면, 그때까지 모은 게시물은 저장하고
+    읽지 못한 구간을 이력의 "resume" ({"page", "below", "until"})에 남깁니다. 다음 실행은 먼저 첫 페이지부터
+    새 게시물을 확인한 뒤, 남은 구간(until < nttSn < below)을 기록한 페이지부터 이어서 읽습니다.
+
+    Args:
+        list_url (str): 게시판 목록 첫 페이지 URL
+        crawl_page (callable): (url, site_name) -> 크롤링 결과 dict (crawl_school_notices 등)
+        result_key (str): 결과 dict에서 게시물 목록의 키 ("notices" 또는 "letters")
+        site_name (str, optional): 사이트 이름
+        max_pages (int): 한 번에 넘길 최대 페이지 수
+
+    Returns:
+        dict: {result_key: 이번 실행에서 새로 찾은 게시물(nttSn 내림차순), "first_page": 첫 페이지 결과, "meta": {...}}
+              전체 이력은 load_history()로 읽습니다. 저장소에는 새 게시물만 넘기므로 비용이 이력 크기와 무관합니다.
+              실패한 경우에도 실패 전까지 모아 이력에 저장한 게시물은 돌려줍니다.
+    """
+    history = load_history(list_url)
+    last_seen = history.get('last_seen', 0)
+    resume = history.get('resume')
+    known = {_sn_of(item) for item in history.get('items', [])}
+    seen_this_run = set()
+
+    # 1단계: 첫 페이지부터 마지막으로 본 게시물까지 새 게시물을 읽습니다
+    walk = _crawl_range(list_url, crawl_page, result_key, site_name, 1, max_pages, None, last_seen,
+                        known, seen_this_run)
+    first_page = walk['first_page']
+    pages = walk['pages']
+    error = walk['error']
+    new_items = walk['items']
+
+    if not walk['done']:
+        if not error:
+            logging.warning(f"최대 페이지 수({max_pages})에 도달했습니다: {list_url}")
+        if resume or walk['lowest'] is None:
+            # 이어받을 구간은 하나만 유지합니다. 이미 남은 구간이 있으면 이번에 읽은 앞쪽 게시물은 다음 실행에서 다시 읽습니다
+            logging.error(f"이력 크롤링 중단 ({pages}페이지), 이번 결과는 저장하지 않습니다: {error or '최대 페이지 수 도달'}")
+            new_items = []
+        else:
+            resume = {"page": walk['next_page'], "below": walk['lowest'], "until": last_seen}
+            logging.error(f"이력 크롤링 중단 ({pages}페이지), {resume['page']}페이지부터 이어서 읽습니다: "
+                          f"{error or '최대 페이지 수 도달'}")
+    elif resume:
+        # 2단계: 이전 실행에서 읽지 못한 구간을 이어서 읽습니다.
+        # 그사이 게시물이 지워져 페이지가 당겨졌을 수 있으므로 한 페이지 앞부터 읽습니다
+        start_page = max(2, resume['page'] - 1)
+        walk = _crawl_range(list_url, crawl_page, result_key, site_name, start_page, max_pages - pages,
+                            resume['below'], resume['until'], known, seen_this_run)
+        pages += walk['pages']
+        error = walk['error']
+        new_items += walk['items']
+        if walk['done']:
+            logging.info(f"이력 이어받기 완료: {list_url}")
+            resume = None
+        else:
+            below = min(resume['below'], walk['lowest']) if walk['lowest'] is not None else resume['below']
+            resume = {"page": walk['next_page'], "below": below, "until": resume['until']}
+            logging.error(f"이력 이어받기 중단, {resume['page']}페이지부터 다시 이어서 읽습니다: "
+                          f"{error or '최대 페이지 수 도달'}")
+
+    if new_items or resume != history.get('resume'):
+        items = new_items + history.get('items', [])
+        items.sort(key=_sn_of, reverse=True)
+        history['items'] = items
+        history['last_seen'] = max(last_seen, max((_sn_of(item) for item in new_items), default=0))
+        history['url'] = list_url
+        if resume:
+            history['resume'] = resume
+        else:
+            history.pop('resume', None)
+        _save_history(list_url, history)
+
+    logging.info(f"이력 크롤링 완료: {pages}페이지, 새 게시물 {len(new_items)}개, 전체 {len(history.get('items', []))}개")
+
+    meta = {
+        "total_count": len(history.get('items', [])),
+        "new_count": len(new_items),
+        "pages_crawled": pages,
+        "last_seen": history.get('last_seen', 0),
+        "last_updated": datetime.now().strftime("%Y-%m-%d"),
+        "source": site_name,
+        "url": list_url
+    }
+    if resume:
+        meta["resume_page"] = resume['page']
+    if error:
+        meta["error"] = error
+    return {
+        result_key: sorted(new_items, key=_sn_of, reverse=True),
+        "first_page": first_page,
+        "meta": meta
+    }
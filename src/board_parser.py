@@ -0,0 +1,293 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+게시판 목록 HTML 파서
+선택 가능한 파서 백엔드로 div.BD_list 표를 읽어 백엔드와 무관한 행/셀 구조로 변환하는 모듈입니다.
+모든 백엔드는 응답 바이트(response.content)를 그대로 받아 문자열 디코딩을 강제하지 않습니다.
+
+백엔드:
+    html.parser - BeautifulSoup + 순수 파이썬 파서 (기존 방식)
+    lxml        - BeautifulSoup + lxml 파서
+    strainer    - BeautifulSoup + lxml, SoupStrainer로 div.BD_list 부분만 트리 생성 (기본값)
+    selectolax  - selectolax(Lexbor) 파서, 설치된 경우에만 사용 가능
+
+iter_board_rows()는 응답 스트림을 이벤트 기반 파서에 조금씩 넣으면서 행을 하나씩 내보내는
+점진적 파싱 모드입니다. 필요한 행을 다 받으면 호출한 쪽이 소켓 읽기를 멈출 수 있습니다.
+"""
+
+import codecs
+import os
+from collections import deque, namedtuple
+from html.parser import HTMLParser
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+# 셀 하나의 텍스트/링크 정보 (텍스트는 셀마다 한 번만 계산합니다)
+BoardCell = namedtuple('BoardCell', ['text', 'link_text', 'href', 'onclick', 'classes', 'has_img'])
+
+# 표 하나: 헤더 텍스트 목록과 데이터 행(BoardCell 튜플) 목록
+BoardTable = namedtuple('BoardTable', ['headers', 'rows'])
+
+BACKENDS = ('html.parser', 'lxml', 'strainer', 'selectolax')
+DEFAULT_BACKEND = os.getenv('BOARD_PARSER_BACKEND', 'strainer')
+
+TBODY_SELECTOR = '#subContent > div > div.BD_list > table > tbody'
+
+
+def _bs4_cell(td):
+    link = td.find('a')
+    return BoardCell(
+        text=td.get_text(strip=True),
+        link_text=link.get_text(strip=True) if link else None,
+        href=link.get('href', '') if link else '',
+        onclick=link.get('onclick', '') if link else '',
+        classes=tuple(td.get('class') or ()),
+        has_img=td.find('img') is not None
+    )
+
+
+def _find_tbody_bs4(soup):
+    tbody = soup.select_one(TBODY_SELECTOR)
+    if tbody:
+        return tbody
+    # 단계별로 찾기 시도
+    sub_content = soup.find(id='subContent')
+    if sub_content:
+        div = sub_content.find('div')
+        if div:
+            bd_list = div.find('div', class_='BD_list')
+            if bd_list:
+                table = bd_list.find('table')
+                if table:
+                    return table.find('tbody')
+    return None
+
+
+def _table_from_tbody_bs4(tbody):
+    headers = []
+    table = tbody.find_parent('table')
+    thead = table.find('thead') if table else None
+    if thead:
+        headers = [th.get_text(strip=True) for th in thead.find_all('th')]
+
+    rows = []
+    for tr in tbody.find_all('tr'):
+        # 헤더 행은 건너뜁니다
+        if tr.find('th'):
+            if not headers:
+                headers = [th.get_text(strip=True) for th in tr.find_all('th')]
+            continue
+        rows.append(tuple(_bs4_cell(td) for td in tr.find_all('td')))
+    return BoardTable(headers, rows)
+
+
+def _parse_bs4(content, parser):
+    soup = BeautifulSoup(content, parser, from_encoding='utf-8')
+    tbody = _find_tbody_bs4(soup)
+    return _table_from_tbody_bs4(tbody) if tbody else None
+
+
+def _parse_strainer(content):
+    only_list = SoupStrainer('div', class_='BD_list')
+    soup = BeautifulSoup(content, 'lxml', parse_only=only_list, from_encoding='utf-8')
+    tbody = soup.select_one('div.BD_list > table > tbody') or soup.find('tbody')
+    return _table_from_tbody_bs4(tbody) if tbody else None
+
+
+def _parse_selectolax(content):
+    try:
+        from selectolax.lexbor import LexborHTMLParser
+    except ImportError as e:
+        raise ImportError("selectolax 백엔드를 사용하려면 'pip install selectolax'가 필요합니다.") from e
+
+    tree = LexborHTMLParser(content)
+    tbody = tree.css_first(TBODY_SELECTOR) or tree.css_first('div.BD_list tbody')
+    if tbody is None:
+        return None
+
+    headers = []
+    table = tbody.parent
+    if table is not None:
+        headers = [th.text(strip=True) for th in table.css('thead th')]
+
+    rows = []
+    for tr in tbody.css('tr'):
+        if tr.css_first('th') is not None:
+            if not headers:
+                headers = [th.text(strip=True) for th in tr.css('th')]
+            continue
+        cells = []
+        for td in tr.css('td'):
+            link = td.css_first('a')
+            attrs = link.attributes if link is not None else {}
+            cells.append(BoardCell(
+                text=td.text(strip=True),
+                link_text=link.text(strip=True) if link is not None else None,
+                href=attrs.get('href') or '',
+                onclick=attrs.get('onclick') or '',
+                classes=tuple((td.attributes.get('class') or '').split()),
+                has_img=td.css_first('img') is not None
+            ))
+        rows.append(tuple(cells))
+    return BoardTable(headers, rows)
+
+
+class _RowCollector(HTMLParser):
+    """
+    div.BD_list 표의 행을 이벤트 단위로 모으는 파서입니다. 트리를 만들지 않고 셀 정보만 기록합니다.
+    """
+
+    def __init__(self, headers):
+        super().__init__(convert_charrefs=True)
+        self.headers = headers
+        self.rows = deque()
+        self.done = False
+        self._list_depth = 0
+        self._in_thead = False
+        self._row = None
+        self._row_has_th = False
+        self._cell = None
+        self._text = []
+        self._link_depth = 0
+
+    def _flush_text(self):
+        # 청크 경계에서 나뉜 텍스트 조각을 하나로 합친 뒤 기록합니다
+        if self._cell is not None and self._text:
+            text = ''.join(self._text)
+            self._cell['texts'].append(text)
+            if self._link_depth:
+                self._cell['link_texts'].append(text)
+        self._text = []
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        self._flush_text()
+        if tag == 'div':
+            if self._list_depth:
+                self._list_depth += 1
+            elif 'BD_list' in (dict(attrs).get('class') or '').split():
+                self._list_depth = 1
+            return
+        if not self._list_depth:
+            return
+
+        if tag == 'thead':
+            self._in_thead = True
+        elif tag == 'tr':
+            self._row = []
+            self._row_has_th = False
+        elif tag in ('td', 'th') and self._row is not None:
+            attributes = dict(attrs)
+            self._cell = {
+                'texts': [], 'link_texts': None, 'href': '', 'onclick': '',
+                'classes': tuple((attributes.get('class') or '').split()), 'has_img': False
+            }
+            if tag == 'th':
+                self._row_has_th = True
+        elif self._cell is not None:
+            if tag == 'a':
+                if self._cell['link_texts'] is None:
+                    attributes = dict(attrs)
+                    self._cell['link_texts'] = []
+                    self._cell['href'] = attributes.get('href') or ''
+                    self._cell['onclick'] = attributes.get('onclick') or ''
+                    self._link_depth = 1
+                elif self._link_depth:
+                    self._link_depth += 1
+            elif tag == 'img':
+                self._cell['has_img'] = True
+
+    def handle_endtag(self, tag):
+        if self.done:
+            return
+        self._flush_text()
+        if not self._list_depth:
+            return
+        if tag == 'div':
+            self._list_depth -= 1
+            if not self._list_depth:
+                self.done = True
+        elif tag == 'tbody':
+            self.done = True
+        elif tag == 'thead':
+            self._in_thead = False
+        elif tag == 'a' and self._link_depth:
+            self._link_depth -= 1
+        elif tag in ('td', 'th') and self._cell is not None:
+            cell = self._cell
+            self._row.append(BoardCell(
+                text=''.join(t.strip() for t in cell['texts']),
+                link_text=''.join(t.strip() for t in cell['link_texts']) if cell['link_texts'] is not None else None,
+                href=cell['href'],
+                onclick=cell['onclick'],
+                classes=cell['classes'],
+                has_img=cell['has_img']
+            ))
+            self._cell = None
+            self._link_depth = 0
+        elif tag == 'tr' and self._row is not None:
+            if self._row_has_th:
+                if not self.headers:
+                    self.headers.extend(cell.text for cell in self._row)
+            elif not self._in_thead:
+                self.rows.append(tuple(self._row))
+            self._row = None
+
+    def handle_data(self, data):
+        if self._cell is not None:
+            self._text.append(data)
+
+
+def iter_board_rows(chunks, headers=None):
+    """
+    응답 본문 청크를 이벤트 기반 파서에 조금씩 넣으면서 div.BD_list 표의 데이터 행을 하나씩 내보냅니다.
+    </tbody>나 div.BD_list가 닫히면 더 이상 읽지 않고, 호출한 쪽이 필요한 만큼만 행을 받고
+    반복을 멈추면 나머지 청크도 읽지 않습니다.
+
+    Args:
+        chunks (iterable): 응답 본문 바이트 청크 (http_client.iter_body 등)
+        headers (list, optional): 전달하면 헤더 텍스트를 여기에 채웁니다
+
+    Yields:
+        tuple: 데이터 행 하나 (BoardCell 튜플)
+    """
+    collector = _RowCollector(headers if headers is not None else [])
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+    for chunk in chunks:
+        collector.feed(decoder.decode(chunk))
+        while collector.rows:
+            yield collector.rows.popleft()
+        if collector.done:
+            return
+
+    collector.feed(decoder.decode(b'', final=True))
+    collector.close()
+    while collector.rows:
+        yield collector.rows.popleft()
+
+
+def parse_board_table(content, backend=None):
+    """
+    게시판 목록 페이지에서 div.BD_list 표를 파싱합니다.
+
+    Args:
+        content (bytes): 응답 본문 바이트 (UTF-8)
+        backend (str, optional): BACKENDS 중 하나, 없으면 DEFAULT_BACKEND
+
+    Returns:
+        BoardTable: 헤더와 데이터 행, 표를 찾지 못하면 None
+
+    Raises:
+        ValueError: 알 수 없는 백엔드인 경우
+    """
+    backend = backend or DEFAULT_BACKEND
+    if backend in ('html.parser', 'lxml'):
+        return _parse_bs4(content, backend)
+    if backend == 'strainer':
+        return _parse_strainer(content)
+    if backend == 'selectolax':
+        return _parse_selectolax(content)
+    raise ValueError(f"알 수 없는 파서 백엔드입니다: {backend} (사용 가능: {', '.join(BACKENDS)})")
@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+빌드 매니페스트
+페이지별 입력 데이터 해시와 생성된 출력 파일 해시를 기록하여,
+입력이 바뀌지 않은 페이지는 렌더링과 파일 쓰기를 모두 건너뛰는 모듈입니다.
+렌더링한 페이지는 page_minify로 압축(minify)한 뒤 쓰고, 같은 자리에 .gz/.br 파일을 함께 씁니다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+
+import page_minify
+
+PARENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MANIFEST_PATH = os.path.join(PARENT_DIR, 'data', 'build_manifest.json')
+
+_lock = threading.Lock()
+_manifest = None
+
+
+def _load():
+    global _manifest
+    if _manifest is None:
+        try:
+            with open(MANIFEST_PATH, 'r', encoding='utf-8') as f:
+                _manifest = json.load(f)
+        except (OSError, ValueError):
+            _manifest = {}
+    return _manifest
+
+
+def _save():
+    os.makedirs(os.path.dirname(MANIFEST_PATH), exist_ok=True)
+    tmp_path = f"{MANIFEST_PATH}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(_manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(tmp_path, MANIFEST_PATH)
+
+
+def file_digest(path):
+    """
+    파일 내용의 SHA-256 해시입니다. 파일이 없으면 None을 반환합니다.
+    """
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def lookup(key):
+    """
+    매니페스트에 기록된 항목을 읽어옵니다 (페이지가 아닌 빌드 노드용, 예: 공용 묶음).
+
+    Returns:
+        dict: 기록된 항목, 없으면 None
+    """
+    with _lock:
+        return _load().get(key)
+
+
+def record(key, entry):
+    """
+    매니페스트에 항목을 기록하고 파일에 저장합니다.
+    """
+    with _lock:
+        _load()[key] = entry
+        _save()
+
+
+def input_digest(inputs, sources=()):
+    """
+    렌더링 입력 데이터와 생성기 소스 파일 내용을 합쳐 하나의 해시로 만듭니다.
+
+    Args:
+        inputs: JSON으로 직렬화할 수 있는 입력 데이터
+        sources (iterable): 출력에 영향을 주는 소스/템플릿 파일 경로
+
+    Returns:
+        str: SHA-256 16진수 문자열
+    """
+    h = hashlib.sha256()
+    h.update(json.dumps(inputs, ensure_ascii=False, sort_keys=True, default=str).encode('utf-8'))
+    for path in sources:
+        h.update(b'\0')
+        h.update((file_digest(path) or '').encode('ascii'))
+    return h.hexdigest()
+
+
+def write_page(output_path, inputs, render, sources=()):
+    """
+    입력이 바뀐 경우에만 페이지를 렌더링하고, 내용이 실제로 달라진 경우에만 파일을 씁니다.
+
+    Args:
+        output_path (str): 출력 파일 경로
+        inputs: 페이지를 결정하는 입력 데이터 (JSON 직렬화 가능)
+        render (callable): 인자 없이 HTML 문자열을 반환하는 함수
+        sources (iterable): 출력에 영향을 주는 소스/템플릿 파일 경로
+
+    Returns:
+        bool: 파일을 새로 썼으면 True, 건너뛰었으면 False
+    """
+    key = os.path.relpath(os.path.abspath(output_path), PARENT_DIR)
+    in_hash = input_digest(inputs, sources)
+
+    with _lock:
+        entry = _load().get(key)
+    current_hash = file_digest(output_path)
+
+    if entry and entry.get('inputs') == in_hash and current_hash and current_hash == entry.get('output'):
+        logging.info(f"입력 변경 없음, 렌더링 건너뜀: {key}")
+        return False
+
+    html = render()
+    content = page_minify.minify(output_path, html).encode('utf-8')
+    out_hash = hashlib.sha256(content).hexdigest()
+
+    written = out_hash != current_hash
+    if written:
+        tmp_path = f"{output_path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(content)
+        os.replace(tmp_path, output_path)
+    else:
+        logging.info(f"출력 내용 동일, 파일 쓰기 건너뜀: {key}")
+    if written or not page_minify.has_compressed(output_path):
+        sizes = page_minify.write_compressed(output_path, content)
+        print(page_minify.format_report(page_minify.SizeReport(output_path, len(html.encode('utf-8')), len(content), *sizes)))
+
+    with _lock:
+        _load()[key] = {'inputs': in_hash, 'output': out_hash}
+        _save()
+    return written
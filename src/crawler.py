@@ -7,9 +7,16 @@
 """
 
 import os
-import requests
+import sqlite3
+import board_delta
+import http_client
+import page_templates
+import post_store
+import school_config
+import site_build
 from notice_crawler import crawl_school_notices
 from family_letter_crawler import crawl_school_letters
+from board_history import crawl_board_history
 from datetime import datetime
 from dotenv import load_dotenv
 
@@ -17,621 +24,17 @@ from dotenv import load_dotenv
 load_dotenv()
 
 def generate_html_base(title, items, school_name, item_type):
-    css_style = """
-        @font-face {
-            font-family: 'SeoulAlrim';
-            src: url('font/SeoulAlrimTTF-Medium.ttf') format('truetype');
-            font-weight: normal;
-            font-style: normal;
-        }
-
-        body {
-            background: #4A90E2;
-            font-family: 'SeoulAlrim', sans-serif;
-            margin: 0; 
-            padding: 0;
-            min-height: 100vh;
-            display: flex;
-            flex-direction: column;
-        }
-
-        .page-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            background: linear-gradient(90deg, #4A90E2, #357ABD);
-            padding: 30px 90px;
-            box-shadow: 0 8px 32px rgba(53, 122, 189, 0.18);
-            flex-shrink: 0;
-        }
-
-        .header-left {
-            display: flex;
-            align-items: center;
-            gap: 30px;
-        }
-
-        .header-main-title {
-            font-size: 5.8rem;
-            font-weight: 900; 
-            color: #FFFFFF;
-            letter-spacing: -2px;
-            text-shadow: 2px 2px 4px rgba(0, 0, 0, 0.1);
-            margin: 0;
-        }
-
-        .header-right {
-            display: flex;
-            align-items: center;
-            gap: 60px;
-        }
-
-        .page-header .weather, 
-        .page-header .date-time {
-            font-size: 2.2rem;
-            color: #FFFFFF;
-            display: flex;
-            align-items: center;
-            gap: 12px;
-            text-shadow: 1px 1px 2px rgba(0, 0, 0, 0.1);
-        }
-
-        .page-header .date-time {
-            line-height: 1.3;
-            text-align: right;
-            font-size: 1.8rem;
-        }
-
-        .page-header .weather {
-            display: flex;
-            align-items: center;
-            gap: 15px;
-        }
-
-        .page-header .weather-content {
-            display: flex;
-            flex-direction: column;
-            align-items: flex-start;
-            gap: 5px;
-        }
-
-        .page-header .weather-icon {
-            width: 45px;
-            height: 45px;
-            flex-shrink: 0;
-        }
-
-        .page-header .weather-temp {
-            font-size: 2.2rem;
-        }
-
-        .page-header .school-name {
-            font-size: 2.2rem;
-            color: #FFFFFF;
-            font-weight: 700;
-            text-shadow: 1px 1px 2px rgba(0, 0, 0, 0.1);
-            white-space: nowrap;
-        }
-
-        @media (max-width: 1380px) {
-            .page-header {
-                flex-direction: column;
-                padding: 25px;
-                gap: 20px;
-            }
-            .header-left, .header-right {
-                width: 100%;
-                justify-content: center;
-                gap: 40px;
-            }
-            .header-main-title {
-                font-size: 5rem;
-            }
-            .page-header .school-name {
-                font-size: 2.2rem;
-            }
-            .content-list td {
-                padding: 25px 20px;
-                font-size: 2rem;
-                line-height: 1.5;
-            }
-        }
-
-        @media (max-width: 768px) {
-            .page-header {
-                padding: 20px;
-            }
-            .header-main-title {
-                font-size: 4rem;
-            }
-            .header-left, .header-right {
-                flex-direction: column;
-                gap: 30px;
-            }
-            .page-header .school-name {
-                font-size: 2rem;
-            }
-            .content-list td {
-                padding: 30px 20px;
-                font-size: 1.8rem;
-                line-height: 1.6;
-            }
-            .content-box {
-                padding: 20px 30px 20px 40px;
-            }
-        }
-
-        .main-content {
-            display: flex; 
-            justify-content: center; 
-            align-items: stretch;
-            margin: 40px auto;
-            background: #FFFFFF;
-            border-radius: 20px;
-            box-shadow: 0 8px 40px rgba(53, 122, 189, 0.18);
-            gap: 0;
-            width: 95%;
-            max-width: 2000px;
-            flex: 1;
-        }
-
-        .content-box {
-            background: #FFFFFF;
-            padding: 30px 60px 30px 80px;
-            box-shadow: 0 10px 40px rgba(53, 122, 189, 0.18);
-            border-radius: 20px 0 0 20px;
-            flex: 1;
-            min-width: 0;
-            display: flex;
-            align-items: stretch;
-        }
-
-        .content-list {
-            width: 100%;
-            border-collapse: collapse;
-            height: 100%;
-            table-layout: fixed;
-        }
-
-        .content-list tr {
-            border-bottom: 1px solid #E5E5E5;
-            height: calc(100% / 7);  /* 7개의 항목이 동일한 높이를 가지도록 설정 */
-        }
-
-        .content-list td {
-            font-size: 2.2rem;
-            padding: 20px;
-            border-bottom: 1px solid #ccc;
-            vertical-align: middle;
-            line-height: 1.4;
-        }
-
-        .content-list td:first-child {
-            width: 80%;  /* 첫 번째 열(내용)의 너비를 80%로 설정 */
-        }
-
-        .content-list td:last-child {
-            width: 20%;  /* 두 번째 열(날짜)의 너비를 20%로 설정 */
-            text-align: right;
-            color: #666666;
-            font-size: 1.8rem;
-            white-space: nowrap;  /* 날짜가 한 줄로 표시되도록 설정 */
-        }
-
-        .school-img {
-            width: 800px;
-            height: calc(100% - 60px);  /* 상하 패딩 30px을 고려하여 계산 */
-            border-radius: 0 20px 20px 0;
-            object-fit: cover; 
-            box-shadow: 0 10px 40px rgba(53, 122, 189, 0.18);
-            flex-shrink: 0;
-            align-self: center;
-            opacity: 1;
-            transition: opacity 1s ease-in-out;
-        }
-
-        .school-img.fade-out {
-            opacity: 0;
-        }
-
-        @media (max-width: 1380px) { 
-            .main-content {
-                flex-wrap: wrap; 
-                justify-content: center;
-                gap: 20px;
-                margin: 60px auto;
-            }
-            .school-img {
-                width: 100%;
-                height: 400px;
-                margin: 0;
-            }
-            .content-list td {
-                padding: 25px 20px;
-                font-size: 2rem;
-                line-height: 1.5;
-            }
-        }
-
-        @media (max-width: 768px) { 
-            .main-content { 
-                flex-direction: column; 
-                align-items: stretch; 
-                margin: 40px auto;
-                width: 95%;
-                gap: 20px;
-            }
-            .school-img { 
-                height: 300px;
-            }
-            .content-box { 
-                min-width: auto; 
-            }
-            .content-list td {
-                padding: 30px 20px;
-                font-size: 1.8rem;
-                line-height: 1.6;
-            }
-            .content-box {
-                padding: 20px 30px 20px 40px;
-            }
-        }
     """
-
-    js_code = """
-        // 날씨 캐시 설정
-        const WEATHER_CACHE_KEY = 'headerWeatherData_v2';
-        const WEATHER_TIMESTAMP_KEY = 'headerWeatherTimestamp_v2';
-        const WEATHER_UPDATE_INTERVAL = 60 * 60 * 1000; // 1시간 (밀리초)
-
-        function updateDateTime() {
-            const now = new Date();
-            const year = now.getFullYear();
-            const month = String(now.getMonth() + 1).padStart(2, '0');
-            const day = String(now.getDate()).padStart(2, '0');
-            const weekDays = ['일', '월', '화', '수', '목', '금', '토'];
-            const weekDay = weekDays[now.getDay()];
-
-            let hours = now.getHours();
-            const ampm = hours >= 12 ? '오후' : '오전';
-            hours = hours % 12;
-            hours = hours ? hours : 12; 
-            const displayHours = String(hours).padStart(2, '0');
-            const minutes = String(now.getMinutes()).padStart(2, '0');
-
-            const dateString = `${year}-${month}-${day} ${weekDay}요일`;
-            const timeString = `${ampm} ${displayHours}:${minutes}`;
-
-            document.getElementById('date-time').innerHTML = `${dateString}<br>${timeString}`;
-        }
-
-        // 캐시에서 날씨 데이터 가져오기
-        function getCachedWeatherData() {
-            try {
-                const cachedData = localStorage.getItem(WEATHER_CACHE_KEY);
-                const timestamp = localStorage.getItem(WEATHER_TIMESTAMP_KEY);
-                
-                if (cachedData && timestamp) {
-                    const data = JSON.parse(cachedData);
-                    const lastUpdate = parseInt(timestamp);
-                    const now = Date.now();
-                    
-                    // 1시간이 지나지 않았다면 캐시된 데이터 사용
-                    if (now - lastUpdate < WEATHER_UPDATE_INTERVAL) {
-                        console.log('캐시된 헤더 날씨 데이터 사용 중...');
-                        return data;
-                    }
-                }
-            } catch (error) {
-                console.error('날씨 캐시 데이터 읽기 실패:', error);
-            }
-            return null;
-        }
-
-        // 날씨 데이터를 캐시에 저장하기
-        function saveWeatherDataToCache(data) {
-            try {
-                localStorage.setItem(WEATHER_CACHE_KEY, JSON.stringify(data));
-                localStorage.setItem(WEATHER_TIMESTAMP_KEY, Date.now().toString());
-                console.log('헤더 날씨 데이터가 캐시에 저장되었습니다.');
-            } catch (error) {
-                console.error('날씨 캐시 저장 실패:', error);
-            }
-        }
-
-        // 날씨 데이터를 화면에 표시하는 함수
-        function displayWeatherData(weatherData) {
-            const temp = Math.round(weatherData.main.temp);
-            const weatherInfo = getWeatherInfo(
-                weatherData.weather[0].main, 
-                weatherData.weather[0].description, 
-                weatherData.isDay
-            );
-            document.querySelector('.weather').innerHTML =
-                `<img class='weather-icon' src='images/${weatherInfo.icon}' alt='날씨아이콘'>
-                 <div class='weather-content'>
-                    <div>${weatherInfo.text}</div>
-                    <div class='weather-temp'>${temp}℃</div>
-                 </div>`;
-        }
-
-        // OpenWeatherMap API 2.5와 커스텀 날씨 아이콘 매핑
-        function getWeatherInfo(weatherMain, weatherDescription, isDay = true) {
-            // 메인 날씨 조건별 매핑
-            const mainWeatherMap = {
-                'Clear': { 
-                    text: '맑음', 
-                    icon: 'weather/1.png' // 태양 아이콘
-                },
-                'Clouds': {
-                    text: '구름',
-                    icon: getCloudIcon(weatherDescription) // 구름 정도에 따라 다른 아이콘
-                },
-                'Rain': {
-                    text: '비',
-                    icon: getRainIcon(weatherDescription) // 비의 강도에 따라 다른 아이콘
-                },
-                'Drizzle': {
-                    text: '이슬비',
-                    icon: 'weather/14.png' // 물방울 아이콘
-                },
-                'Thunderstorm': {
-                    text: '뇌우',
-                    icon: 'weather/7.png' // 번개 아이콘
-                },
-                'Snow': {
-                    text: '눈',
-                    icon: 'weather/5.png' // 눈송이 아이콘
-                },
-                'Mist': {
-                    text: '안개',
-                    icon: 'weather/16.png' // 안개 아이콘
-                },
-                'Fog': {
-                    text: '짙은 안개',
-                    icon: 'weather/16.png' // 안개 아이콘
-                },
-                'Smoke': {
-                    text: '연기',
-                    icon: 'weather/16.png' // 안개 아이콘 (비슷한 시야 제한)
-                },
-                'Haze': {
-                    text: '실안개',
-                    icon: 'weather/16.png' // 안개 아이콘
-                },
-                'Dust': {
-                    text: '먼지',
-                    icon: 'weather/11.png' // 바람 아이콘
-                },
-                'Sand': {
-                    text: '모래바람',
-                    icon: 'weather/11.png' // 바람 아이콘
-                },
-                'Ash': {
-                    text: '화산재',
-                    icon: 'weather/16.png' // 안개 아이콘
-                },
-                'Squall': {
-                    text: '돌풍',
-                    icon: 'weather/11.png' // 바람 아이콘
-                },
-                'Tornado': {
-                    text: '토네이도',
-                    icon: 'weather/11.png' // 바람 아이콘
-                }
-            };
-
-            // 구름 상태에 따른 아이콘 선택
-            function getCloudIcon(description) {
-                const desc = description.toLowerCase();
-                if (desc.includes('few clouds')) {
-                    return 'weather/3.png'; // 부분적으로 구름 낀 맑은 날씨
-                } else if (desc.includes('scattered clouds') || desc.includes('broken clouds')) {
-                    return 'weather/2.png'; // 구름 많음
-                } else if (desc.includes('overcast')) {
-                    return 'weather/8.png'; // 완전히 흐림
-                }
-                return 'weather/2.png'; // 기본 구름 아이콘
-            }
-
-            // 비의 강도에 따른 아이콘 선택
-            function getRainIcon(description) {
-                const desc = description.toLowerCase();
-                if (desc.includes('light rain') || desc.includes('drizzle')) {
-                    return 'weather/14.png'; // 가벼운 비 (물방울)
-                } else if (desc.includes('heavy rain') || desc.includes('extreme rain')) {
-                    return 'weather/6.png'; // 폭우
-                } else if (desc.includes('thunderstorm')) {
-                    return 'weather/10.png'; // 천둥번개를 동반한 비
-                }
-                return 'weather/4.png'; // 기본 비 아이콘
-            }
-
-            // 야간 모드 처리 (달 아이콘 사용)
-            function getNightIcon(weatherMain) {
-                if (weatherMain === 'Clear') {
-                    return 'weather/15.png'; // 달과 별 아이콘
-                }
-                // 다른 날씨는 동일한 아이콘 사용
-                return mainWeatherMap[weatherMain]?.icon || 'weather/1.png';
-            }
-
-            // 메인 날씨 정보 가져오기
-            let weatherInfo = mainWeatherMap[weatherMain] || { 
-                text: weatherMain, 
-                icon: 'weather/1.png' 
-            };
-
-            // 야간인 경우 아이콘 변경
-            if (!isDay && weatherMain === 'Clear') {
-                weatherInfo.icon = getNightIcon(weatherMain);
-            }
-
-            return weatherInfo;
-        }
-
-        // 초기 날씨 데이터 로드 함수
-        async function loadInitialWeather() {
-            // 먼저 캐시에서 데이터 확인
-            const cachedData = getCachedWeatherData();
-            if (cachedData) {
-                console.log('캐시된 헤더 날씨 데이터로 초기 로드 중...');
-                displayWeatherData(cachedData);
-                return;
-            }
-            
-            // 캐시에 데이터가 없거나 만료된 경우에만 API 호출
-            console.log('헤더 날씨 데이터 초기 로드 중...');
-            await fetchWeather();
-        }
-
-        // 날씨 정보 업데이트 함수 (1시간마다)
-        async function updateWeatherIfNeeded() {
-            // 먼저 캐시에서 데이터 확인
-            const cachedData = getCachedWeatherData();
-            if (cachedData) {
-                // 캐시가 유효하면 표시 함수 호출하지 않음 (이미 표시되어 있음)
-                console.log('캐시된 헤더 날씨 데이터가 유효합니다.');
-                return;
-            }
-            
-            // 캐시에 데이터가 없거나 만료된 경우에만 API 호출
-            console.log('헤더 날씨 정보 업데이트 중...');
-            await fetchWeather();
-        }
-
-        async function fetchWeather() {
-            const apiKey = '""" + os.getenv("OPENWEATHER_API_KEY", "") + """';
-            const lat = 37.2857;
-            const lon = 127.1109;
-            const url = `https://api.openweathermap.org/data/2.5/weather?lat=${lat}&lon=${lon}&appid=${apiKey}&units=metric`;
-            
-            try {
-                const res = await fetch(url);
-                const data = await res.json();
-                
-                if (!data.weather || !data.weather[0]) throw new Error('Invalid weather data');
-                
-                // 현재 시간을 기준으로 낮/밤 판단
-                const now = new Date();
-                const currentHour = now.getHours();
-                const isDay = currentHour >= 6 && currentHour < 18; // 6시~18시는 낮
-                
-                // isDay 정보를 데이터에 추가
-                data.isDay = isDay;
-                
-                // 데이터를 화면에 표시
-                displayWeatherData(data);
-                
-                // 성공적으로 데이터를 가져왔다면 캐시에 저장
-                saveWeatherDataToCache(data);
-                
-            } catch (e) {
-                console.error("Weather fetch error: ", e);
-                document.querySelector('.weather').textContent = '날씨 정보를 불러올 수 없습니다';
-            }
-        }
-
-        // 신갈중학교 이미지 슬라이드 기능
-        function getSchoolImages() {
-            return [
-                'images/신갈중학교0.jpg',
-                'images/신갈중학교1.jpg',
-                'images/신갈중학교2.jpg'
-            ];
-        }
-
-        let currentImageIndex = 0;
-        let schoolImages = [];
-
-        function updateSchoolImage() {
-            const imgElement = document.querySelector('.school-img');
-            if (!imgElement) return;
-
-            // 신갈중학교 이미지 목록 가져오기
-            schoolImages = getSchoolImages();
-            
-            // 페이드 아웃 효과
-            imgElement.classList.add('fade-out');
-            
-            setTimeout(() => {
-                // 이미지 변경
-                imgElement.src = schoolImages[currentImageIndex];
-                
-                // 다음 이미지 인덱스로 이동
-                currentImageIndex = (currentImageIndex + 1) % schoolImages.length;
-                
-                // 페이드 인 효과
-                imgElement.classList.remove('fade-out');
-            }, 500);
-        }
-
-        // 초기 로드 및 주기적 업데이트 설정
-        setInterval(updateDateTime, 1000);
-        updateDateTime();
-        loadInitialWeather();
-        
-        // 페이지 로드 시 신갈중학교 초기 이미지 설정
-        window.addEventListener('load', function() {
-            const schoolImages = getSchoolImages();
-            const imgElement = document.querySelector('.school-img');
-            if (imgElement && schoolImages.length > 0) {
-                imgElement.src = schoolImages[0];
-            }
-        });
-        
-        // 5분마다 날씨 업데이트 체크
-        setInterval(updateWeatherIfNeeded, 5 * 60 * 1000);
-        
-        // 10초마다 학교 이미지 슬라이드
-        setInterval(updateSchoolImage, 10 * 1000);
-        
-        // 페이지가 포커스를 받았을 때 업데이트 체크
-        window.addEventListener('focus', function() {
-            updateWeatherIfNeeded();
-        });
-        
-        // 페이지가 보이게 될 때 업데이트 체크 (탭 전환 시)
-        document.addEventListener('visibilitychange', function() {
-            if (!document.hidden) {
-                updateWeatherIfNeeded();
-            }
-        });
+    공지사항/가정통신문 목록 페이지를 templates/board.html로 렌더링합니다.
     """
-
-    html_content = f"""
-    <!DOCTYPE html>
-    <html lang="ko">
-    <head>
-        <meta charset="UTF-8">
-        <title>{school_name} {title}</title>
-        <style>{css_style}</style>
-        <link href="https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@400;700;900&display=swap" rel="stylesheet">
-    </head>
-    <body>
-        <header class="page-header">
-            <div class="header-left">
-                <div class="header-main-title">{title}</div>
-            </div>
-            <div class="header-right">
-                <div class="weather">날씨 정보를 불러오는 중...</div>
-                <div class="date-time" id="date-time"></div>
-                <div class="school-name">{school_name}</div>
-            </div>
-        </header>
-        <div class="main-content">
-            <div class="content-box">
-                <table class="content-list">
-                    { "".join(f"<tr><td>{item['title']}</td><td>{item['date']}</td></tr>" for item in items) }
-                </table>
-            </div>
-            <img class="school-img" src="images/신갈중학교0.jpg" alt="학교 전경">
-        </div>
-        <script>{js_code}</script>
-    </body>
-    </html>
-    """
-    return html_content
+    return page_templates.render(
+        "board.html",
+        page_title=title,
+        items=items,
+        school_name=school_name,
+        item_type=item_type,
+        weather_key=os.getenv("OPENWEATHER_API_KEY", "")
+    )
 
 def generate_notice_html(notices, school_name):
     return generate_html_base("공지사항", notices, school_name, "notice")
@@ -639,45 +42,160 @@ def generate_notice_html(notices, school_name):
 def generate_letter_html(letters, school_name):
     return generate_html_base("가정통신문", letters, school_name, "letter")
 
-def main():
-    # 학교 정보
-    school_info = {
-        "name": "신갈중학교",
-        "notice_url": "https://shingal-m.goeyi.kr/shingal-m/na/ntt/selectNttList.do?mi=14328&bbsId=8186",
-        "letter_url": "https://shingal-m.goeyi.kr/shingal-m/na/ntt/selectNttList.do?mi=14350&bbsId=8198"
-    }
-    
-    # 공지사항 크롤링
+# 학교 정보 (schools.json의 기본 학교)
+SCHOOL = school_config.get_school()
+SCHOOL_INFO = {
+    "id": SCHOOL.id,
+    "name": SCHOOL.name,
+    "notice_url": school_config.board_url(SCHOOL, "notices"),
+    "letter_url": school_config.board_url(SCHOOL, "letters")
+}
+
+# 디지털 사이니지 한 화면에 표시하는 항목 수
+DISPLAY_LIMIT = 7
+
+def store_board_result(school_info, url_key, kind, name, result, history_items=None, started_at=None):
+    """
+    크롤링 결과를 게시물 저장소에 기록하고 이전 실행과의 변경분을 result["delta"]에 붙입니다.
+    저장에 실패해도 페이지 생성은 계속합니다 (이 경우 변경분은 None).
+    """
+    result["delta"] = None
+    try:
+        changes = post_store.save_board_result(
+            school_info[url_key], kind, result,
+            name=name,
+            school_id=school_info.get("id", ""),
+            school_name=school_info["name"],
+            history_items=history_items,
+            started_at=started_at
+        )
+    except sqlite3.Error as e:
+        print(f"{name} 저장소 기록 실패: {e}")
+        return None
+    result["delta"] = board_delta.record_delta(school_info[url_key], kind, result, changes,
+                                               name=name, school_id=school_info.get("id", ""))
+    print(board_delta.format_delta(result["delta"]))
+    return result["delta"]
+
+def load_stored_board(school_info, url_key, kind, name):
+    """
+    학교 서버에 요청하지 않고 저장소에서 화면에 표시할 게시물을 읽어옵니다.
+    """
+    result = post_store.load_board_result(school_info[url_key], limit=DISPLAY_LIMIT)
+    if result is None:
+        result = {kind: [], "meta": {"total_count": 0, "url": school_info[url_key],
+                                     "error": f"저장소에 {name} 게시물이 없습니다."}}
+    print(f"저장소에서 {name} {len(result[kind])}개를 읽었습니다.")
+    return result
+
+def fetch_notices(school_info, history=False):
+    """
+    공지사항을 크롤링하고 화면에 표시할 개수만 남깁니다.
+    history가 True이면 여러 페이지를 넘기며 새 게시물을 이력에 추가한 뒤 첫 페이지로 화면을 구성합니다.
+    """
     print(f"{school_info['name']} 공지사항 크롤링 시작...")
-    notices_result = crawl_school_notices(
-        school_info["notice_url"],
-        school_info["name"]
-    )
+    started_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    history_items = None
+    if history:
+        history_result = crawl_board_history(
+            school_info["notice_url"],
+            crawl_school_notices,
+            "notices",
+            school_info["name"]
+        )
+        history_meta = history_result["meta"]
+        print(f"공지사항 이력: 새 게시물 {history_meta['new_count']}개, 전체 {history_meta['total_count']}개 ({history_meta['pages_crawled']}페이지)")
+        notices_result = history_result["first_page"]
+        history_items = history_result["notices"]
+    else:
+        notices_result = crawl_school_notices(
+            school_info["notice_url"],
+            school_info["name"],
+            limit=DISPLAY_LIMIT
+        )
+    store_board_result(school_info, "notice_url", "notices", "공지사항", notices_result, history_items, started_at)
     if 'notices' in notices_result and notices_result['notices']:
-        notices_result['notices'] = notices_result['notices'][:7]
+        notices_result['notices'] = notices_result['notices'][:DISPLAY_LIMIT]
     print(f"공지사항 크롤링 완료: {len(notices_result.get('notices', []))}개")
-    
-    # 가정통신문 크롤링
+    return notices_result
+
+def fetch_letters(school_info, history=False):
+    """
+    가정통신문을 크롤링하고 화면에 표시할 개수만 남깁니다.
+    history가 True이면 여러 페이지를 넘기며 새 게시물을 이력에 추가한 뒤 첫 페이지로 화면을 구성합니다.
+    """
     print(f"{school_info['name']} 가정통신문 크롤링 시작...")
-    letters_result = crawl_school_letters(
-        school_info["letter_url"],
-        school_info["name"]
-    )
+    started_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    history_items = None
+    if history:
+        history_result = crawl_board_history(
+            school_info["letter_url"],
+            crawl_school_letters,
+            "letters",
+            school_info["name"]
+        )
+        history_meta = history_result["meta"]
+        print(f"가정통신문 이력: 새 게시물 {history_meta['new_count']}개, 전체 {history_meta['total_count']}개 ({history_meta['pages_crawled']}페이지)")
+        letters_result = history_result["first_page"]
+        history_items = history_result["letters"]
+    else:
+        letters_result = crawl_school_letters(
+            school_info["letter_url"],
+            school_info["name"],
+            limit=DISPLAY_LIMIT
+        )
+    store_board_result(school_info, "letter_url", "letters", "가정통신문", letters_result, history_items, started_at)
     if 'letters' in letters_result and letters_result['letters']:
-        letters_result['letters'] = letters_result['letters'][:7]
+        letters_result['letters'] = letters_result['letters'][:DISPLAY_LIMIT]
     print(f"가정통신문 크롤링 완료: {len(letters_result.get('letters', []))}개")
-    
-    # HTML 파일 생성
-    notice_html = generate_notice_html(notices_result.get('notices', []), school_info['name'])
-    letter_html = generate_letter_html(letters_result.get('letters', []), school_info['name'])
-    
-    # HTML 파일 저장
+    return letters_result
+
+def _page_items(posts):
+    """
+    페이지 입력 해시에 넣을 게시물 필드입니다. 조회수는 화면에 표시하지 않고 매번 바뀌므로 제외해
+    게시판 변경분(새/수정/삭제 게시물)이 없는 실행에서는 다시 렌더링하지 않습니다.
+    """
+    return [{key: value for key, value in post.items() if key != 'views'} for post in posts]
+
+def board_page_nodes(notices_result, letters_result, school_name):
+    """
+    공지사항/가정통신문 페이지의 빌드 노드를 만듭니다 (site_build 참고).
+    요청이 실패해 게시물이 하나도 없으면 빈 목록으로 덮어쓰지 않도록 그 페이지의 노드는 만들지 않습니다.
+    """
     parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    with open(os.path.join(parent_dir, "digital_signage.html"), "w", encoding="utf-8") as f:
-        f.write(notice_html)
-    with open(os.path.join(parent_dir, "family_letters.html"), "w", encoding="utf-8") as f:
-        f.write(letter_html)
-    print("HTML 파일들이 생성되었습니다.")
+    nodes = []
+    pages = [
+        (notices_result, "notices", "공지사항", "digital_signage.html", generate_notice_html),
+        (letters_result, "letters", "가정통신문", "family_letters.html", generate_letter_html),
+    ]
+    for result, kind, name, file_name, generate in pages:
+        posts = result.get(kind, [])
+        if not posts and result.get('meta', {}).get('error'):
+            print(f"{name}을 가져오지 못해 기존 페이지를 유지합니다: {result['meta']['error']}")
+            continue
+        nodes += site_build.page_nodes(
+            os.path.join(parent_dir, file_name),
+            "board.html",
+            {"items": _page_items(posts), "school_name": school_name},
+            lambda posts=posts, generate=generate: generate(posts, school_name),
+            [__file__]
+        )
+    return nodes
+
+def write_board_pages(notices_result, letters_result, school_name):
+    """
+    공지사항/가정통신문 HTML 파일을 생성합니다.
+    입력 데이터가 이전 실행과 같으면 렌더링과 파일 쓰기를 건너뜁니다.
+    """
+    result = site_build.build(board_page_nodes(notices_result, letters_result, school_name))
+    print(site_build.format_result(result))
+
+def main():
+    notices_result = fetch_notices(SCHOOL_INFO)
+    letters_result = fetch_letters(SCHOOL_INFO)
+    write_board_pages(notices_result, letters_result, SCHOOL_INFO['name'])
+    for line in http_client.format_stats():
+        print(line)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
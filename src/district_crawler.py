@@ -0,0 +1,259 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+교육지원청 단위 통합 크롤러
+schools.json에 등록된 여러 학교의 게시판, 급식, 학사일정을 asyncio로 동시에 수집합니다.
+학교 홈페이지는 호스트별 토큰 버킷(http_client.set_host_rate)으로 요청 속도를 제한하고,
+결과는 학교마다 data/schools/<학교 ID>.json에 따로 저장하므로 한 학교가 실패해도 다른 학교에는 영향이 없습니다.
+
+사용법:
+    python district_crawler.py                        # schools.json의 모든 학교
+    python district_crawler.py --schools shingal-m    # 일부 학교만
+    python district_crawler.py --concurrency 64 --rate 2 --burst 4
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import board_delta
+import crawler
+import http_client
+import meal_crawler
+import post_store
+import school_config
+import school_schedule_crawler
+import search_index
+from board_crawler import crawl_board
+from board_history import crawl_board_history
+from family_letter_crawler import LETTER_BOARD
+from notice_crawler import NOTICE_BOARD
+
+# 학교별 결과 저장 경로
+RESULT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'schools')
+
+# 게시판 종류별 기본 설정 (mi, bbsId는 학교마다 schools.json 값으로 바꿉니다)
+BOARD_SPECS = {
+    "notices": NOTICE_BOARD,
+    "letters": LETTER_BOARD,
+}
+
+# 동시에 진행하는 작업 수 (요청을 보내는 스레드 수이기도 합니다)
+DEFAULT_CONCURRENCY = 32
+# 학교 홈페이지 호스트별 초당 요청 수와 버스트
+DEFAULT_RATE = 2.0
+DEFAULT_BURST = 4
+# 실행 전체의 재시도 예산 (학교 수가 많으므로 단일 학교 실행보다 크게 잡습니다)
+DEFAULT_RETRY_BUDGET = 200
+
+
+def _result_path(school):
+    return os.path.join(RESULT_DIR, f"{school.id}.json")
+
+
+def load_school_result(school):
+    """
+    학교의 이전 수집 결과를 읽어옵니다. 없으면 빈 dict를 반환합니다.
+    """
+    try:
+        with open(_result_path(school), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_school_result(school, result):
+    """
+    학교의 수집 결과를 data/schools/<학교 ID>.json에 저장합니다 (main_crawler도 같은 파일을 씁니다).
+    """
+    os.makedirs(RESULT_DIR, exist_ok=True)
+    path = _result_path(school)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _crawl_board(school, board, history):
+    spec = BOARD_SPECS[board]._replace(**school.boards[board])
+    url = school_config.board_url(school, board)
+    started_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    history_items = None
+    if history:
+        history_result = crawl_board_history(
+            url,
+            lambda page_url, site_name: crawl_board(page_url, spec, site_name),
+            spec.result_key,
+            school.name
+        )
+        result = history_result["first_page"]
+        history_items = history_result[spec.result_key]
+    else:
+        result = crawl_board(url, spec, school.name, limit=crawler.DISPLAY_LIMIT)
+    changes = post_store.save_board_result(url, spec.result_key, result, name=spec.name, school_id=school.id,
+                                           school_name=school.name, history_items=history_items,
+                                           started_at=started_at)
+    delta = board_delta.record_delta(url, spec.result_key, result, changes, name=spec.name, school_id=school.id)
+    if result["meta"].get("error"):
+        raise RuntimeError(result["meta"]["error"])
+    result[spec.result_key] = result[spec.result_key][:crawler.DISPLAY_LIMIT]
+    result["delta"] = {key: len(delta[key]) for key in ("new", "edited", "removed")}
+    return result
+
+
+def _crawl_meals(school, start_date, end_date):
+    meals = meal_crawler.get_meal_info(meal_crawler.API_KEY, school.neis_code, start_date, end_date,
+                                       school.atpt_code)
+    if not meals:
+        raise RuntimeError("급식 정보를 가져오지 못했습니다.")
+    return meals
+
+
+def _crawl_schedules(school, year, month):
+    if school.id == school_schedule_crawler.SCHOOL.id:
+        # 기본 학교는 직접 관리하는 school_schedule.json을 먼저 확인합니다
+        schedules = school_schedule_crawler.get_schedule_info(
+            school_schedule_crawler.API_KEY, school.atpt_code, school.neis_code, year, month)
+    else:
+        schedules = school_schedule_crawler.get_schedule_from_api(
+            school_schedule_crawler.API_KEY, school.atpt_code, school.neis_code, year, month)
+    if schedules is None:
+        raise RuntimeError("학사일정을 가져오지 못했습니다.")
+    return schedules
+
+
+async def crawl_school(school, semaphore, today, history=False):
+    """
+    학교 하나의 모든 소스를 동시에 수집하고 결과 파일을 저장합니다.
+    실패한 소스는 오류를 기록하고 이전 실행의 결과를 그대로 유지합니다.
+
+    Returns:
+        dict: {"school", "ok", "errors", "elapsed"}
+    """
+    meal_start, meal_end, _ = meal_crawler.get_target_week(today)
+    jobs = {board: (_crawl_board, school, board, history) for board in BOARD_SPECS if board in school.boards}
+    if school.neis_code:
+        jobs["meals"] = (_crawl_meals, school, meal_start, meal_end)
+        jobs["schedules"] = (_crawl_schedules, school, today.year, today.month)
+
+    async def run(func, *args):
+        async with semaphore:
+            return await asyncio.to_thread(func, *args)
+
+    started = time.perf_counter()
+    outcomes = await asyncio.gather(*(run(*job) for job in jobs.values()), return_exceptions=True)
+
+    previous = load_school_result(school)
+    result = {
+        "school": {"id": school.id, "name": school.name},
+        "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "meal_period": [meal_start, meal_end],
+        "schedule_month": [today.year, today.month],
+        "errors": {}
+    }
+    for name, outcome in zip(jobs, outcomes):
+        if isinstance(outcome, BaseException):
+            result["errors"][name] = str(outcome)
+            if name in previous:
+                result[name] = previous[name]
+        else:
+            result[name] = outcome
+    save_school_result(school, result)
+
+    return {
+        "school": school,
+        "ok": len(jobs) - len(result["errors"]),
+        "errors": result["errors"],
+        "elapsed": time.perf_counter() - started
+    }
+
+
+async def crawl_district(schools, concurrency=DEFAULT_CONCURRENCY, today=None, history=False):
+    """
+    여러 학교를 동시에 수집합니다.
+
+    Args:
+        schools (list): school_config.School 목록
+        concurrency (int): 동시에 진행하는 요청 작업 수
+        today (datetime, optional): 기준 날짜, 없으면 현재 시각
+        history (bool): True이면 게시판 이력을 여러 페이지에 걸쳐 증분 수집
+
+    Returns:
+        list: 학교별 요약 (crawl_school의 반환값)
+    """
+    today = today or datetime.now()
+    loop = asyncio.get_running_loop()
+    # asyncio.to_thread가 사용하는 기본 스레드 풀을 동시 작업 수에 맞춥니다
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    loop.set_default_executor(executor)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    summaries = await asyncio.gather(
+        *(crawl_school(school, semaphore, today, history) for school in schools),
+        return_exceptions=True
+    )
+    executor.shutdown(wait=False)
+
+    results = []
+    for school, summary in zip(schools, summaries):
+        if isinstance(summary, BaseException):
+            summary = {"school": school, "ok": 0, "errors": {"school": str(summary)}, "elapsed": 0.0}
+        results.append(summary)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="여러 학교 게시판/급식/학사일정 통합 크롤러")
+    parser.add_argument("--config", help="학교 설정 파일 (기본값: schools.json)")
+    parser.add_argument("--schools", nargs="+", help="수집할 학교 ID (기본값: 설정 파일의 모든 학교)")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="동시 요청 작업 수")
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE, help="호스트별 초당 요청 수")
+    parser.add_argument("--burst", type=int, default=DEFAULT_BURST, help="호스트별 최대 연속 요청 수")
+    parser.add_argument("--retry-budget", type=int, default=DEFAULT_RETRY_BUDGET,
+                        help="실행 전체에서 허용하는 최대 재시도 횟수")
+    parser.add_argument("--history", action="store_true",
+                        help="게시판 목록을 여러 페이지 넘기며 새 게시물을 이력에 누적")
+    args = parser.parse_args()
+
+    if args.schools:
+        schools = [school_config.get_school(school_id, args.config) for school_id in args.schools]
+    else:
+        schools = school_config.load_schools(args.config)
+
+    http_client.set_host_rate(args.rate, args.burst)
+    http_client.reset_retry_budget(args.retry_budget)
+    print(f"{len(schools)}개 학교 수집 시작 (동시 작업 {args.concurrency}개, 호스트별 초당 {args.rate}회)")
+
+    started = time.perf_counter()
+    summaries = asyncio.run(crawl_district(schools, args.concurrency, history=args.history))
+    elapsed = time.perf_counter() - started
+
+    failed = 0
+    for summary in summaries:
+        if summary["errors"]:
+            failed += 1
+            print(f"[{summary['school'].id}] {summary['school'].name}: 일부 실패 {summary['errors']}")
+    print(f"완료: {len(summaries) - failed}/{len(summaries)}개 학교 전체 성공 ({elapsed:.2f}초)")
+
+    try:
+        print(f"검색 색인 {search_index.update_index()}개 갱신")
+    except sqlite3.Error as e:
+        print(f"검색 색인 갱신 실패: {e}")
+
+    stats = http_client.get_stats()
+    total_requests = sum(entry["requests"] for entry in stats.values())
+    total_bytes = sum(entry["bytes"] for entry in stats.values())
+    total_retries = sum(entry["retries"] for entry in stats.values())
+    short_circuited = sum(entry["short_circuited"] for entry in stats.values())
+    print(f"{len(stats)}개 호스트, {total_requests}회 요청 (재시도 {total_retries}회, 차단 {short_circuited}회), "
+          f"{total_bytes / 1024:.1f}KB 수신")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+보관 피드 생성 벤치마크
+항목 수별로 스트리밍 피드 작성기(rss_feed_generator.generate_archive_feed)와
+feedgen(전체 lxml 트리를 만든 뒤 파일로 쓰는 방식)의 생성 시간과 최대 메모리 증가량을 비교합니다.
+측정마다 새 프로세스를 띄우므로 이전 측정의 메모리가 섞이지 않습니다.
+feedgen은 더 이상 생성기의 의존성이 아니므로 설치되어 있지 않으면 feedgen 측정은 건너뜁니다 (pip install feedgen).
+
+사용법:
+    python feed_benchmark.py                       # 1,000 / 10,000 / 100,000개
+    python feed_benchmark.py --sizes 50000 --format atom
+"""
+
+import argparse
+import importlib.util
+import multiprocessing
+import os
+import resource
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import rss_feed_generator
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+SITE_URL = "https://shingal-m.goeyi.kr/shingal-m/na/ntt/selectNttList.do?mi=14328&bbsId=8186"
+
+
+def iter_sample_posts(count):
+    """
+    저장소에서 읽은 것과 같은 형태의 합성 게시물을 하나씩 만듭니다.
+    """
+    for i in range(count, 0, -1):
+        yield {
+            "number": str(i),
+            "title": f"{i}번째 가정통신문 제목입니다 (안내)",
+            "author": "교무실",
+            "date": f"20{10 + i % 15:02d}-{i % 12 + 1:02d}-{i % 28 + 1:02d}",
+            "views": str(i % 500),
+            "url": f"https://shingal-m.goeyi.kr/shingal-m/na/ntt/selectNttView.do?mi=14328&bbsId=8186&nttSn={100000 + i}",
+            "ntt_sn": str(100000 + i),
+            "has_attachment": bool(i % 2),
+            "board_url": SITE_URL,
+        }
+
+
+def write_stream(output_file, count, fmt):
+    rss_feed_generator.generate_archive_feed(output_file, fmt, title="벤치마크", feed_url=SITE_URL,
+                                            posts=iter_sample_posts(count))
+
+
+def write_feedgen(output_file, count, fmt):
+    """
+    기존 생성기와 같은 방식으로 feedgen에 모든 항목을 추가한 뒤 한 번에 씁니다.
+    """
+    from feedgen.feed import FeedGenerator
+
+    fg = FeedGenerator()
+    fg.id(SITE_URL)
+    fg.title("벤치마크")
+    fg.subtitle("벤치마크 자동 피드")
+    fg.link(href=SITE_URL, rel='alternate')
+    fg.language('ko')
+    updated = datetime.now(timezone.utc)
+    fg.updated(updated)
+    for post in iter_sample_posts(count):
+        fe = fg.add_entry()
+        fe.id(post['url'])
+        fe.title(post['title'])
+        fe.link(href=post['url'])
+        fe.content(f"<div><h3>{post['title']}</h3><p>작성자: {post['author']}</p></div>", type='html')
+        fe.summary(f"{post['title']} - {post['date']}")
+        published = rss_feed_generator.parse_date(post['date']) or updated
+        fe.published(published)
+        fe.updated(published)
+        fe.author({'name': post['author']})
+    if fmt == "atom":
+        fg.atom_file(output_file, pretty=True)
+    else:
+        fg.rss_file(output_file, pretty=True)
+
+
+WRITERS = {
+    "stream": write_stream,
+    "feedgen": write_feedgen,
+}
+
+# 작성기별로 따로 설치해야 하는 모듈
+WRITER_MODULES = {
+    "feedgen": "feedgen",
+}
+
+
+def _missing_module(writer):
+    """
+    작성기에 필요한 모듈이 설치되어 있지 않으면 그 이름을, 모두 있으면 None을 반환합니다.
+    """
+    module = WRITER_MODULES.get(writer)
+    return module if module and importlib.util.find_spec(module) is None else None
+
+
+def _measure(writer, count, fmt):
+    """
+    (자식 프로세스에서 실행) 생성 시간(초), 최대 메모리 증가량(KB), 파일 크기(바이트)를 반환합니다.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        output_file = os.path.join(directory, f"feed.{fmt}.xml")
+        before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        started = time.perf_counter()
+        WRITERS[writer](output_file, count, fmt)
+        elapsed = time.perf_counter() - started
+        after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return elapsed, after - before, os.path.getsize(output_file)
+
+
+def benchmark(sizes, fmt, writers=tuple(WRITERS)):
+    """
+    항목 수와 작성기별로 새 프로세스에서 한 번씩 측정합니다.
+
+    Returns:
+        dict: {(작성기, 항목 수): (초, KB, 바이트) 또는 오류 메시지}
+    """
+    context = multiprocessing.get_context("spawn")
+    results = {}
+    for count in sizes:
+        for writer in writers:
+            missing = _missing_module(writer)
+            if missing:
+                results[(writer, count)] = f"{missing} 모듈이 설치되어 있지 않습니다 (pip install {missing})"
+                continue
+            with context.Pool(1) as pool:
+                try:
+                    results[(writer, count)] = pool.apply(_measure, (writer, count, fmt))
+                except ImportError as e:
+                    results[(writer, count)] = str(e)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="보관 피드 생성 벤치마크 (스트리밍 작성기 vs feedgen)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="측정할 항목 수")
+    parser.add_argument("--format", choices=["rss", "atom"], default="rss", help="피드 형식 (feedgen이 지원하는 형식)")
+    parser.add_argument("--writers", nargs="+", choices=list(WRITERS), default=list(WRITERS))
+    args = parser.parse_args()
+
+    print(f"{args.format} 피드, 측정마다 새 프로세스 사용")
+    for (writer, count), result in benchmark(args.sizes, args.format, args.writers).items():
+        if isinstance(result, str):
+            print(f"  {writer:<8} {count:>7}개  건너뜀: {result}")
+        else:
+            elapsed, memory, size = result
+            print(f"  {writer:<8} {count:>7}개  {elapsed:7.2f}초  메모리 +{memory / 1024:7.1f}MB  "
+                  f"파일 {size / 1024 / 1024:6.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
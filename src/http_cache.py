@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+조건부 요청(Conditional GET) 캐시
+URL별로 ETag, Last-Modified, 본문 해시와 직전 파싱 결과를 디스크에 저장하여
+변경되지 않은 게시판 목록 페이지를 다시 파싱하지 않도록 하는 모듈입니다.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+
+# 캐시 파일 경로 설정 (URL 하나당 파일 하나)
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'http_cache')
+
+
+def _cache_path(url):
+    name = hashlib.sha1(url.encode('utf-8')).hexdigest()
+    return os.path.join(CACHE_DIR, f"{name}.json")
+
+
+def load(url):
+    """
+    URL에 대해 저장된 캐시 항목을 읽어옵니다.
+
+    Args:
+        url (str): 요청 URL
+
+    Returns:
+        dict: {"url", "etag", "last_modified", "digest", "result"} 또는 None
+    """
+    path = _cache_path(url)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logging.warning(f"캐시 파일을 읽을 수 없습니다 ({path}): {e}")
+        return None
+
+
+def conditional_headers(entry):
+    """
+    캐시 항목으로 If-None-Match / If-Modified-Since 헤더를 만듭니다.
+
+    Args:
+        entry (dict): load()가 반환한 캐시 항목 (None 가능)
+
+    Returns:
+        dict: 요청에 추가할 헤더
+    """
+    headers = {}
+    if not entry:
+        return headers
+    if entry.get('etag'):
+        headers['If-None-Match'] = entry['etag']
+    if entry.get('last_modified'):
+        headers['If-Modified-Since'] = entry['last_modified']
+    return headers
+
+
+def body_digest(content):
+    """
+    응답 본문 바이트의 SHA-256 해시를 계산합니다.
+    """
+    return hashlib.sha256(content).hexdigest()
+
+
+def reuse(entry, reason):
+    """
+    캐시된 파싱 결과를 재사용합니다. 갱신 시각만 현재 시각으로 바꾸고 not_modified 표시를 남깁니다.
+
+    Args:
+        entry (dict): 캐시 항목
+        reason (str): 재사용 사유 ("304" 또는 "digest")
+
+    Returns:
+        dict: 크롤러 결과와 같은 형태의 딕셔너리
+    """
+    result = copy.deepcopy(entry['result'])
+    meta = result.setdefault('meta', {})
+    meta['last_updated'] = datetime.now().strftime("%Y-%m-%d")
+    meta['not_modified'] = True
+    logging.info(f"변경 없음({reason}), 캐시된 결과 재사용: {entry.get('url')}")
+    return result
+
+
+def stale(entry, error):
+    """
+    요청이 실패했을 때 마지막으로 성공한 파싱 결과를 대신 반환합니다.
+    meta에 오류 내용과 stale 표시를 남겨 호출한 쪽이 실패 사실을 알 수 있게 합니다.
+
+    Args:
+        entry (dict): 캐시 항목
+        error (str): 오류 내용
+
+    Returns:
+        dict: 크롤러 결과와 같은 형태의 딕셔너리
+    """
+    result = copy.deepcopy(entry['result'])
+    meta = result.setdefault('meta', {})
+    meta['stale'] = True
+    meta['error'] = error
+    logging.warning(f"요청 실패, 마지막으로 성공한 결과 사용: {entry.get('url')} ({error})")
+    return result
+
+
+def store(url, response, digest, result):
+    """
+    응답의 검증자(validator)와 본문 해시, 파싱 결과를 저장합니다.
+
+    Args:
+        url (str): 요청 URL
+        response (requests.Response): 응답 객체
+        digest (str): 본문 해시
+        result (dict): 파싱 결과
+    """
+    entry = {
+        'url': url,
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+        'digest': digest,
+        'result': result,
+    }
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = _cache_path(url)
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logging.warning(f"캐시 파일을 저장할 수 없습니다 ({path}): {e}")
@@ -0,0 +1,371 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+공용 HTTP 클라이언트
+모든 크롤러가 함께 사용하는 호스트별 keep-alive 세션, 요청 속도 제한, 재시도/회로 차단기, 요청 통계를 관리하는 모듈입니다.
+
+일시적인 실패(연결 오류, 타임아웃, 429/5xx)는 지수 백오프와 지터를 두고 다시 시도하며,
+재시도 횟수는 실행 전체가 나눠 쓰는 예산으로 제한합니다. 한 호스트에서 연속으로 실패하면
+회로 차단기가 열려 한동안 그 호스트로 가는 요청을 보내지 않고 바로 CircuitOpenError를 냅니다.
+"""
+
+import logging
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# 모든 요청에 공통으로 사용하는 User-Agent
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+# (연결 타임아웃, 읽기 타임아웃) 초 단위
+DEFAULT_TIMEOUT = (5, 15)
+
+# 호스트별 커넥션 풀 크기 (동시 요청 수보다 크게 잡습니다)
+POOL_MAXSIZE = 16
+
+# 요청 하나당 최대 재시도 횟수와 재시도할 응답 코드
+RETRY_ATTEMPTS = 3
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# 백오프 대기 시간: 0 ~ min(BACKOFF_MAX, BACKOFF_BASE * 2^시도) 초 사이의 무작위 값 (full jitter)
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 8.0
+# 한 번의 실행에서 모든 요청이 나눠 쓰는 재시도 횟수
+RETRY_BUDGET = 30
+
+# 연속 실패가 이 횟수에 도달하면 회로 차단기를 열고, BREAKER_COOLDOWN초 뒤에 한 번 시험 요청을 보냅니다
+BREAKER_THRESHOLD = 5
+BREAKER_COOLDOWN = 60.0
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+_stats = {}
+_stats_lock = threading.Lock()
+
+_retry_budget = RETRY_BUDGET
+_retry_lock = threading.Lock()
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+# 호스트별 요청 속도 제한 (set_host_rate()로 켭니다)
+_host_rate = None
+_buckets = {}
+_buckets_lock = threading.Lock()
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """
+    호스트의 회로 차단기가 열려 있어 요청을 보내지 않았을 때 발생합니다.
+    """
+
+
+class TokenBucket:
+    """
+    여러 스레드가 공유하는 토큰 버킷 방식의 속도 제한기입니다.
+    초당 rate개의 토큰이 채워지고, 최대 burst개까지 모아 둘 수 있습니다.
+    """
+
+    def __init__(self, rate, burst=None):
+        self.rate = rate
+        self.capacity = burst or rate
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def consume(self, amount=1):
+        """
+        amount만큼의 토큰을 사용하고, 부족하면 채워질 때까지 기다립니다.
+        """
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= amount or self.tokens >= self.capacity:
+                    self.tokens -= amount
+                    return
+                wait = (min(amount, self.capacity) - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+def _host_of(url):
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def get_session(url):
+    """
+    URL의 호스트에 해당하는 keep-alive 세션을 반환합니다.
+    같은 호스트에 대한 요청은 하나의 커넥션 풀을 공유하므로 TCP/TLS 핸드셰이크가 한 번만 발생합니다.
+
+    Args:
+        url (str): 요청할 URL
+
+    Returns:
+        requests.Session: 호스트 전용 세션
+    """
+    host = _host_of(url)
+    session = _sessions.get(host)
+    if session is not None:
+        return session
+
+    with _sessions_lock:
+        session = _sessions.get(host)
+        if session is None:
+            session = requests.Session()
+            session.headers.update({"User-Agent": USER_AGENT})
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_MAXSIZE)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _sessions[host] = session
+    return session
+
+
+def set_host_rate(rate, burst=None):
+    """
+    호스트별 초당 요청 수 제한을 설정합니다. 같은 호스트로 가는 모든 요청(목록, 상세, 첨부파일)이
+    하나의 토큰 버킷을 공유합니다.
+
+    Args:
+        rate (float): 호스트별 초당 요청 수, None이면 제한하지 않습니다
+        burst (int, optional): 한 번에 몰아서 보낼 수 있는 최대 요청 수, 없으면 rate와 같음
+    """
+    global _host_rate
+    with _buckets_lock:
+        _host_rate = (rate, burst) if rate else None
+        _buckets.clear()
+
+
+def _throttle(host):
+    if _host_rate is None:
+        return
+    with _buckets_lock:
+        bucket = _buckets.get(host)
+        if bucket is None:
+            bucket = TokenBucket(*_host_rate)
+            _buckets[host] = bucket
+    bucket.consume()
+
+
+def reset_retry_budget(budget=RETRY_BUDGET):
+    """
+    실행 전체가 나눠 쓰는 재시도 예산을 다시 설정합니다.
+
+    Args:
+        budget (int): 남은 재시도 횟수
+    """
+    global _retry_budget
+    with _retry_lock:
+        _retry_budget = budget
+
+
+def _take_retry():
+    global _retry_budget
+    with _retry_lock:
+        if _retry_budget <= 0:
+            return False
+        _retry_budget -= 1
+        return True
+
+
+def _backoff(attempt, response=None):
+    delay = random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+    retry_after = response.headers.get('Retry-After', '') if response is not None else ''
+    if retry_after.isdigit():
+        delay = max(delay, min(float(retry_after), BACKOFF_MAX))
+    return delay
+
+
+def _breaker_allows(host):
+    with _breakers_lock:
+        state = _breakers.get(host)
+        if state is None or state["opened_at"] is None:
+            return True
+        if time.monotonic() - state["opened_at"] < BREAKER_COOLDOWN or state["probing"]:
+            return False
+        # 대기 시간이 지나면 시험 요청 하나만 통과시킵니다 (half-open)
+        state["probing"] = True
+        return True
+
+
+def _breaker_record(host, ok):
+    with _breakers_lock:
+        state = _breakers.setdefault(host, {"failures": 0, "opened_at": None, "probing": False})
+        if ok:
+            if state["opened_at"] is not None:
+                logging.info(f"{host} 회로 차단기 닫힘")
+            state.update(failures=0, opened_at=None, probing=False)
+            return
+        state["failures"] += 1
+        if state["probing"] or (state["opened_at"] is None and state["failures"] >= BREAKER_THRESHOLD):
+            logging.warning(f"{host} 회로 차단기 열림 (연속 실패 {state['failures']}회)")
+            state["opened_at"] = time.monotonic()
+        state["probing"] = False
+
+
+def _entry(host):
+    # _stats_lock을 잡은 상태에서 호출해야 합니다
+    return _stats.setdefault(host, {
+        "requests": 0,
+        "errors": 0,
+        "retries": 0,
+        "short_circuited": 0,
+        "bytes": 0,
+        "total_time": 0.0,
+        "max_time": 0.0,
+    })
+
+
+def _count(host, key):
+    with _stats_lock:
+        _entry(host)[key] += 1
+
+
+def _record(host, elapsed, received, failed=False):
+    with _stats_lock:
+        entry = _entry(host)
+        entry["requests"] += 1
+        entry["bytes"] += received
+        entry["total_time"] += elapsed
+        entry["max_time"] = max(entry["max_time"], elapsed)
+        if failed:
+            entry["errors"] += 1
+
+
+def get(url, params=None, headers=None, timeout=None, stream=False, retries=RETRY_ATTEMPTS):
+    """
+    공용 세션으로 GET 요청을 보내고 지연 시간과 수신 바이트를 기록합니다.
+    연결 오류, 타임아웃, RETRY_STATUSES 응답은 백오프 후 retries번까지 다시 시도합니다.
+
+    Args:
+        url (str): 요청할 URL
+        params (dict, optional): 쿼리 파라미터
+        headers (dict, optional): 추가 요청 헤더
+        timeout (tuple|float, optional): 타임아웃, 없으면 DEFAULT_TIMEOUT 사용
+        stream (bool): True이면 본문을 미리 읽지 않습니다 (본문은 iter_body()로 읽습니다)
+        retries (int): 최대 재시도 횟수 (재시도 예산이 남아 있는 경우에만)
+
+    Returns:
+        requests.Response: 응답 객체 (재시도 후에도 5xx/429이면 마지막 응답)
+
+    Raises:
+        CircuitOpenError: 호스트의 회로 차단기가 열려 있는 경우
+        requests.RequestException: 재시도 후에도 요청이 실패한 경우
+    """
+    host = _host_of(url)
+    session = get_session(url)
+    attempt = 0
+    while True:
+        if not _breaker_allows(host):
+            _count(host, "short_circuited")
+            raise CircuitOpenError(f"{host} 회로 차단기가 열려 있어 요청하지 않습니다: {url}")
+
+        _throttle(host)
+        started = time.perf_counter()
+        response = None
+        error = None
+        try:
+            response = session.get(
+                url,
+                params=params,
+                headers=headers,
+                timeout=timeout or DEFAULT_TIMEOUT,
+                stream=stream,
+            )
+            # 스트리밍 응답은 iter_body()로 실제로 읽은 만큼 나중에 더합니다
+            received = 0 if stream else len(response.content)
+        except requests.RequestException as e:
+            error = e
+        elapsed = time.perf_counter() - started
+
+        if error is None:
+            _record(host, elapsed, received, failed=response.status_code >= 400)
+            _breaker_record(host, ok=response.status_code < 500)
+            logging.debug(f"GET {response.url} {response.status_code} {received}B {elapsed * 1000:.0f}ms")
+            if response.status_code not in RETRY_STATUSES:
+                return response
+        else:
+            _record(host, elapsed, 0, failed=True)
+            _breaker_record(host, ok=False)
+
+        if attempt >= retries or not _take_retry():
+            if error is not None:
+                raise error
+            return response
+
+        delay = _backoff(attempt, response)
+        if response is not None:
+            response.close()
+        _count(host, "retries")
+        attempt += 1
+        logging.warning(f"GET {url} 실패 ({error or response.status_code}), {delay:.1f}초 후 재시도 ({attempt}/{retries})")
+        time.sleep(delay)
+
+
+def iter_body(response, chunk_size=8192):
+    """
+    스트리밍 응답 본문을 청크 단위로 읽으면서 실제로 받은 바이트 수를 통계에 더합니다.
+    호출한 쪽이 중간에 읽기를 멈추면 나머지 본문은 받지 않습니다.
+
+    Args:
+        response (requests.Response): stream=True로 받은 응답
+        chunk_size (int): 청크 크기
+
+    Yields:
+        bytes: 본문 청크
+    """
+    host = _host_of(response.url)
+    for chunk in response.iter_content(chunk_size):
+        if not chunk:
+            continue
+        with _stats_lock:
+            _entry(host)["bytes"] += len(chunk)
+        yield chunk
+
+
+def get_stats():
+    """
+    호스트별 요청 통계의 사본을 반환합니다.
+
+    Returns:
+        dict: {호스트: {"requests", "errors", "retries", "short_circuited", "bytes", "total_time", "max_time"}}
+    """
+    with _stats_lock:
+        return {host: dict(entry) for host, entry in _stats.items()}
+
+
+def format_stats():
+    """
+    요청 통계를 사람이 읽기 쉬운 문자열 목록으로 변환합니다.
+
+    Returns:
+        list: 호스트별 요약 문자열
+    """
+    lines = []
+    for host, entry in sorted(get_stats().items()):
+        average = entry["total_time"] / entry["requests"] if entry["requests"] else 0.0
+        line = (
+            f"{host}: {entry['requests']}회 요청 (오류 {entry['errors']}회), "
+            f"{entry['bytes'] / 1024:.1f}KB 수신, "
+            f"평균 {average * 1000:.0f}ms / 최대 {entry['max_time'] * 1000:.0f}ms"
+        )
+        if entry['retries'] or entry['short_circuited']:
+            line += f", 재시도 {entry['retries']}회, 차단 {entry['short_circuited']}회"
+        lines.append(line)
+    return lines
+
+
+def close_sessions():
+    """
+    열려 있는 모든 세션과 커넥션 풀을 닫습니다.
+    """
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
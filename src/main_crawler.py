@@ -0,0 +1,212 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+통합 크롤러
+공지사항, 가정통신문, 급식, 학사일정을 한 프로세스에서 동시에 수집한 뒤 모든 페이지를 생성합니다.
+수집 시간은 네 소스의 합이 아니라 가장 느린 소스 하나의 시간에 가깝게 됩니다.
+페이지 생성은 빌드 그래프(site_build) 하나로 하므로 입력이 바뀐 페이지만 다시 렌더링합니다.
+
+사용법:
+    python main_crawler.py --history      # 수집 후 페이지 생성
+    python main_crawler.py --build-only   # 수집하지 않고 마지막 데이터로 페이지만 생성 (변경 없으면 몇 ms)
+"""
+
+import argparse
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import attachment_downloader
+import board_delta
+import board_history
+import district_crawler
+import http_client
+import post_detail
+import search_index
+import site_build
+import crawler
+import meal_crawler
+import school_schedule_crawler
+
+def _timed(func, *args):
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+def fetch_all(today=None, history=False, from_store=False):
+    """
+    네 가지 데이터 소스를 스레드 풀에서 동시에 가져옵니다.
+
+    Args:
+        today (datetime, optional): 기준 날짜, 없으면 현재 시각
+        history (bool): True이면 게시판 이력을 여러 페이지에 걸쳐 증분 수집
+        from_store (bool): True이면 게시판은 학교 서버 대신 게시물 저장소에서 읽음
+
+    Returns:
+        dict: 소스 이름별 결과 (실패한 소스는 None)
+    """
+    today = today or datetime.now()
+    meal_start, meal_end, period_text = meal_crawler.get_target_week(today)
+    print(f"{period_text} 급식 정보 가져오기: {meal_start} ~ {meal_end}")
+
+    if from_store:
+        board_tasks = {
+            "notices": (crawler.load_stored_board, crawler.SCHOOL_INFO, "notice_url", "notices", "공지사항"),
+            "letters": (crawler.load_stored_board, crawler.SCHOOL_INFO, "letter_url", "letters", "가정통신문"),
+        }
+    else:
+        board_tasks = {
+            "notices": (crawler.fetch_notices, crawler.SCHOOL_INFO, history),
+            "letters": (crawler.fetch_letters, crawler.SCHOOL_INFO, history),
+        }
+    tasks = {
+        **board_tasks,
+        "meals": (meal_crawler.get_meal_info, meal_crawler.API_KEY, meal_crawler.SCHOOL_CODE,
+                  meal_start, meal_end),
+        "schedules": (school_schedule_crawler.get_schedule_info, school_schedule_crawler.API_KEY,
+                      school_schedule_crawler.ATPT_OFCDC_SC_CODE, school_schedule_crawler.SD_SCHUL_CODE,
+                      today.year, today.month),
+    }
+
+    results = {"meal_period": (meal_start, meal_end), "schedule_month": (today.year, today.month)}
+    with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+        futures = {name: executor.submit(_timed, *task) for name, task in tasks.items()}
+        for name, future in futures.items():
+            try:
+                result, elapsed = future.result()
+                print(f"[{name}] 수집 완료 ({elapsed:.2f}초)")
+                results[name] = result
+            except Exception as e:
+                print(f"[{name}] 수집 실패: {e}")
+                results[name] = None
+    return results
+
+def fetch_details(results, history=False):
+    """
+    게시물 본문/첨부파일/등록 시각을 가져옵니다. 이미 캐시된 게시물은 요청하지 않습니다.
+    게시판 변경분이 있으면 새로 생기거나 수정된 게시물(수정된 게시물은 다시 요청)과 화면에 표시할 게시물만 대상으로 하고,
+    변경분이 없으면(저장소에서 읽은 경우 등) history가 True일 때 이력의 모든 게시물을, 아니면 화면에 표시할 게시물을 대상으로 합니다.
+    """
+    displayed = ((results.get("notices") or {}).get("notices", [])
+                 + (results.get("letters") or {}).get("letters", []))
+    deltas = [(results.get(name) or {}).get("delta") for name in ("notices", "letters")]
+    refresh = []
+    if all(delta is not None for delta in deltas):
+        # 화면에 표시할 게시물은 대부분 캐시에 있으므로 실제 요청은 변경분에 비례합니다
+        items = [post for delta in deltas for post in board_delta.changed_posts(delta)] + displayed
+        refresh = [post["url"] for delta in deltas for post in delta["edited"]]
+    elif history:
+        items = (board_history.load_history(crawler.SCHOOL_INFO["notice_url"])["items"]
+                 + board_history.load_history(crawler.SCHOOL_INFO["letter_url"])["items"])
+    else:
+        items = displayed
+    details, elapsed = _timed(post_detail.fetch_post_details, items, post_detail.DEFAULT_WORKERS,
+                              post_detail.DEFAULT_PER_HOST, refresh)
+    print(f"[details] 상세 페이지 {len(details)}개 준비 ({elapsed:.2f}초)")
+    return details
+
+def save_results(results):
+    """
+    수집한 급식과 학사일정을 district_crawler와 같은 학교별 결과 파일(data/schools/<학교 ID>.json)에 저장합니다.
+    수집에 실패한 소스는 이전 결과와 그 기간을 그대로 둡니다. 게시판은 게시물 저장소에 있으므로 저장하지 않습니다.
+    """
+    previous = district_crawler.load_school_result(crawler.SCHOOL)
+    snapshot = {
+        **previous,
+        "school": {"id": crawler.SCHOOL.id, "name": crawler.SCHOOL.name},
+        "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "errors": dict(previous.get("errors") or {}),
+    }
+    # 페이지 생성과 같은 기준으로 성공 여부를 판단합니다 (급식은 빈 결과도 실패)
+    fetched = {"meals": bool(results.get("meals")), "schedules": results.get("schedules") is not None}
+    for name, period in (("meals", "meal_period"), ("schedules", "schedule_month")):
+        if fetched[name]:
+            snapshot[name] = results[name]
+            snapshot[period] = list(results[period])
+            snapshot["errors"].pop(name, None)
+        else:
+            snapshot["errors"][name] = "수집 실패"
+    district_crawler.save_school_result(crawler.SCHOOL, snapshot)
+
+def load_results():
+    """
+    다시 수집하지 않고 마지막으로 수집한 데이터를 읽어옵니다 (--build-only).
+    게시판은 게시물 저장소에서, 급식과 학사일정은 main_crawler나 district_crawler가 저장한 학교별 결과
+    (data/schools/<학교 ID>.json)에서 읽으며, 없는 소스의 페이지는 기존 파일을 유지합니다.
+    """
+    snapshot = district_crawler.load_school_result(crawler.SCHOOL)
+    return {
+        "notices": crawler.load_stored_board(crawler.SCHOOL_INFO, "notice_url", "notices", "공지사항"),
+        "letters": crawler.load_stored_board(crawler.SCHOOL_INFO, "letter_url", "letters", "가정통신문"),
+        "meals": snapshot.get("meals"),
+        "schedules": snapshot.get("schedules"),
+        "meal_period": tuple(snapshot.get("meal_period") or ("", "")),
+        "schedule_month": tuple(snapshot.get("schedule_month") or (0, 0)),
+    }
+
+def render_all(results):
+    """
+    수집 결과로 모든 페이지를 생성합니다. 수집에 실패한 소스의 페이지는 기존 파일을 유지합니다.
+    모든 페이지를 빌드 그래프 하나로 모아 입력이 바뀐 페이지만 동시에 렌더링합니다 (site_build 참고).
+    """
+    nodes = []
+    if results["notices"] is not None and results["letters"] is not None:
+        nodes += crawler.board_page_nodes(results["notices"], results["letters"], crawler.SCHOOL_INFO["name"])
+
+    if results["meals"]:
+        meal_start, meal_end = results["meal_period"]
+        nodes += meal_crawler.meal_page_nodes(results["meals"], meal_crawler.SCHOOL_NAME, meal_start, meal_end)
+    else:
+        print("급식 정보를 가져오는데 실패했습니다.")
+
+    if results["schedules"] is not None:
+        year, month = results["schedule_month"]
+        nodes += school_schedule_crawler.schedule_page_nodes(results["schedules"],
+                                                             school_schedule_crawler.SCHOOL_NAME, year, month)
+
+    print(site_build.format_result(site_build.build(nodes)))
+
+def main():
+    parser = argparse.ArgumentParser(description="공지사항/가정통신문/급식/학사일정 통합 크롤러")
+    parser.add_argument("--history", action="store_true",
+                        help="게시판 목록을 여러 페이지 넘기며 새 게시물을 이력에 누적")
+    parser.add_argument("--details", action="store_true",
+                        help="게시물 상세 페이지(본문, 첨부파일, 등록 시각)까지 수집")
+    parser.add_argument("--attachments", action="store_true",
+                        help="상세 페이지의 첨부파일까지 내려받기 (--details 포함)")
+    parser.add_argument("--from-store", action="store_true",
+                        help="게시판을 다시 크롤링하지 않고 게시물 저장소(data/posts.db)에서 읽어 페이지 생성")
+    parser.add_argument("--build-only", action="store_true",
+                        help="아무것도 수집하지 않고 저장소와 마지막으로 저장한 급식/학사일정으로 페이지만 생성")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    if args.build_only:
+        render_all(load_results())
+        return
+    results = fetch_all(history=args.history, from_store=args.from_store)
+    # --build-only가 다음에 같은 급식/학사일정으로 페이지를 만들 수 있도록 저장합니다
+    save_results(results)
+    details = None
+    if args.details or args.attachments:
+        details = fetch_details(results, history=args.history)
+        if args.attachments:
+            downloaded, elapsed = _timed(attachment_downloader.download_attachments, details.values())
+            print(f"[attachments] 첨부파일 {len(downloaded)}개 준비 ({elapsed:.2f}초)")
+    try:
+        indexed, elapsed = _timed(search_index.update_index, details)
+        print(f"[search] 검색 색인 {indexed}개 갱신 ({elapsed:.2f}초)")
+    except sqlite3.Error as e:
+        print(f"[search] 검색 색인 갱신 실패: {e}")
+    fetched = time.perf_counter()
+    render_all(results)
+    finished = time.perf_counter()
+
+    print(f"수집 {fetched - started:.2f}초, 페이지 생성 {finished - fetched:.2f}초, 전체 {finished - started:.2f}초")
+    for line in http_client.format_stats():
+        print(line)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+급식 식단 파서
+NEIS 급식식단정보(mealServiceDietInfo) 응답 행을 구조화된 모델(MealDay, Dish)로 바꾸는 모듈입니다.
+요리 이름 뒤의 알레르기 유발 식품 번호는 NEIS 형식 "(1.2.5.6)"과 이전 형식 "(1)(5)"를 모두
+요리마다 정규식 한 번으로 읽고, 칼로리(CAL_INFO), 영양 정보(NTR_INFO), 원산지(ORPLC_INFO)도 함께 읽습니다.
+급식을 쓰는 곳(페이지 렌더링 등)은 DDISH_NM 문자열을 직접 나누지 않고 parse_meals()의 결과를 씁니다.
+"""
+
+import re
+from collections import namedtuple
+
+# 알레르기 유발 식품 번호 (식품의약품안전처 고시 순서)
+ALLERGENS = {
+    1: '난류', 2: '우유', 3: '메밀', 4: '땅콩', 5: '대두', 6: '밀', 7: '고등어', 8: '게', 9: '새우',
+    10: '돼지고기', 11: '복숭아', 12: '토마토', 13: '아황산류', 14: '호두', 15: '닭고기', 16: '쇠고기',
+    17: '오징어', 18: '조개류(굴, 전복, 홍합 포함)', 19: '잣'
+}
+
+# NEIS 응답에서 항목을 구분하는 줄바꿈
+LINE_BREAK = '<br/>'
+
+# 요리 하나 (allergens: 알레르기 유발 식품 번호 frozenset)
+Dish = namedtuple('Dish', ['name', 'allergens'])
+
+# 영양 정보 하나 (예: 탄수화물, g, 105.4)
+Nutrient = namedtuple('Nutrient', ['name', 'unit', 'amount'])
+
+# 원산지 하나 (예: 고춧가루(김치류), 국내산)
+Origin = namedtuple('Origin', ['ingredient', 'origin'])
+
+# 하루 급식
+#   date       - 급식 날짜 (YYYYMMDD)
+#   meal_name  - 식사명 (조식, 중식, 석식)
+#   dishes     - Dish 목록
+#   allergens  - 그날 모든 요리의 알레르기 유발 식품 번호 합집합 (frozenset)
+#   calories   - 열량 (kcal, 없으면 None)
+#   nutrients  - Nutrient 목록
+#   origins    - Origin 목록
+MealDay = namedtuple('MealDay', ['date', 'meal_name', 'dishes', 'allergens', 'calories', 'nutrients', 'origins'])
+
+# 요리 이름과 끝에 붙은 알레르기 번호 묶음 "(1.2.5.6)" 또는 "(1)(5)"
+_DISH = re.compile(r'\s*(?P<name>.*?)\s*(?P<codes>(?:\(\d+(?:\.\d*)*\)\s*)*)$')
+# 번호 묶음을 공백으로 나눌 수 있도록 괄호와 점을 공백으로 바꿉니다
+_CODE_SEPARATORS = str.maketrans('().', '   ')
+# "탄수화물(g) : 105.4"
+_NUTRIENT = re.compile(r'\s*(?P<name>[^(:]+?)\s*(?:\((?P<unit>[^)]*)\))?\s*:\s*(?P<amount>\d+(?:\.\d+)?)')
+_NUMBER = re.compile(r'\d+(?:\.\d+)?')
+
+
+def parse_dish(text):
+    """
+    요리 하나를 읽습니다.
+
+    Args:
+        text (str): DDISH_NM의 한 항목 (예: "두부고추장찌개 (5.6.9.10.16)")
+
+    Returns:
+        Dish: 요리 (이름에서 알레르기 번호는 뺌)
+    """
+    match = _DISH.match(text)
+    codes = match.group('codes').translate(_CODE_SEPARATORS).split()
+    return Dish(match.group('name'), frozenset(int(code) for code in codes))
+
+
+def _lines(text):
+    return [line for line in (text or '').split(LINE_BREAK) if line.strip()]
+
+
+def parse_calories(text):
+    """
+    CAL_INFO(예: "741.3 Kcal")에서 열량을 읽습니다. 없으면 None을 반환합니다.
+    """
+    match = _NUMBER.search(text or '')
+    return float(match.group()) if match else None
+
+
+def parse_nutrients(text):
+    """
+    NTR_INFO(예: "탄수화물(g) : 105.4<br/>단백질(g) : 30.2")에서 영양 정보를 읽습니다.
+    형식이 맞지 않는 항목은 건너뜁니다.
+    """
+    nutrients = []
+    for line in _lines(text):
+        match = _NUTRIENT.match(line)
+        if match:
+            nutrients.append(Nutrient(match.group('name'), match.group('unit') or '', float(match.group('amount'))))
+    return nutrients
+
+
+def parse_origins(text):
+    """
+    ORPLC_INFO(예: "쌀 : 국내산<br/>고춧가루(김치류) : 국내산")에서 원산지를 읽습니다.
+    """
+    origins = []
+    for line in _lines(text):
+        ingredient, separator, origin = line.rpartition(':')
+        if separator:
+            origins.append(Origin(ingredient.strip(), origin.strip()))
+    return origins
+
+
+def parse_meal(row):
+    """
+    NEIS 급식 응답 행 하나를 읽습니다.
+
+    Args:
+        row (dict): mealServiceDietInfo의 row 항목
+
+    Returns:
+        MealDay: 하루 급식
+    """
+    dishes = [parse_dish(line) for line in _lines(row.get('DDISH_NM'))]
+    return MealDay(
+        date=row.get('MLSV_YMD', ''),
+        meal_name=row.get('MMEAL_SC_NM', ''),
+        dishes=dishes,
+        allergens=frozenset().union(*(dish.allergens for dish in dishes)),
+        calories=parse_calories(row.get('CAL_INFO')),
+        nutrients=parse_nutrients(row.get('NTR_INFO')),
+        origins=parse_origins(row.get('ORPLC_INFO'))
+    )
+
+
+def parse_meals(rows):
+    """
+    NEIS 급식 응답 행 목록을 날짜별 급식으로 바꿉니다. 같은 날짜의 행이 여러 개이면 마지막 행을 씁니다.
+
+    Returns:
+        dict: {YYYYMMDD: MealDay}
+    """
+    return {meal.date: meal for meal in map(parse_meal, rows)}
@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+페이지/묶음 파일 압축
+렌더링한 HTML과 공용 CSS/JS 묶음에서 주석, 들여쓰기, 빈 줄을 지우고(minify),
+같은 디렉터리에 미리 압축한 .gz(gzip)와 .br(brotli) 파일을 함께 쓰는 모듈입니다.
+웹 서버는 Accept-Encoding에 맞춰 압축 파일을 그대로 보내면 되므로 요청마다 압축하지 않습니다.
+
+줄바꿈은 남겨 두므로 자바스크립트의 세미콜론 자동 삽입이나 인라인 요소 사이의 공백은 바뀌지 않습니다.
+자바스크립트 정규식 리터럴은 해석하지 않으므로 템플릿 스크립트에는 RegExp()를 사용해야 합니다.
+brotli는 설치된 경우에만 .br 파일을 씁니다 (pip install brotli).
+
+생성되는 페이지(build_manifest.write_page)와 묶음(page_templates)은 쓸 때 바로 압축하고 크기를 출력합니다.
+손으로 쓴 페이지(index.html, weather_widget.html 등)는 원본을 바꾸지 않고 아래 명령으로 .gz/.br만 만듭니다.
+
+사용법:
+    python page_minify.py                  # 모든 페이지와 assets/의 .gz/.br을 다시 만들고 크기 보고
+    python page_minify.py ../index.html    # 지정한 파일만
+"""
+
+import argparse
+import glob
+import gzip
+import os
+import re
+from collections import namedtuple
+
+PAGES_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+COMPRESSED_SUFFIXES = ('.gz', '.br')
+
+SizeReport = namedtuple('SizeReport', ['path', 'original', 'minified', 'gzip', 'brotli'])
+
+_HTML_COMMENT = re.compile(r'<!--(?!\[if).*?-->', re.S)
+_CSS_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+_CSS_SPACE = re.compile(r'\s*([{};,>])\s*')
+
+
+def _strip_lines(text):
+    return '\n'.join(line.strip() for line in text.splitlines() if line.strip())
+
+
+def minify_html(text):
+    """
+    HTML 주석, 들여쓰기, 빈 줄을 지웁니다. 태그 사이 줄바꿈은 공백 하나로 남겨 화면 배치가 바뀌지 않습니다.
+    """
+    return _strip_lines(_HTML_COMMENT.sub('', text)) + '\n'
+
+
+def minify_css(text):
+    """
+    CSS 주석과 불필요한 공백을 지웁니다.
+    """
+    text = _CSS_COMMENT.sub('', text)
+    text = ' '.join(text.split())
+    text = _CSS_SPACE.sub(r'\1', text)
+    return text.replace(';}', '}').replace(': ', ':') + '\n'
+
+
+def minify_js(text):
+    """
+    문자열(', ", `) 밖의 // 와 /* */ 주석을 지우고 들여쓰기와 빈 줄을 지웁니다.
+    """
+    out = []
+    i = 0
+    quote = None
+    length = len(text)
+    while i < length:
+        char = text[i]
+        if quote:
+            out.append(char)
+            if char == '\\' and i + 1 < length:
+                out.append(text[i + 1])
+                i += 1
+            elif char == quote:
+                quote = None
+        elif char in '\'"`':
+            quote = char
+            out.append(char)
+        elif text.startswith('//', i):
+            end = text.find('\n', i)
+            i = length if end < 0 else end
+            continue
+        elif text.startswith('/*', i):
+            end = text.find('*/', i + 2)
+            i = length if end < 0 else end + 2
+            continue
+        else:
+            out.append(char)
+        i += 1
+    return _strip_lines(''.join(out)) + '\n'
+
+
+MINIFIERS = {
+    '.html': minify_html,
+    '.css': minify_css,
+    '.js': minify_js,
+}
+
+
+def minify(path, text):
+    """
+    파일 확장자에 맞는 방식으로 압축합니다. 모르는 형식은 그대로 반환합니다.
+    """
+    minifier = MINIFIERS.get(os.path.splitext(path)[1].lower())
+    return minifier(text) if minifier else text
+
+
+def _brotli():
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+def write_compressed(path, data):
+    """
+    data를 gzip/brotli로 압축해 path.gz, path.br로 씁니다.
+    내용이 같으면 압축 결과도 같도록 gzip 헤더의 시각은 0으로 둡니다.
+
+    Returns:
+        tuple: (gzip 크기, brotli 크기 또는 None)
+    """
+    sizes = []
+    brotli = _brotli()
+    for suffix in COMPRESSED_SUFFIXES:
+        if suffix == '.gz':
+            compressed = gzip.compress(data, compresslevel=9, mtime=0)
+        elif brotli:
+            compressed = brotli.compress(data, quality=11)
+        else:
+            sizes.append(None)
+            continue
+        tmp_path = f"{path}{suffix}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(compressed)
+        os.replace(tmp_path, f"{path}{suffix}")
+        sizes.append(len(compressed))
+    return tuple(sizes)
+
+
+def has_compressed(path):
+    """
+    압축 파일이 모두 있으면 True (brotli가 없으면 .gz만 확인)
+    """
+    suffixes = COMPRESSED_SUFFIXES if _brotli() else ('.gz',)
+    return all(os.path.exists(f"{path}{suffix}") for suffix in suffixes)
+
+
+def format_report(size_report):
+    kb = lambda size: f"{size / 1024:.1f}KB" if size is not None else '-'
+    return (f"{os.path.relpath(size_report.path, PAGES_DIR)}: {kb(size_report.original)} -> "
+            f"{kb(size_report.minified)} (gzip {kb(size_report.gzip)}, br {kb(size_report.brotli)})")
+
+
+def compress_file(path):
+    """
+    파일을 그대로 두고 .gz/.br 파일만 다시 씁니다.
+
+    Returns:
+        SizeReport: 크기 보고 (original과 minified는 같음)
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    return SizeReport(path, len(data), len(data), *write_compressed(path, data))
+
+
+def output_files():
+    """
+    배포하는 페이지와 공용 묶음 파일 경로 목록
+    """
+    pages = glob.glob(os.path.join(PAGES_DIR, '*.html'))
+    assets = [path for path in glob.glob(os.path.join(PAGES_DIR, 'assets', 'app.*'))
+              if not path.endswith(COMPRESSED_SUFFIXES) and not path.endswith('.tmp')]
+    return sorted(pages) + sorted(assets)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="페이지/묶음 파일의 .gz/.br 파일 쓰기")
+    parser.add_argument("files", nargs="*", help="처리할 파일 (기본값: 모든 페이지와 묶음)")
+    args = parser.parse_args()
+
+    if _brotli() is None:
+        print("brotli가 설치되어 있지 않아 .br 파일은 만들지 않습니다 (pip install brotli).")
+    paths = args.files or output_files()
+    total_size = total_gzip = 0
+    for path in paths:
+        size_report = compress_file(path)
+        print(format_report(size_report))
+        total_size += size_report.minified
+        total_gzip += size_report.gzip
+    print(f"합계 {len(paths)}개: {total_size / 1024:.1f}KB (gzip {total_gzip / 1024:.1f}KB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+페이지 템플릿
+공지사항/가정통신문, 주간 식단표, 학사일정 페이지가 함께 쓰는 Jinja2 템플릿 계층입니다.
+src/templates/base.html이 공통 머리글(제목, 날씨, 시각, 학교 이름)을 담고,
+페이지별 템플릿은 이를 상속해 본문만 채웁니다. 값은 모두 자동으로 HTML 이스케이프됩니다.
+
+스타일과 스크립트는 페이지에 넣지 않고 모든 페이지가 함께 쓰는 묶음 파일 두 개
+(assets/app.<해시>.css, assets/app.<해시>.js)로 만듭니다. 페이지별 스타일은 <body class="page-<이름>">
+아래로 범위를 한정해 한 파일에 합칩니다. 파일 이름에 내용 해시가 들어가므로 내용이 바뀌면 이름도 바뀌고,
+브라우저는 한 번 받은 묶음을 페이지를 넘길 때마다 다시 받거나 파싱하지 않습니다.
+
+템플릿은 프로세스마다 한 번만 컴파일하고, 컴파일 결과(바이트코드)는 data/template_cache에 보관해
+다음 실행에서는 템플릿 소스를 다시 파싱하지 않습니다. 템플릿 파일이 바뀌면 캐시는 자동으로 무효화됩니다.
+"""
+
+import glob
+import hashlib
+import os
+import re
+import threading
+from functools import lru_cache
+
+import page_minify
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, meta, select_autoescape
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
+TEMPLATE_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'template_cache')
+
+# 페이지 HTML이 있는 디렉터리와 그 아래 묶음 파일 디렉터리
+PAGES_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ASSET_DIR = os.path.join(PAGES_DIR, 'assets')
+
+# 공통 스타일 다음에 페이지별 스타일을 <body class="page-<이름>"> 범위로 붙입니다
+SHARED_STYLE = 'header.css'
+PAGE_STYLES = {'board': 'board.css', 'meal': 'meal.css', 'schedule': 'schedule.css'}
+SCRIPTS = ['header.js', 'board.js']
+
+_CSS_TOKEN = re.compile(r'([^{}]*)([{}])')
+_CSS_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+
+# 여러 페이지를 동시에 렌더링할 때 묶음 파일을 한 번에 하나씩만 쓰도록 합니다
+_asset_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def environment():
+    """
+    템플릿 환경을 만듭니다. 실행 중에는 템플릿 파일이 바뀌지 않으므로 파일 변경 확인(auto_reload)을 끕니다.
+    """
+    os.makedirs(TEMPLATE_CACHE_DIR, exist_ok=True)
+    return Environment(
+        loader=FileSystemLoader(TEMPLATE_DIR),
+        autoescape=select_autoescape(['html']),
+        bytecode_cache=FileSystemBytecodeCache(TEMPLATE_CACHE_DIR),
+        auto_reload=False,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        keep_trailing_newline=True
+    )
+
+
+def scope_css(css, scope):
+    """
+    스타일의 모든 선택자를 body.<scope> 아래로 한정합니다 (@media 안의 규칙 포함).
+    body 선택자는 body.<scope>가 됩니다.
+    """
+    out = []
+    end = 0
+    for match in _CSS_TOKEN.finditer(css):
+        text, brace = match.groups()
+        end = match.end()
+        # 선언 블록의 끝이거나 @media 같은 규칙 묶음이면 그대로 둡니다
+        prelude = _CSS_COMMENT.sub(lambda m: ' ' * len(m.group()), text)
+        selectors = prelude.strip()
+        if brace == '}' or selectors.startswith('@'):
+            out.append(text + brace)
+            continue
+        # 선택자 앞의 주석과 공백은 그대로 두고 선택자만 바꿉니다
+        start = len(prelude) - len(prelude.lstrip())
+        scoped = []
+        for selector in selectors.split(','):
+            selector = ' '.join(selector.split())
+            if selector == 'body' or selector.startswith(('body ', 'body.', 'body:')):
+                scoped.append(f"body.{scope}{selector[4:]}")
+            else:
+                scoped.append(f"body.{scope} {selector}")
+        out.append(text[:start] + ', '.join(scoped) + ' ' + brace)
+    return ''.join(out) + css[end:]
+
+
+def _write_asset(kind, content):
+    """
+    묶음 파일을 압축(minify)해 assets/app.<해시>.<kind>로 쓰고 .gz/.br 파일도 함께 씁니다.
+    같은 이름의 파일은 내용도 같으므로 이미 있으면 건너뜁니다.
+
+    Returns:
+        str: 페이지에서 참조할 상대 URL
+    """
+    data = page_minify.minify(f"app.{kind}", content).encode('utf-8')
+    digest = hashlib.sha256(data).hexdigest()[:10]
+    name = f"app.{digest}.{kind}"
+    path = os.path.join(ASSET_DIR, name)
+    if not os.path.exists(path) or not page_minify.has_compressed(path):
+        os.makedirs(ASSET_DIR, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        sizes = page_minify.write_compressed(path, data)
+        print(page_minify.format_report(page_minify.SizeReport(path, len(content.encode('utf-8')), len(data), *sizes)))
+    return f"assets/{name}"
+
+
+@lru_cache(maxsize=None)
+def asset_urls(weather_key=''):
+    """
+    공용 스타일/스크립트 묶음을 만들고 URL을 반환합니다. 프로세스마다 한 번만 만듭니다.
+
+    Args:
+        weather_key (str): 날씨 스크립트에 넣을 OpenWeather API 키
+
+    Returns:
+        dict: {"css": URL, "js": URL}
+    """
+    loader = environment().loader
+    source = lambda name: loader.get_source(environment(), name)[0]
+    css = [source(SHARED_STYLE)]
+    css += [scope_css(source(name), f"page-{page}") for page, name in PAGE_STYLES.items()]
+    js = [environment().get_template(name).render(weather_key=weather_key) for name in SCRIPTS]
+    with _asset_lock:
+        return {"css": _write_asset("css", '\n'.join(css)), "js": _write_asset("js", '\n'.join(js))}
+
+
+def prune_assets():
+    """
+    페이지 HTML 어디에서도 참조하지 않는 이전 묶음 파일을 지웁니다.
+    페이지를 새로 쓰지 못해 기존 페이지를 유지한 경우에도 그 페이지가 쓰는 묶음은 남깁니다.
+
+    Returns:
+        list: 지운 파일 이름
+    """
+    referenced = set()
+    for page in glob.glob(os.path.join(PAGES_DIR, '*.html')):
+        with open(page, 'r', encoding='utf-8') as f:
+            referenced.update(re.findall(r'assets/(app\.[0-9a-f]+\.(?:css|js))', f.read()))
+    removed = []
+    for path in glob.glob(os.path.join(ASSET_DIR, 'app.*')):
+        name = os.path.basename(path)
+        # 압축 파일(.gz/.br)은 원본 묶음이 참조되는 동안 남깁니다
+        bundle = os.path.splitext(name)[0] if name.endswith(page_minify.COMPRESSED_SUFFIXES) else name
+        if bundle not in referenced and not name.endswith('.tmp'):
+            os.remove(path)
+            removed.append(name)
+    return removed
+
+
+def render(name, **context):
+    """
+    템플릿을 렌더링합니다. 공용 묶음 URL은 assets 변수로 넘어갑니다.
+
+    Args:
+        name (str): 템플릿 파일 이름 (예: board.html)
+        **context: 템플릿 변수
+
+    Returns:
+        str: HTML 문자열
+    """
+    return environment().get_template(name).render(context, assets=asset_urls(context.get('weather_key', '')))
+
+
+@lru_cache(maxsize=None)
+def template_dependencies(name):
+    """
+    페이지 템플릿과 그 템플릿이 상속(extends)하거나 포함(include)하는 템플릿 파일 경로 목록입니다
+    (site_build에서 페이지 노드의 상류 노드로 사용).
+    """
+    source = environment().loader.get_source(environment(), name)[0]
+    paths = [os.path.join(TEMPLATE_DIR, name)]
+    # 이름이 변수로 정해지는 템플릿(None)은 알 수 없으므로 건너뜁니다
+    for referenced in filter(None, meta.find_referenced_templates(environment().parse(source))):
+        paths += [path for path in template_dependencies(referenced) if path not in paths]
+    return tuple(paths)
+
+
+def asset_sources():
+    """
+    공용 스타일/스크립트 묶음에 들어가는 템플릿 파일 경로 목록입니다.
+    """
+    names = [SHARED_STYLE, *PAGE_STYLES.values(), *SCRIPTS]
+    return [os.path.join(TEMPLATE_DIR, name) for name in names]
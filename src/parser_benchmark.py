@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+게시판 목록 파서 백엔드 벤치마크
+백엔드별로 목록 페이지 한 장을 파싱하는 데 걸리는 시간을 측정합니다.
+
+사용법:
+    python parser_benchmark.py                      # 실제 페이지 크기와 비슷한 합성 페이지 사용
+    python parser_benchmark.py --file list.html     # 저장해 둔 실제 목록 페이지 사용
+    python parser_benchmark.py --repeat 200
+    python parser_benchmark.py --limit 7            # 스트리밍 모드에서 앞쪽 7행만 읽을 때
+"""
+
+import argparse
+import time
+
+import board_parser
+
+
+def build_sample_page(rows=10, menu_items=600):
+    """
+    학교 홈페이지 목록 페이지와 비슷한 구조의 합성 HTML을 만듭니다.
+    실제 페이지는 표보다 상단 메뉴/하단 정보가 훨씬 크므로 메뉴 항목을 많이 넣습니다.
+    """
+    menu = ''.join(
+        f'<li class="depth2"><a href="/shingal-m/sv/menu{i}.do?mi={10000 + i}" title="메뉴 {i}">메뉴 항목 {i}</a>'
+        f'<ul><li><a href="/shingal-m/sv/sub{i}.do">하위 메뉴 {i}</a></li></ul></li>'
+        for i in range(menu_items)
+    )
+    body_rows = ''.join(
+        f'<tr><td>{rows - i}</td>'
+        f'<td class="ta_l"><a href="javascript:void(0);" onclick="fnView(\'{300000 + i}\');">'
+        f'{i}번째 가정통신문 제목입니다 (안내)</a></td>'
+        f'<td>교무실</td><td>2025.03.{(i % 28) + 1:02d}</td>'
+        f'<td><img src="/images/icon_file.gif" alt="첨부파일"></td><td>{i * 7}</td></tr>'
+        for i in range(rows)
+    )
+    html = (
+        '<!DOCTYPE html><html lang="ko"><head><meta charset="UTF-8"><title>공지사항</title>'
+        + ''.join(f'<script src="/js/lib{i}.js"></script><link rel="stylesheet" href="/css/s{i}.css">' for i in range(30))
+        + f'</head><body><div id="header"><ul class="gnb">{menu}</ul></div>'
+        '<div id="subContent"><div><div class="BD_list"><table>'
+        '<thead><tr><th>번호</th><th>제목</th><th>작성자</th><th>등록일</th><th>첨부</th><th>조회수</th></tr></thead>'
+        f'<tbody>{body_rows}</tbody></table></div></div></div>'
+        f'<div id="footer">{"<p>주소 및 연락처 안내</p>" * 100}</div></body></html>'
+    )
+    return html.encode('utf-8')
+
+
+def benchmark(content, backends, repeat):
+    """
+    백엔드별 페이지당 평균 파싱 시간(ms)을 측정합니다.
+
+    Returns:
+        dict: {백엔드: 평균 ms 또는 오류 메시지}
+    """
+    results = {}
+    for backend in backends:
+        try:
+            table = board_parser.parse_board_table(content, backend)
+        except ImportError as e:
+            results[backend] = str(e)
+            continue
+        rows = len(table.rows) if table else 0
+        started = time.perf_counter()
+        for _ in range(repeat):
+            board_parser.parse_board_table(content, backend)
+        elapsed = (time.perf_counter() - started) / repeat
+        results[backend] = (elapsed * 1000, rows)
+    return results
+
+
+def benchmark_stream(content, limit, repeat, chunk_size=8192):
+    """
+    스트리밍 모드로 앞쪽 limit개 행만 읽을 때의 페이지당 평균 시간(ms)과 읽은 바이트 수를 측정합니다.
+    """
+    chunks = [content[i:i + chunk_size] for i in range(0, len(content), chunk_size)]
+    consumed = 0
+    started = time.perf_counter()
+    for _ in range(repeat):
+        source = iter(chunks)
+        consumed = 0
+
+        def counting():
+            nonlocal consumed
+            for chunk in source:
+                consumed += len(chunk)
+                yield chunk
+
+        rows = board_parser.iter_board_rows(counting())
+        for count, _row in enumerate(rows, 1):
+            if count >= limit:
+                break
+        rows.close()
+    elapsed = (time.perf_counter() - started) / repeat
+    return elapsed * 1000, consumed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="게시판 목록 파서 백엔드 벤치마크")
+    parser.add_argument("--file", help="측정할 목록 페이지 HTML 파일")
+    parser.add_argument("--repeat", type=int, default=50, help="백엔드별 반복 횟수")
+    parser.add_argument("--backends", nargs="+", default=list(board_parser.BACKENDS))
+    parser.add_argument("--limit", type=int, default=7, help="스트리밍 모드에서 읽을 행 수")
+    args = parser.parse_args()
+
+    if args.file:
+        with open(args.file, 'rb') as f:
+            content = f.read()
+    else:
+        content = build_sample_page()
+
+    print(f"페이지 크기: {len(content) / 1024:.1f}KB, 반복 {args.repeat}회")
+    for backend, result in benchmark(content, args.backends, args.repeat).items():
+        if isinstance(result, str):
+            print(f"  {backend:<12} 건너뜀: {result}")
+        else:
+            elapsed, rows = result
+            print(f"  {backend:<12} {elapsed:8.2f}ms/페이지 ({rows}행)")
+    elapsed, consumed = benchmark_stream(content, args.limit, args.repeat)
+    print(f"  {'stream':<12} {elapsed:8.2f}ms/페이지 (앞 {args.limit}행, {consumed / 1024:.1f}KB만 읽음)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+게시물 상세 페이지 수집기
+selectNttView.do 상세 페이지에서 본문, 첨부파일 목록, 등록 시각을 추출합니다.
+여러 게시물을 제한된 스레드 풀과 호스트별 동시 요청 제한으로 가져오며,
+게시된 글은 사실상 바뀌지 않으므로 결과를 nttSn 기준으로 영구 캐시합니다.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urljoin, urlsplit
+
+import requests
+from bs4 import BeautifulSoup
+
+import http_client
+
+# 상세 페이지 캐시 경로 설정 (게시물 하나당 파일 하나)
+DETAIL_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'post_details')
+
+# 전체 작업 스레드 수와 호스트별 동시 요청 수
+DEFAULT_WORKERS = 8
+DEFAULT_PER_HOST = 4
+
+# 본문 영역 후보 (학교 홈페이지 게시판 템플릿별)
+BODY_SELECTORS = [
+    'div.BD_content',
+    'td.BD_content',
+    'div.ntt_cn',
+    'div.bbs_con',
+    'div.view_con',
+    'div.board_view_content',
+    'div.BD_view .content',
+]
+
+ATTACHMENT_EXTENSIONS = ('.pdf', '.hwp', '.hwpx', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
+                         '.zip', '.jpg', '.jpeg', '.png', '.gif')
+
+DATETIME_PATTERN = re.compile(r'(\d{4})[.\-/](\d{2})[.\-/](\d{2})(?:\s+(\d{2}):(\d{2}))?')
+
+_host_limits = {}
+_host_limits_lock = threading.Lock()
+
+
+def _host_semaphore(url, per_host):
+    host = urlsplit(url).netloc
+    with _host_limits_lock:
+        semaphore = _host_limits.get(host)
+        if semaphore is None:
+            semaphore = threading.BoundedSemaphore(per_host)
+            _host_limits[host] = semaphore
+    return semaphore
+
+
+def post_key(url):
+    """
+    상세 페이지 URL에서 캐시 키(bbsId_nttSn)를 만듭니다. nttSn이 없으면 None을 반환합니다.
+    """
+    query = parse_qs(urlsplit(url).query)
+    ntt_sn = query.get('nttSn', [''])[0]
+    if not ntt_sn:
+        return None
+    bbs_id = query.get('bbsId', ['0'])[0]
+    return f"{bbs_id}_{ntt_sn}"
+
+
+def _cache_path(key):
+    return os.path.join(DETAIL_DIR, f"{key}.json")
+
+
+def load_cached_detail(url):
+    """
+    캐시된 상세 정보를 읽어옵니다. 없으면 None을 반환합니다.
+    """
+    key = post_key(url)
+    if not key:
+        return None
+    try:
+        with open(_cache_path(key), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_detail(key, detail):
+    os.makedirs(DETAIL_DIR, exist_ok=True)
+    path = _cache_path(key)
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(detail, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def _format_datetime(match):
+    year, month, day, hour, minute = match.groups()
+    if hour:
+        return f"{year}-{month}-{day} {hour}:{minute}"
+    return f"{year}-{month}-{day}"
+
+
+def parse_post_detail(content, url):
+    """
+    상세 페이지 HTML에서 본문, 첨부파일, 등록 시각을 추출합니다.
+
+    Args:
+        content (bytes): 상세 페이지 HTML
+        url (str): 상세 페이지 URL (상대 링크 변환에 사용)
+
+    Returns:
+        dict: {"ntt_sn", "url", "body", "attachments": [{"name", "url"}], "posted_at"}
+    """
+    soup = BeautifulSoup(content, 'html.parser', from_encoding='utf-8')
+    scope = soup.find(id='subContent') or soup
+
+    # 본문
+    body_node = None
+    for selector in BODY_SELECTORS:
+        body_node = scope.select_one(selector)
+        if body_node:
+            break
+    if body_node:
+        lines = [line.strip() for line in body_node.get_text('\n').splitlines()]
+        body = '\n'.join(line for line in lines if line)
+    else:
+        body = ""
+
+    # 첨부파일
+    attachments = []
+    seen = set()
+    for a in scope.find_all('a'):
+        href = a.get('href', '')
+        lowered = href.lower()
+        is_download = 'download' in lowered or 'filedown' in lowered
+        if not (is_download or lowered.split('?')[0].endswith(ATTACHMENT_EXTENSIONS)):
+            continue
+        file_url = urljoin(url, href)
+        if file_url in seen:
+            continue
+        seen.add(file_url)
+        attachments.append({"name": a.get_text(strip=True), "url": file_url})
+
+    # 등록 시각 (등록일/작성일 항목 우선, 없으면 페이지 안의 첫 날짜)
+    posted_at = ""
+    for label in scope.find_all(['th', 'dt', 'span', 'strong']):
+        if label.get_text(strip=True) in ('등록일', '작성일', '게시일'):
+            value = label.find_next_sibling(['td', 'dd', 'span']) or label.find_next(['td', 'dd'])
+            if value:
+                match = DATETIME_PATTERN.search(value.get_text(' ', strip=True))
+                if match:
+                    posted_at = _format_datetime(match)
+                    break
+    if not posted_at:
+        match = DATETIME_PATTERN.search(scope.get_text(' ', strip=True))
+        if match:
+            posted_at = _format_datetime(match)
+
+    return {
+        "ntt_sn": parse_qs(urlsplit(url).query).get('nttSn', [''])[0],
+        "url": url,
+        "body": body,
+        "attachments": attachments,
+        "posted_at": posted_at
+    }
+
+
+def fetch_post_detail(url, per_host=DEFAULT_PER_HOST, refresh=False):
+    """
+    게시물 하나의 상세 정보를 가져옵니다. 캐시에 있으면 요청하지 않습니다.
+    refresh가 True이면 캐시를 무시하고 다시 요청합니다 (수정된 게시물).
+
+    Returns:
+        dict: 상세 정보, 실패 시 None
+    """
+    cached = None if refresh else load_cached_detail(url)
+    if cached is not None:
+        return cached
+
+    try:
+        with _host_semaphore(url, per_host):
+            response = http_client.get(url)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        logging.error(f"상세 페이지 요청 실패 ({url}): {e}")
+        return None
+
+    try:
+        detail = parse_post_detail(response.content, url)
+    except Exception as e:
+        logging.error(f"상세 페이지 파싱 오류 ({url}): {e}")
+        return None
+
+    key = post_key(url)
+    if key:
+        _save_detail(key, detail)
+    return detail
+
+
+def fetch_post_details(items, max_workers=DEFAULT_WORKERS, per_host=DEFAULT_PER_HOST, refresh=()):
+    """
+    여러 게시물의 상세 정보를 동시에 가져옵니다.
+
+    Args:
+        items (list): 크롤링된 게시물 목록 (각 항목에 "url" 필요)
+        max_workers (int): 전체 작업 스레드 수
+        per_host (int): 호스트별 최대 동시 요청 수
+        refresh (iterable): 캐시를 무시하고 다시 가져올 상세 페이지 URL (수정된 게시물)
+
+    Returns:
+        dict: {상세 페이지 URL: 상세 정보} (실패한 게시물은 제외)
+    """
+    urls = []
+    for item in items:
+        url = item.get('url')
+        if url and post_key(url) and url not in urls:
+            urls.append(url)
+
+    refresh = set(refresh)
+    details = {}
+    pending = []
+    for url in urls:
+        cached = None if url in refresh else load_cached_detail(url)
+        if cached is not None:
+            details[url] = cached
+        else:
+            pending.append(url)
+
+    if pending:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+            for url, detail in zip(pending, executor.map(lambda u: fetch_post_detail(u, per_host, u in refresh), pending)):
+                if detail is not None:
+                    details[url] = detail
+
+    logging.info(f"상세 페이지 수집 완료: 캐시 {len(urls) - len(pending)}개, 새로 요청 {len(pending)}개, 실패 {len(urls) - len(details)}개")
+    return details
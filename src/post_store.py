@@ -0,0 +1,510 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+게시물 저장소
+크롤링한 공지사항/가정통신문을 SQLite(data/posts.db)에 nttSn 기준으로 누적 저장하는 모듈입니다.
+페이지 생성기와 RSS 피드 생성기는 학교 서버를 다시 요청하지 않고 이 저장소에서 게시물을 읽습니다.
+
+테이블:
+    boards      - 게시판 (목록 URL, 학교, 종류, 변경 번호 revision)
+    posts       - 게시물 (게시판 + nttSn 기본 키, 내용 해시 row_hash)
+    crawl_runs  - 게시판별 크롤링 실행 기록
+
+revision은 게시판의 게시물이 추가되거나 내용 해시가 바뀔 때(또는 게시판 이름이 바뀔 때) 트리거가 1씩 올리는 값입니다.
+피드 생성기처럼 저장소 전체를 훑지 않고 변경 여부만 알고 싶은 곳은 이 값을 비교합니다.
+"""
+
+import hashlib
+import os
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+
+DB_PATH = os.getenv(
+    "POST_STORE_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'posts.db')
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS boards (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL UNIQUE,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL DEFAULT '',
+    school_id TEXT NOT NULL DEFAULT '',
+    school_name TEXT NOT NULL DEFAULT '',
+    revision INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS posts (
+    board_id INTEGER NOT NULL REFERENCES boards(id),
+    ntt_sn INTEGER NOT NULL,
+    number TEXT NOT NULL DEFAULT '',
+    title TEXT NOT NULL,
+    author TEXT NOT NULL DEFAULT '',
+    date TEXT NOT NULL DEFAULT '',
+    views INTEGER NOT NULL DEFAULT 0,
+    url TEXT NOT NULL DEFAULT '',
+    has_attachment INTEGER NOT NULL DEFAULT 0,
+    row_hash TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (board_id, ntt_sn)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS posts_date ON posts (date);
+CREATE INDEX IF NOT EXISTS posts_board_date ON posts (board_id, date);
+
+CREATE TABLE IF NOT EXISTS crawl_runs (
+    id INTEGER PRIMARY KEY,
+    board_id INTEGER NOT NULL REFERENCES boards(id),
+    started_at TEXT NOT NULL,
+    finished_at TEXT NOT NULL,
+    status TEXT NOT NULL,
+    post_count INTEGER NOT NULL DEFAULT 0,
+    error TEXT
+);
+
+CREATE INDEX IF NOT EXISTS crawl_runs_board ON crawl_runs (board_id, id);
+"""
+
+# 게시판 변경 번호를 올리는 트리거 (조회수/확인 시각만 바뀐 경우는 제외)
+TRIGGERS = """
+CREATE TRIGGER IF NOT EXISTS posts_insert_revision AFTER INSERT ON posts
+BEGIN
+    UPDATE boards SET revision = revision + 1 WHERE id = NEW.board_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS posts_update_revision AFTER UPDATE OF row_hash ON posts
+WHEN OLD.row_hash != NEW.row_hash
+BEGIN
+    UPDATE boards SET revision = revision + 1 WHERE id = NEW.board_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS boards_rename_revision AFTER UPDATE OF name, school_name ON boards
+WHEN OLD.name != NEW.name OR OLD.school_name != NEW.school_name
+BEGIN
+    UPDATE boards SET revision = revision + 1 WHERE id = NEW.id;
+END;
+"""
+
+# 게시물 내용이 바뀌었는지 판단하는 필드 (조회수는 매번 바뀌므로 제외합니다)
+HASH_FIELDS = ('title', 'author', 'date', 'url', 'has_attachment')
+
+# 같은 게시물이 이미 있으면 내용 필드를 갱신하고, 내용 해시가 달라진 경우에만 updated_at을 바꿉니다
+UPSERT_SQL = """
+INSERT INTO posts (board_id, ntt_sn, number, title, author, date, views, url, has_attachment,
+                   row_hash, first_seen, last_seen, updated_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (board_id, ntt_sn) DO UPDATE SET
+    number = excluded.number,
+    title = excluded.title,
+    author = excluded.author,
+    date = excluded.date,
+    views = excluded.views,
+    url = excluded.url,
+    has_attachment = excluded.has_attachment,
+    last_seen = excluded.last_seen,
+    updated_at = CASE WHEN posts.row_hash = excluded.row_hash THEN posts.updated_at ELSE excluded.updated_at END,
+    row_hash = excluded.row_hash
+"""
+
+# 이력 파일에서 온 게시물은 처음 보는 경우에만 추가합니다 (저장 시점의 조회수가 오래된 값이므로)
+INSERT_NEW_SQL = """
+INSERT INTO posts (board_id, ntt_sn, number, title, author, date, views, url, has_attachment,
+                   row_hash, first_seen, last_seen, updated_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (board_id, ntt_sn) DO NOTHING
+"""
+
+POST_COLUMNS = "p.ntt_sn, p.number, p.title, p.author, p.date, p.views, p.url, p.has_attachment"
+
+
+def _now():
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+def connect(path=None):
+    """
+    저장소에 연결하고 필요한 테이블을 만듭니다.
+
+    Args:
+        path (str, optional): 데이터베이스 파일 경로, 없으면 DB_PATH
+
+    Returns:
+        sqlite3.Connection: 연결 (행은 sqlite3.Row)
+    """
+    path = path or DB_PATH
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    conn = sqlite3.connect(path, timeout=30)
+    conn.row_factory = sqlite3.Row
+    # 여러 스레드/프로세스가 동시에 읽고 쓸 수 있도록 WAL 모드를 사용합니다
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    if 'revision' not in {row['name'] for row in conn.execute("PRAGMA table_info(boards)")}:
+        # 변경 번호가 생기기 전에 만든 저장소
+        conn.execute("ALTER TABLE boards ADD COLUMN revision INTEGER NOT NULL DEFAULT 0")
+    conn.executescript(TRIGGERS)
+    return conn
+
+
+def row_hash(post):
+    """
+    게시물 내용 필드의 해시를 계산합니다.
+    """
+    text = '\x1f'.join(str(post.get(field, '')) for field in HASH_FIELDS)
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def _views(post):
+    views = str(post.get('views', '0'))
+    return int(views) if views.isdigit() else 0
+
+
+def _post_rows(board_id, posts, seen_at):
+    rows = []
+    for post in posts:
+        ntt_sn = str(post.get('ntt_sn') or '')
+        if not ntt_sn.isdigit():
+            # nttSn이 없는 게시물은 식별할 수 없으므로 저장하지 않습니다
+            continue
+        rows.append((
+            board_id,
+            int(ntt_sn),
+            post.get('number', ''),
+            post.get('title', ''),
+            post.get('author', ''),
+            post.get('date', ''),
+            _views(post),
+            post.get('url', ''),
+            1 if post.get('has_attachment') else 0,
+            row_hash(post),
+            seen_at,
+            seen_at,
+            seen_at,
+        ))
+    return rows
+
+
+def ensure_board(conn, url, kind, name='', school_id='', school_name=''):
+    """
+    게시판을 등록하고 ID를 반환합니다. 이미 있으면 이름 정보만 갱신합니다.
+    """
+    conn.execute(
+        """
+        INSERT INTO boards (url, kind, name, school_id, school_name) VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT (url) DO UPDATE SET kind = excluded.kind, name = excluded.name,
+            school_id = excluded.school_id, school_name = excluded.school_name
+        """,
+        (url, kind, name, school_id, school_name)
+    )
+    return conn.execute("SELECT id FROM boards WHERE url = ?", (url,)).fetchone()[0]
+
+
+def save_posts(conn, board_id, posts, seen_at=None, update_existing=True):
+    """
+    게시물 목록을 한 번의 executemany로 저장합니다.
+
+    Args:
+        conn (sqlite3.Connection): 연결
+        board_id (int): 게시판 ID
+        posts (list): 크롤러가 반환한 게시물 dict 목록
+        seen_at (str, optional): 확인 시각, 없으면 현재 시각
+        update_existing (bool): False이면 이미 있는 게시물은 건드리지 않습니다
+
+    Returns:
+        int: 저장 대상 게시물 수 (nttSn이 있는 게시물)
+    """
+    rows = _post_rows(board_id, posts, seen_at or _now())
+    if rows:
+        conn.executemany(UPSERT_SQL if update_existing else INSERT_NEW_SQL, rows)
+    return len(rows)
+
+
+def _stored_rows(conn, board_id, ntt_sns):
+    """
+    저장된 게시물의 nttSn별 (제목, 날짜, row_hash)를 읽어옵니다.
+    """
+    stored = {}
+    ntt_sns = list(ntt_sns)
+    for start in range(0, len(ntt_sns), 500):
+        chunk = ntt_sns[start:start + 500]
+        for row in conn.execute(
+            f"SELECT ntt_sn, title, date, row_hash FROM posts "
+            f"WHERE board_id = ? AND ntt_sn IN ({','.join('?' * len(chunk))})",
+            [board_id, *chunk]
+        ):
+            stored[row['ntt_sn']] = row
+    return stored
+
+
+def diff_posts(conn, board_id, posts, history_items=None):
+    """
+    저장하기 전에 이번 실행의 게시물을 저장된 row_hash와 비교합니다.
+
+    Args:
+        conn (sqlite3.Connection): 연결
+        board_id (int): 게시판 ID
+        posts (list): 목록 페이지에서 읽은 게시물 (기존 게시물도 갱신 대상)
+        history_items (list, optional): 이력 크롤링으로 모은 게시물 (새 게시물만 추가 대상)
+
+    Returns:
+        tuple: (새 게시물 목록, 수정된 게시물 목록) - 수정된 게시물에는 "previous": {"title", "date"}가 붙습니다
+    """
+    candidates = {}
+    for post in list(history_items or []) + list(posts):
+        ntt_sn = str(post.get('ntt_sn') or '')
+        if ntt_sn.isdigit():
+            candidates[int(ntt_sn)] = post
+    stored = _stored_rows(conn, board_id, candidates)
+    listed = {int(post['ntt_sn']) for post in posts if str(post.get('ntt_sn') or '').isdigit()}
+
+    new, edited = [], []
+    for ntt_sn, post in candidates.items():
+        row = stored.get(ntt_sn)
+        if row is None:
+            new.append(post)
+        elif ntt_sn in listed and row['row_hash'] != row_hash(post) and \
+                (row['title'] != post.get('title', '') or row['date'] != post.get('date', '')):
+            edited.append({**post, "previous": {"title": row['title'], "date": row['date']}})
+    return new, edited
+
+
+def save_board_result(url, kind, result, name='', school_id='', school_name='',
+                      history_items=None, started_at=None, path=None):
+    """
+    크롤러 결과 하나를 저장하고 크롤링 실행 기록을 남깁니다 (하나의 트랜잭션).
+    저장하기 전에 기존 게시물과 비교해 새 게시물과 제목/날짜가 바뀐 게시물을 함께 반환합니다.
+
+    Args:
+        url (str): 게시판 목록 URL
+        kind (str): 게시판 종류이자 결과 키 (notices, letters)
+        result (dict): crawl_board() 결과
+        name (str): 게시판 이름 (예: 공지사항)
+        school_id (str): 학교 ID
+        school_name (str): 학교 이름
+        history_items (list, optional): 이력 크롤링에서 새로 찾은 게시물 (새 게시물만 추가)
+        started_at (str, optional): 크롤링 시작 시각
+        path (str, optional): 데이터베이스 파일 경로
+
+    Returns:
+        dict: {"status", "saved", "run_at", "new", "edited"}
+    """
+    meta = result.get('meta', {})
+    if meta.get('stale'):
+        status = 'stale'
+    elif meta.get('error'):
+        status = 'error'
+    elif meta.get('not_modified'):
+        status = 'not_modified'
+    else:
+        status = 'ok'
+
+    finished_at = _now()
+    saved = 0
+    # 실패했거나 이전 결과를 그대로 쓴 경우에는 목록 게시물을 다시 쓰지 않습니다
+    posts = result.get(kind, []) if status == 'ok' else []
+    with closing(connect(path)) as conn, conn:
+        board_id = ensure_board(conn, url, kind, name, school_id, school_name)
+        new, edited = diff_posts(conn, board_id, posts, history_items)
+        if history_items:
+            saved += save_posts(conn, board_id, history_items, finished_at, update_existing=False)
+        if posts:
+            saved += save_posts(conn, board_id, posts, finished_at)
+        conn.execute(
+            "INSERT INTO crawl_runs (board_id, started_at, finished_at, status, post_count, error) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (board_id, started_at or finished_at, finished_at, status, saved, meta.get('error'))
+        )
+    return {"status": status, "saved": saved, "run_at": finished_at, "new": new, "edited": edited}
+
+
+def get_posts(url, ntt_sns, path=None):
+    """
+    게시판의 게시물 몇 개를 nttSn으로 읽어옵니다.
+
+    Returns:
+        dict: {nttSn(str): 게시물 dict}
+    """
+    with closing(connect(path)) as conn:
+        board = conn.execute("SELECT id FROM boards WHERE url = ?", (url,)).fetchone()
+        if board is None:
+            return {}
+        ntt_sns = [int(ntt_sn) for ntt_sn in ntt_sns if str(ntt_sn).isdigit()]
+        posts = {}
+        for start in range(0, len(ntt_sns), 500):
+            chunk = ntt_sns[start:start + 500]
+            for row in conn.execute(
+                f"SELECT {POST_COLUMNS} FROM posts p "
+                f"WHERE p.board_id = ? AND p.ntt_sn IN ({','.join('?' * len(chunk))})",
+                [board['id'], *chunk]
+            ):
+                posts[str(row['ntt_sn'])] = _post_dict(row)
+    return posts
+
+
+def _post_dict(row):
+    return {
+        "number": row['number'],
+        "title": row['title'],
+        "author": row['author'],
+        "date": row['date'],
+        "views": str(row['views']),
+        "url": row['url'],
+        "ntt_sn": str(row['ntt_sn']),
+        "has_attachment": bool(row['has_attachment'])
+    }
+
+
+def get_board(url, path=None):
+    """
+    게시판 정보와 마지막 크롤링 실행 기록을 읽어옵니다.
+
+    Returns:
+        dict: {"id", "url", "kind", "name", "school_id", "school_name", "revision", "last_run"} 또는 None
+    """
+    with closing(connect(path)) as conn:
+        board = conn.execute("SELECT * FROM boards WHERE url = ?", (url,)).fetchone()
+        if board is None:
+            return None
+        run = conn.execute(
+            "SELECT * FROM crawl_runs WHERE board_id = ? ORDER BY id DESC LIMIT 1", (board['id'],)
+        ).fetchone()
+    info = dict(board)
+    info['last_run'] = dict(run) if run else None
+    return info
+
+
+def list_boards(path=None):
+    """
+    저장소에 등록된 모든 게시판을 반환합니다.
+
+    Returns:
+        list: 게시판 dict 목록
+    """
+    with closing(connect(path)) as conn:
+        return [dict(row) for row in conn.execute("SELECT * FROM boards ORDER BY id")]
+
+
+def load_posts(url, limit=None, since=None, pinned_first=True, path=None):
+    """
+    게시판의 게시물을 최신순으로 읽어옵니다.
+
+    Args:
+        url (str): 게시판 목록 URL
+        limit (int, optional): 최대 개수
+        since (str, optional): 이 날짜(YYYY-MM-DD) 이후 게시물만
+        pinned_first (bool): True이면 상단 고정 글('공지')을 목록 페이지처럼 맨 앞에 둡니다
+        path (str, optional): 데이터베이스 파일 경로
+
+    Returns:
+        list: 크롤러 결과와 같은 형태의 게시물 dict 목록
+    """
+    query = f"SELECT {POST_COLUMNS} FROM posts p JOIN boards b ON b.id = p.board_id WHERE b.url = ?"
+    params = [url]
+    if since:
+        query += " AND p.date >= ?"
+        params.append(since)
+    order = "p.ntt_sn DESC"
+    if pinned_first:
+        # 마지막 크롤링에서 확인한 고정 글만 앞에 둡니다 (고정이 풀린 뒤 다시 보지 못한 글 제외)
+        order = ("(p.number = '공지' AND p.last_seen = "
+                 "(SELECT MAX(last_seen) FROM posts WHERE board_id = p.board_id)) DESC, " + order)
+    query += f" ORDER BY {order}"
+    if limit:
+        query += " LIMIT ?"
+        params.append(limit)
+    with closing(connect(path)) as conn:
+        return [_post_dict(row) for row in conn.execute(query, params)]
+
+
+def post_hashes(url, path=None):
+    """
+    게시판의 모든 게시물 (nttSn, row_hash)를 nttSn 오름차순(오래된 글부터)으로 읽어옵니다.
+    게시물 수에 비례하므로 변경 여부만 필요하면 get_board()의 revision을 먼저 비교합니다.
+
+    Returns:
+        list: [(nttSn, row_hash)]
+    """
+    with closing(connect(path)) as conn:
+        return [tuple(row) for row in conn.execute(
+            "SELECT p.ntt_sn, p.row_hash FROM posts p JOIN boards b ON b.id = p.board_id "
+            "WHERE b.url = ? ORDER BY p.ntt_sn", (url,)
+        )]
+
+
+def load_post_range(url, first_sn, last_sn, path=None):
+    """
+    nttSn이 first_sn 이상 last_sn 이하인 게시물을 최신순으로 읽어옵니다.
+
+    Returns:
+        list: 게시물 dict 목록
+    """
+    with closing(connect(path)) as conn:
+        return [_post_dict(row) for row in conn.execute(
+            f"SELECT {POST_COLUMNS} FROM posts p JOIN boards b ON b.id = p.board_id "
+            f"WHERE b.url = ? AND p.ntt_sn BETWEEN ? AND ? ORDER BY p.ntt_sn DESC",
+            (url, int(first_sn), int(last_sn))
+        )]
+
+
+def iter_posts(url=None, school_id=None, since=None, path=None):
+    """
+    게시물을 최신 날짜순으로 하나씩 읽어옵니다. 전체 목록을 메모리에 올리지 않으므로
+    교육지원청 전체 보관 피드처럼 게시물이 많은 경우에 사용합니다.
+
+    Args:
+        url (str, optional): 게시판 목록 URL로 제한
+        school_id (str, optional): 학교 ID로 제한
+        since (str, optional): 이 날짜(YYYY-MM-DD) 이후 게시물만
+        path (str, optional): 데이터베이스 파일 경로
+
+    Yields:
+        dict: 게시물 dict + "board_url", "kind", "board_name", "school_name"
+    """
+    query = (f"SELECT {POST_COLUMNS}, b.url AS board_url, b.kind, b.name AS board_name, b.school_name "
+             f"FROM posts p JOIN boards b ON b.id = p.board_id WHERE 1 = 1")
+    params = []
+    if url:
+        query += " AND b.url = ?"
+        params.append(url)
+    if school_id:
+        query += " AND b.school_id = ?"
+        params.append(school_id)
+    if since:
+        query += " AND p.date >= ?"
+        params.append(since)
+    query += " ORDER BY p.date DESC, p.ntt_sn DESC"
+    with closing(connect(path)) as conn:
+        for row in conn.execute(query, params):
+            post = _post_dict(row)
+            post.update(board_url=row['board_url'], kind=row['kind'], board_name=row['board_name'],
+                        school_name=row['school_name'])
+            yield post
+
+
+def load_board_result(url, limit=None, path=None):
+    """
+    저장된 게시물로 크롤러 결과와 같은 형태의 dict를 만듭니다. 페이지 생성기가 그대로 사용할 수 있습니다.
+
+    Returns:
+        dict: {게시판 종류: 게시물 목록, "meta": 메타 정보}, 게시판이 없으면 None
+    """
+    board = get_board(url, path)
+    if board is None:
+        return None
+    posts = load_posts(url, limit=limit, path=path)
+    last_run = board['last_run'] or {}
+    return {
+        board['kind']: posts,
+        "meta": {
+            "total_count": len(posts),
+            "last_updated": last_run.get('finished_at', _now()),
+            "source": board['school_name'] or board['school_id'],
+            "url": url,
+            "from_store": True
+        }
+    }
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+페이지 렌더링 벤치마크
+공지사항/가정통신문, 주간 식단표, 학사일정 페이지를 여러 학교 분량만큼 렌더링할 때
+페이지당 평균 시간과 메모리 할당량(tracemalloc 최대치)을 측정합니다.
+
+사용법:
+    python render_benchmark.py                  # 페이지마다 200회
+    python render_benchmark.py --repeat 1000
+    python render_benchmark.py --pages meal schedule
+    python render_benchmark.py --pages school_year   # 학사일정 12개월
+"""
+
+import argparse
+import contextlib
+import io
+import time
+import tracemalloc
+
+import crawler
+import meal_crawler
+import school_schedule_crawler
+
+
+def sample_posts(count=7):
+    return [
+        {"number": str(count - i), "title": f"{i}번째 가정통신문 제목입니다 (안내 & 신청)", "author": "교무실",
+         "date": f"2025-03-{(i % 28) + 1:02d}", "views": str(i * 7), "ntt_sn": str(300000 + i),
+         "url": f"https://shingal-m.goeyi.kr/shingal-m/na/ntt/selectNttView.do?nttSn={300000 + i}"}
+        for i in range(count)
+    ]
+
+
+def sample_meals(start_date="20250303", days=5):
+    return [
+        {"MLSV_YMD": f"{start_date[:6]}{int(start_date[6:]) + i:02d}",
+         "MMEAL_SC_NM": "중식",
+         "DDISH_NM": "<br/>".join(f"메뉴{j} ({j % 19 + 1}.{(j + 5) % 19 + 1})" for j in range(7)),
+         "CAL_INFO": "741.3 Kcal",
+         "NTR_INFO": "탄수화물(g) : 105.4<br/>단백질(g) : 30.2<br/>지방(g) : 20.1<br/>칼슘(mg) : 250.3",
+         "ORPLC_INFO": "쌀 : 국내산<br/>김치류 : 국내산<br/>고춧가루(김치류) : 국내산<br/>쇠고기(종류) : 국내산(한우)"}
+        for i in range(days)
+    ]
+
+
+def sample_schedules(year=2025, month=3, count=15):
+    return [{"AA_YMD": f"{year}{month:02d}{(i * 2) % 28 + 1:02d}", "EVENT_NM": f"학사 행사 {i}"} for i in range(count)]
+
+
+PAGES = {
+    "notice": lambda: crawler.generate_notice_html(sample_posts(), "신갈중학교"),
+    "meal": lambda: meal_crawler.generate_meal_html(sample_meals(), "신갈중학교", "20250303", "20250307"),
+    "schedule": lambda: school_schedule_crawler.generate_schedule_html(sample_schedules(), "신갈중학교", 2025, 3),
+    # 한 학년도(3월~다음 해 2월) 12개월 학사일정
+    "school_year": lambda: "".join(
+        school_schedule_crawler.generate_schedule_html(sample_schedules(2025 + (month < 3), month), "신갈중학교",
+                                                       2025 + (month < 3), month)
+        for month in (*range(3, 13), 1, 2)
+    ),
+}
+
+
+def benchmark(pages, repeat):
+    """
+    페이지별 평균 렌더링 시간(ms), 렌더링 1회의 최대 할당량(KB), 출력 크기(바이트)를 측정합니다.
+    학사일정 생성기의 진행 로그는 측정에서 제외하기 위해 버립니다.
+
+    Returns:
+        dict: {페이지: (ms, KB, 바이트)}
+    """
+    results = {}
+    for page in pages:
+        render = PAGES[page]
+        with contextlib.redirect_stdout(io.StringIO()):
+            html = render()  # 템플릿 컴파일 등 첫 호출 비용은 제외합니다
+            tracemalloc.start()
+            render()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            started = time.perf_counter()
+            for _ in range(repeat):
+                render()
+            elapsed = (time.perf_counter() - started) / repeat
+        results[page] = (elapsed * 1000, peak / 1024, len(html.encode('utf-8')))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="페이지 렌더링 시간/메모리 할당 벤치마크")
+    parser.add_argument("--repeat", type=int, default=200, help="페이지마다 반복 횟수")
+    parser.add_argument("--pages", nargs="+", choices=list(PAGES), default=list(PAGES))
+    args = parser.parse_args()
+
+    print(f"반복 {args.repeat}회")
+    for page, (elapsed, peak, size) in benchmark(args.pages, args.repeat).items():
+        print(f"  {page:<10} {elapsed:7.3f}ms/페이지  할당 최대 {peak:8.1f}KB  출력 {size / 1024:6.1f}KB")
+
+
+if __name__ == "__main__":
+    main()
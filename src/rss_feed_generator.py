@@ -2,16 +2,55 @@
 # -*- coding: utf-8 -*-
 
 """
-공지사항 RSS 피드 생성기
-크롤링된 공지사항 데이터를 RSS 피드로 변환하는 모듈입니다.
+공지사항/가정통신문 피드 생성기
+게시물 저장소(data/posts.db)에 쌓인 공지사항/가정통신문을 RSS 2.0, Atom, JSON Feed로 변환하는 모듈입니다.
+학교 서버에 다시 요청하지 않습니다.
+
+한 번의 실행에서 학교마다 게시판별 최근 게시물을 한 번만 읽어 공용 항목 모델(FeedEntry)로 정규화하고,
+같은 항목으로 게시판별 피드와 두 게시판을 합친 통합 피드를 모든 형식으로 씁니다.
+
+피드는 증분으로 만듭니다. 이전 실행에서 형식별로 직렬화한 항목을 data/feeds/<게시판>.json에 보관해 두고,
+최근 게시물 창(limit) 안에서 새로 생기거나 내용이 바뀐 게시물만 정규화/직렬화한 뒤 창 밖으로 밀려난 항목은 버립니다.
+따라서 생성 시간은 누적된 게시물 수와 관계없이 창 크기와 새 게시물 수에만 비례합니다.
+변경 여부는 저장소가 게시판마다 올리는 변경 번호(boards.revision)로 판단하고, 보관 페이지 경계도 항목 캐시에 함께 두므로
+게시물이 바뀌지 않았으면 저장소 전체를 훑지 않습니다. 바뀐 경우에도 전체 (nttSn, row_hash)는 한 번만 읽습니다.
+
+게시판별 피드는 RFC 5005(Feed Paging and Archiving) 방식으로 나눕니다. 현재 피드에는 최근 게시물만 넣고,
+그보다 오래된 게시물은 nttSn 순서로 ARCHIVE_PAGE_SIZE개씩 묶은 보관 페이지(<게시판>_archive_0001.<해시>.xml)에 씁니다.
+보관 페이지 이름에는 내용 해시(게시물, 피드 URL, 제목, 형식)가 들어가므로 한 번 쓴 페이지는 바뀌지 않고(클라이언트/CDN이 영구 캐시 가능),
+실행마다 바뀌는 파일은 현재 피드뿐입니다. 현재 피드에서 가장 최근 보관 페이지로, 각 보관 페이지에서 그 이전 페이지로
+prev-archive 링크가 이어집니다. 보관 페이지는 바뀌지 않아야 하므로 아직 없는 다음 페이지를 가리키는 next-archive 링크는 넣지 않습니다.
+
+보관 피드(generate_archive_feed)는 저장소의 게시물을 커서에서 하나씩 꺼내 직렬화하는 즉시 파일에 쓰므로,
+항목이 수만 개여도 메모리 사용량이 일정합니다.
+
+사용법:
+    python rss_feed_generator.py                                   # 학교별 공지/가정통신문/통합 피드 (RSS, Atom, JSON)
+    python rss_feed_generator.py --formats rss --output-dir feeds
+    python rss_feed_generator.py --base-url https://example.github.io/school-notice  # 피드 URL 지정
+    python rss_feed_generator.py --archive-page-size 50             # 보관 페이지 하나에 50개씩
+    python rss_feed_generator.py --archive archive.xml --format atom
+    python rss_feed_generator.py --archive shingal.json --format json --school shingal-m
 """
 
+import argparse
+import hashlib
 import json
 import os
 import logging
-from datetime import datetime, timezone
-from feedgen.feed import FeedGenerator
 import re
+from collections import namedtuple
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from functools import lru_cache
+from xml.sax.saxutils import escape, quoteattr
+
+from dotenv import load_dotenv
+
+import post_store
+
+# .env 파일 로드
+load_dotenv()
 
 # 로깅 설정
 logging.basicConfig(
@@ -21,154 +60,737 @@ logging.basicConfig(
     filemode='a'
 )
 
-def generate_rss_feed(json_file, output_file=None, feed_url=None):
+# 피드에 넣을 최근 게시물 수
+FEED_LIMIT = int(os.getenv("FEED_LIMIT", "50"))
+
+# 직렬화한 피드 항목 캐시 경로
+ENTRY_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'feeds')
+ENTRY_CACHE_VERSION = 3
+
+
+
+def _pages_url():
+    """
+    GitHub Actions에서 실행하면 저장소 이름으로 GitHub Pages 주소를 만듭니다 (그 밖에는 빈 문자열).
     """
-    크롤링된 JSON 파일을 RSS 피드로 변환합니다.
-    
+    owner, _, name = os.getenv("GITHUB_REPOSITORY", "").partition('/')
+    if not owner or not name:
+        return ""
+    if name.lower() == f"{owner.lower()}.github.io":
+        return f"https://{name.lower()}"
+    return f"https://{owner}.github.io/{name}"
+
+
+# 피드 파일이 게시되는 URL의 앞부분 (FEED_BASE_URL 환경 변수, 없으면 GitHub Pages 주소)
+FEED_BASE_URL = (os.getenv("FEED_BASE_URL") or _pages_url()).rstrip('/')
+FEED_LOGO = 'https://upload.wikimedia.org/wikipedia/commons/thumb/4/43/Feed-icon.svg/128px-Feed-icon.svg.png'
+
+# 보관 페이지 하나에 넣을 게시물 수
+ARCHIVE_PAGE_SIZE = int(os.getenv("FEED_ARCHIVE_PAGE_SIZE", "100"))
+# 보관 페이지의 날짜를 읽지 못한 게시물에 쓰는 시각 (페이지 내용이 실행 시각에 따라 바뀌지 않도록 고정)
+ARCHIVE_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+HISTORY_NS = "http://purl.org/syndication/history/1.0"
+
+# 통합 피드의 파일 이름과 제목에 쓰는 게시판 종류/이름
+COMBINED_KIND = "all"
+COMBINED_NAME = "공지사항·가정통신문"
+
+# 게시물 날짜에 나올 수 있는 형식
+DATE_FORMATS = (
+    '%Y-%m-%d',              # 2023-01-15
+    '%Y.%m.%d',              # 2023.01.15
+    '%Y/%m/%d',              # 2023/01/15
+    '%Y-%m-%d %H:%M',        # 2023-01-15 14:30
+    '%Y.%m.%d %H:%M',        # 2023.01.15 14:30
+    '%Y/%m/%d %H:%M',        # 2023/01/15 14:30
+    '%Y-%m-%d %H:%M:%S',     # 2023-01-15 14:30:45
+)
+
+DIGITS = re.compile(r'\d')
+
+# 모든 피드 형식이 공유하는 정규화된 항목
+#   id         - 고유 ID (상세 페이지 URL, 없으면 번호와 제목으로 만든 가상 URL)
+#   published  - 게시 시각 (UTC datetime, 날짜를 읽지 못하면 피드 갱신 시각)
+#   summary    - 요약 텍스트
+#   content    - 본문 HTML
+#   board      - 게시판 이름 (통합 피드에서 분류로 사용)
+FeedEntry = namedtuple('FeedEntry', ['id', 'title', 'link', 'author', 'date', 'published', 'summary', 'content',
+                                     'board'])
+
+
+@lru_cache(maxsize=64)
+def _date_format(shape):
+    """
+    날짜 문자열의 모양(숫자를 0으로 바꾼 것, 예: 0000-00-00)에 맞는 형식을 찾습니다.
+    모양별로 한 번만 형식을 시도하고 결과를 기억합니다.
+    """
+    sample = shape.replace('0', '1')
+    for fmt in DATE_FORMATS:
+        try:
+            datetime.strptime(sample, fmt)
+            return fmt
+        except ValueError:
+            continue
+    return None
+
+
+def parse_date(date_str):
+    """
+    게시물 날짜를 UTC datetime으로 변환합니다.
+
+    Returns:
+        datetime: 변환한 시각, 알 수 없는 형식이면 None
+    """
+    date_str = (date_str or '').strip()
+    fmt = _date_format(DIGITS.sub('0', date_str)) if date_str else None
+    if fmt is None:
+        return None
+    try:
+        return datetime.strptime(date_str, fmt).replace(tzinfo=timezone.utc)
+    except ValueError:
+        # 모양은 같지만 값이 잘못된 날짜 (예: 2023-13-45)
+        return None
+
+
+def _entry_key(notice, site_url):
+    # 고유 ID (URL이 있으면 URL 사용, 없으면 번호와 제목으로 생성)
+    if notice.get('url'):
+        return notice['url']
+    title_slug = re.sub(r'[^\w]', '-', notice.get('title', ''))
+    return f"{site_url}/notice/{notice.get('number', '')}-{title_slug}"
+
+
+def normalize_entry(notice, site_url, fallback_date, board_name=''):
+    """
+    저장소 게시물 하나를 모든 형식이 공유하는 FeedEntry로 정규화합니다.
+
     Args:
-        json_file (str): 크롤링된 공지사항 JSON 파일 경로
-        output_file (str, optional): 출력할 RSS 파일 경로, 없으면 기본 이름 사용
-        feed_url (str, optional): 피드 URL, 없으면 기본값 사용
-    
+        notice (dict): 게시물 dict
+        site_url (str): 게시판 목록 URL (링크가 없는 게시물에 사용)
+        fallback_date (datetime): 날짜를 읽지 못했을 때 사용할 시각
+        board_name (str): 게시판 이름
+
     Returns:
-        str: 생성된 RSS 파일 경로
+        FeedEntry: 정규화된 항목
     """
+    title = notice.get('title') or '제목 없음'
+    link = notice.get('url') or site_url
+    date = notice.get('date') or ''
+    author = notice.get('author') or ''
+    # 본문 (간단한 HTML 형식)
+    content = (
+        f"<div><h3>{escape(title)}</h3>"
+        f"<p>작성자: {escape(author or '정보 없음')}</p>"
+        f"<p>날짜: {escape(date or '정보 없음')}</p>"
+        f"<a href={quoteattr(link)}>원문 보기</a></div>"
+    )
+    return FeedEntry(
+        id=_entry_key(notice, site_url),
+        title=title,
+        link=link,
+        author=author,
+        date=date,
+        published=parse_date(date) or fallback_date,
+        summary=f"{title} - {date}",
+        content=content,
+        board=board_name
+    )
+
+
+def _rss_item(entry):
+    lines = [
+        "    <item>",
+        f"      <title>{escape(entry.title)}</title>",
+        f"      <link>{escape(entry.link)}</link>",
+        f"      <description>{escape(entry.summary)}</description>",
+        f"      <content:encoded>{escape(entry.content)}</content:encoded>",
+        f"      <guid isPermaLink=\"{'true' if entry.id == entry.link else 'false'}\">{escape(entry.id)}</guid>",
+        f"      <pubDate>{format_datetime(entry.published)}</pubDate>",
+    ]
+    if entry.author:
+        lines.append(f"      <dc:creator>{escape(entry.author)}</dc:creator>")
+    if entry.board:
+        lines.append(f"      <category>{escape(entry.board)}</category>")
+    lines.append("    </item>")
+    return '\n'.join(lines)
+
+
+def _atom_entry(entry):
+    published = entry.published.isoformat()
+    lines = [
+        "  <entry>",
+        f"    <id>{escape(entry.id)}</id>",
+        f"    <title>{escape(entry.title)}</title>",
+        f"    <link href={quoteattr(entry.link)}/>",
+        f"    <published>{published}</published>",
+        f"    <updated>{published}</updated>",
+    ]
+    if entry.author:
+        lines.append(f"    <author><name>{escape(entry.author)}</name></author>")
+    if entry.board:
+        lines.append(f"    <category term={quoteattr(entry.board)}/>")
+    lines += [
+        f"    <summary>{escape(entry.summary)}</summary>",
+        f"    <content type=\"html\">{escape(entry.content)}</content>",
+        "  </entry>",
+    ]
+    return '\n'.join(lines)
+
+
+def _json_item(entry):
+    item = {
+        "id": entry.id,
+        "url": entry.link,
+        "title": entry.title,
+        "summary": entry.summary,
+        "content_html": entry.content,
+        "date_published": entry.published.isoformat(),
+    }
+    if entry.author:
+        item["authors"] = [{"name": entry.author}]
+    if entry.board:
+        item["tags"] = [entry.board]
+    return "    " + json.dumps(item, ensure_ascii=False)
+
+
+# 머리 함수의 links는 RFC 5005 링크 [(rel, URL)] (current, prev-archive),
+# archive는 보관 페이지 여부입니다
+
+def _rss_head(title, site_url, feed_url, updated, links=(), archive=False):
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom" '
+        'xmlns:content="http://purl.org/rss/1.0/modules/content/" xmlns:dc="http://purl.org/dc/elements/1.1/" '
+        f'xmlns:fh="{HISTORY_NS}">',
+        '  <channel>',
+        f'    <title>{escape(title)}</title>',
+        f'    <link>{escape(site_url)}</link>',
+        f'    <description>{escape(title)} 자동 피드</description>',
+        f'    <atom:link href={quoteattr(feed_url)} rel="self" type="application/rss+xml"/>',
+    ]
+    lines += [f'    <atom:link href={quoteattr(href)} rel="{rel}" type="application/rss+xml"/>' for rel, href in links]
+    if archive:
+        lines.append('    <fh:archive/>')
+    lines += [
+        '    <language>ko</language>',
+        f'    <lastBuildDate>{format_datetime(updated)}</lastBuildDate>',
+        f'    <image><url>{escape(FEED_LOGO)}</url><title>{escape(title)}</title><link>{escape(site_url)}</link></image>',
+    ]
+    return '\n'.join(lines)
+
+
+def _atom_head(title, site_url, feed_url, updated, links=(), archive=False):
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        f'<feed xmlns="http://www.w3.org/2005/Atom" xmlns:fh="{HISTORY_NS}" xml:lang="ko">',
+        f'  <id>{escape(feed_url)}</id>',
+        f'  <title>{escape(title)}</title>',
+        f'  <subtitle>{escape(title)} 자동 피드</subtitle>',
+        f'  <link href={quoteattr(site_url)} rel="alternate"/>',
+        f'  <link href={quoteattr(feed_url)} rel="self"/>',
+    ]
+    lines += [f'  <link href={quoteattr(href)} rel="{rel}"/>' for rel, href in links]
+    if archive:
+        lines.append('  <fh:archive/>')
+    lines += [
+        f'  <updated>{updated.isoformat()}</updated>',
+        f'  <logo>{escape(FEED_LOGO)}</logo>',
+    ]
+    return '\n'.join(lines)
+
+
+def _json_head(title, site_url, feed_url, updated, links=(), archive=False):
+    feed = {
+        "version": "https://jsonfeed.org/version/1.1",
+        "title": title,
+        "home_page_url": site_url,
+        "feed_url": feed_url,
+        "description": f"{title} 자동 피드",
+        "icon": FEED_LOGO,
+        "language": "ko",
+    }
+    links = dict(links)
+    if 'prev-archive' in links:
+        # JSON Feed의 next_url은 더 오래된 항목이 있는 페이지를 가리킵니다
+        feed["next_url"] = links['prev-archive']
+    if links or archive:
+        feed["_history"] = {"archive": archive, **{rel.replace('-', '_'): href for rel, href in links.items()}}
+    head = json.dumps(feed, ensure_ascii=False, indent=2)
+    # 마지막 닫는 중괄호 대신 items 배열을 열어 항목을 이어 씁니다
+    return head[:-2] + ',\n  "items": ['
+
+
+# 피드 형식
+#   head      - (제목, 사이트 URL, 피드 URL, 갱신 시각, RFC 5005 링크, 보관 페이지 여부) -> 머리 문자열
+#   item      - FeedEntry -> 항목 문자열
+#   separator - 항목 사이 구분자
+#   tail      - 꼬리 (닫는 태그)
+#   suffix    - 출력 파일 이름 끝
+FeedFormat = namedtuple('FeedFormat', ['head', 'item', 'separator', 'tail', 'suffix'])
+
+FEED_FORMATS = {
+    "rss": FeedFormat(_rss_head, _rss_item, '\n', '  </channel>\n</rss>\n', '_feed.xml'),
+    "atom": FeedFormat(_atom_head, _atom_entry, '\n', '</feed>\n', '_feed.atom'),
+    "json": FeedFormat(_json_head, _json_item, ',\n', '  ]\n}\n', '_feed.json'),
+}
+
+
+def _site_slug(site_name):
+    return site_name.replace('.', '_').replace(' ', '_')
+
+
+def _base_url(feed_base_url=None):
+    """
+    피드 URL의 앞부분을 정합니다. 인자, FEED_BASE_URL 순으로 쓰고 둘 다 없으면 오류입니다.
+
+    Raises:
+        ValueError: 피드 URL을 정할 수 없는 경우
+    """
+    base_url = (feed_base_url or FEED_BASE_URL).rstrip('/')
+    if not base_url:
+        raise ValueError("피드 URL이 설정되지 않았습니다. FEED_BASE_URL 환경 변수나 --base-url 옵션을 지정하세요.")
+    return base_url
+
+
+def feed_path(board, fmt="rss", output_dir=''):
+    """
+    게시판의 기본 피드 파일 경로를 반환합니다 (예: 신갈중학교_notices_feed.xml).
+    """
+    site_name = board['school_name'] or board['school_id']
+    return os.path.join(output_dir, f"{_site_slug(site_name)}_{board['kind']}{FEED_FORMATS[fmt].suffix}")
+
+
+def write_feed(output_file, head, items, tail, separator='\n'):
+    """
+    피드 머리, 항목, 꼬리를 임시 파일에 차례로 쓰고 원자적으로 교체합니다.
+    items는 생성기여도 되며, 항목 하나를 직렬화하는 즉시 쓰므로 전체 문서를 메모리에 만들지 않습니다.
+
+    Args:
+        output_file (str): 출력 파일 경로
+        head (str): 머리 (XML 선언과 채널/피드 정보)
+        items (iterable): 직렬화한 항목 문자열
+        tail (str): 꼬리 (닫는 태그)
+        separator (str): 항목 사이 구분자
+
+    Returns:
+        int: 쓴 항목 수
+    """
+    directory = os.path.dirname(output_file)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    count = 0
+    tmp_path = f"{output_file}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(head)
+        for item in items:
+            f.write(separator if count else '\n')
+            f.write(item)
+            count += 1
+        f.write('\n')
+        f.write(tail)
+    os.replace(tmp_path, output_file)
+    return count
+
+
+def _write_atomic(path, text):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def _entry_cache_path(board):
+    return os.path.join(ENTRY_CACHE_DIR, f"{os.path.basename(feed_path(board))[:-len('.xml')]}.json")
+
+
+def _read_entry_cache(board):
     try:
-        # JSON 파일 로드
-        with open(json_file, 'r', encoding='utf-8') as f:
+        with open(_entry_cache_path(board), 'r', encoding='utf-8') as f:
             data = json.load(f)
-        
-        # 사이트 정보 추출
-        site_name = data['meta']['source']
-        site_url = data['meta']['url']
-        
-        # 출력 파일 이름 설정
-        if not output_file:
-            output_file = f"{site_name.replace('.', '_').replace(' ', '_')}_feed.xml"
-        
-        # 피드 생성기 초기화
-        fg = FeedGenerator()
-        
-        # 피드 기본 정보 설정
-        fg.id(site_url)
-        fg.title(f'{site_name} 공지사항')
-        fg.subtitle(f'{site_name} 공지사항 자동 피드')
-        fg.link(href=site_url, rel='alternate')
-        
-        # 피드 URL이 제공된 경우 self 링크 추가
-        if feed_url:
-            fg.link(href=feed_url, rel='self')
+    except (OSError, ValueError):
+        return {}
+    if data.get('version') != ENTRY_CACHE_VERSION or data.get('url') != board['url']:
+        return {}
+    return data
+
+
+def _load_entries(board):
+    """
+    이전 실행에서 형식별로 직렬화한 항목을 {항목 키: {"hash", "published", 형식...}}로 읽어옵니다.
+    """
+    return {entry['key']: entry for entry in _read_entry_cache(board).get('entries', [])}
+
+
+def _updated_time(board):
+    # 최종 업데이트 시간 (마지막 크롤링 시각)
+    last_run = board['last_run'] or {}
+    return datetime.strptime(last_run.get('finished_at') or datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                             '%Y-%m-%d %H:%M:%S').replace(tzinfo=timezone.utc)
+
+
+def _board_entries(board, limit=FEED_LIMIT, formats=tuple(FEED_FORMATS), state=None):
+    """
+    게시판의 최근 게시물을 한 번 읽어 형식별로 직렬화한 항목 목록을 만듭니다.
+    내용 해시가 같은 게시물은 이전 실행의 직렬화 결과를 그대로 쓰고, 나머지만 정규화/직렬화합니다.
+    state({"revision", "base_url", "page_size", "pages", "remainder"})를 주면 항목 캐시에 함께 기록해
+    다음 실행에서 변경 여부를 판단하고 보관 페이지 경계를 다시 계산하지 않습니다.
+
+    Returns:
+        tuple: (항목 목록 [{"key", "hash", "published", 형식: 문자열}], 새로 직렬화한 수)
+    """
+    notices = post_store.load_posts(board['url'], limit=limit, pinned_first=False)
+    updated = _updated_time(board)
+    cached = _load_entries(board)
+
+    entries = []
+    serialized = 0
+    for notice in notices:
+        key = _entry_key(notice, board['url'])
+        digest = post_store.row_hash(notice)
+        entry = cached.get(key)
+        if entry is None or entry['hash'] != digest or any(fmt not in entry for fmt in formats):
+            normalized = normalize_entry(notice, board['url'], updated, board['name'])
+            entry = {"key": key, "hash": digest, "published": normalized.published.isoformat()}
+            entry.update((fmt, FEED_FORMATS[fmt].item(normalized)) for fmt in formats)
+            serialized += 1
+        entries.append(entry)
+
+    _write_atomic(_entry_cache_path(board), json.dumps(
+        {"version": ENTRY_CACHE_VERSION, "url": board['url'], **(state or {}), "entries": entries},
+        ensure_ascii=False))
+    return entries, serialized
+
+
+def _write_formats(base_path, title, site_url, updated, entries, formats, feed_base_url, links=None):
+    """
+    직렬화한 항목 목록을 형식마다 파일 하나로 씁니다.
+
+    Args:
+        links (callable, optional): 형식 -> RFC 5005 링크 [(rel, URL)]
+
+    Returns:
+        list: 생성한 파일 경로
+    """
+    written = []
+    for fmt in formats:
+        feed_format = FEED_FORMATS[fmt]
+        output_file = base_path + feed_format.suffix
+        feed_url = f"{feed_base_url}/{os.path.basename(output_file)}"
+        write_feed(output_file, feed_format.head(title, site_url, feed_url, updated, links(fmt) if links else ()),
+                   (entry[fmt] for entry in entries), feed_format.tail, feed_format.separator)
+        written.append(output_file)
+    return written
+
+
+def _board_title(board):
+    site_name = board['school_name'] or board['school_id']
+    return f"{site_name} {board['name'] or '공지사항'}"
+
+
+def _archive_name(base_name, page, fmt, feed_base_url, title):
+    """
+    보관 페이지 파일 이름 (예: 신갈중학교_notices_archive_0003.1a2b3c4d5e.xml).
+    이름의 해시는 게시물 해시 사슬에 형식, 피드 URL, 제목을 더한 값이므로
+    파일 안에 들어가는 내용이 하나라도 바뀌면 이름도 바뀝니다.
+    """
+    extension = os.path.splitext(FEED_FORMATS[fmt].suffix)[1]
+    digest = hashlib.sha1(f"{page['digest']}\0{fmt}\0{feed_base_url}\0{title}".encode('utf-8')).hexdigest()
+    return f"{base_name}_archive_{page['index']:04d}.{digest[:10]}{extension}"
+
+
+def archive_pages(board_url, page_size=ARCHIVE_PAGE_SIZE):
+    """
+    게시판의 게시물을 오래된 것부터 page_size개씩 나눈 보관 페이지 목록을 계산합니다.
+    가득 찬 페이지만 보관하며, 각 페이지의 해시는 이전 페이지 해시와 게시물 (nttSn, row_hash)로 정해지므로
+    새 게시물이 추가되어도 이미 보관한 페이지의 해시는 바뀌지 않습니다.
+
+    Returns:
+        tuple: ([{"index", "digest", "first", "last"}], 보관되지 않은 최신 게시물 수)
+               digest는 게시물 해시 사슬이며, 파일 이름은 _archive_name()이 정합니다
+    """
+    rows = post_store.post_hashes(board_url)
+    pages = []
+    previous = ''
+    for index, start in enumerate(range(0, len(rows) - page_size + 1, page_size), 1):
+        chunk = rows[start:start + page_size]
+        h = hashlib.sha1(previous.encode('ascii'))
+        for ntt_sn, digest in chunk:
+            h.update(f"{ntt_sn}:{digest};".encode('ascii'))
+        previous = h.hexdigest()
+        pages.append({"index": index, "digest": previous, "first": chunk[0][0], "last": chunk[-1][0]})
+    return pages, len(rows) - len(pages) * page_size
+
+
+def _write_archives(board, base_path, pages, formats, feed_base_url, current_name):
+    """
+    아직 쓰지 않은 보관 페이지만 씁니다. 이름에 내용 해시가 들어가므로 같은 이름의 파일이 있으면 내용도 같습니다.
+    더 이상 쓰이지 않는 보관 페이지(예: 오래된 게시물이 수정되어 해시가 바뀐 경우)는 지웁니다.
+
+    Returns:
+        list: 새로 쓴 파일 경로
+    """
+    output_dir = os.path.dirname(base_path)
+    base_name = os.path.basename(base_path)
+    title = _board_title(board)
+    url = lambda name: f"{feed_base_url}/{name}"
+
+    written = []
+    keep = set()
+    for position, page in enumerate(pages):
+        entries = None
+        for fmt in formats:
+            name = _archive_name(base_name, page, fmt, feed_base_url, title)
+            keep.add(name)
+            path = os.path.join(output_dir, name)
+            if os.path.exists(path):
+                continue
+            if entries is None:
+                posts = post_store.load_post_range(board['url'], page['first'], page['last'])
+                entries = [normalize_entry(post, board['url'], ARCHIVE_EPOCH, board['name']) for post in posts]
+
+            links = [("current", url(current_name(fmt)))]
+            if position > 0:
+                links.append(("prev-archive", url(_archive_name(base_name, pages[position - 1], fmt, feed_base_url,
+                                                                title))))
+
+            feed_format = FEED_FORMATS[fmt]
+            updated = max((entry.published for entry in entries), default=ARCHIVE_EPOCH)
+            head = feed_format.head(title, board['url'], url(name), updated, links, archive=True)
+            write_feed(path, head, (feed_format.item(entry) for entry in entries), feed_format.tail,
+                       feed_format.separator)
+            written.append(path)
+
+    prefix = f"{base_name}_archive_"
+    for name in os.listdir(output_dir or '.'):
+        if name.startswith(prefix) and name not in keep and not name.endswith('.tmp'):
+            os.remove(os.path.join(output_dir, name))
+    return written
+
+
+def generate_school_feeds(boards, output_dir='', limit=FEED_LIMIT, formats=tuple(FEED_FORMATS),
+                          feed_base_url=None, page_size=ARCHIVE_PAGE_SIZE):
+    """
+    한 학교의 게시판별 피드와 통합 피드를 모든 형식으로 생성합니다.
+    게시판마다 저장소를 한 번만 읽고, 통합 피드는 게시판별로 직렬화한 항목을 그대로 합칩니다.
+    게시판별 피드에서 현재 피드에 들어가지 않는 오래된 게시물은 보관 페이지로 나누어 씁니다.
+
+    Args:
+        boards (list): 같은 학교의 게시판 (post_store.get_board() 결과)
+        output_dir (str): 출력 디렉터리
+        limit (int): 현재 피드에 넣을 최소 최근 게시물 수
+        formats (iterable): 생성할 형식 (rss, atom, json)
+        feed_base_url (str, optional): 피드 파일이 게시되는 URL의 앞부분, 없으면 FEED_BASE_URL
+        page_size (int): 보관 페이지 하나의 게시물 수, 0이면 보관 페이지를 만들지 않음
+
+    Returns:
+        list: 생성한 파일 경로
+    """
+    feed_base_url = _base_url(feed_base_url)
+    written = []
+    combined = []
+    for board in boards:
+        site_name = board['school_name'] or board['school_id']
+        title = _board_title(board)
+        base_path = feed_path(board, output_dir=output_dir)[:-len(FEED_FORMATS['rss'].suffix)]
+        current_name = lambda fmt, board=board: os.path.basename(feed_path(board, fmt))
+
+        cache = _read_entry_cache(board)
+        if not page_size:
+            pages, remainder = [], 0
+        elif cache.get('revision') == board['revision'] and cache.get('page_size') == page_size:
+            # 마지막 생성 이후 게시물이 바뀌지 않았으면 저장소를 훑지 않고 보관 페이지 경계를 그대로 씁니다
+            pages, remainder = cache['pages'], cache['remainder']
+        else:
+            pages, remainder = archive_pages(board['url'], page_size)
+        state = {"revision": board['revision'], "base_url": feed_base_url, "page_size": page_size,
+                 "pages": pages, "remainder": remainder}
+        # 현재 피드는 최근 limit개 이상, 아직 보관 페이지에 들어가지 않은 게시물은 모두 포함합니다
+        entries, serialized = _board_entries(board, max(limit, remainder), formats, state)
+        if pages:
+            written += _write_archives(board, base_path, pages, formats, feed_base_url, current_name)
+            newest = pages[-1]
+            links = lambda fmt, newest=newest, base_name=os.path.basename(base_path), title=title: [
+                ("prev-archive", f"{feed_base_url}/{_archive_name(base_name, newest, fmt, feed_base_url, title)}")
+            ]
         else:
-            # 기본 feed_url 생성
-            feed_url = f"http://localhost:5000/feeds/{output_file}"
-            fg.link(href=feed_url, rel='self')
-        
-        fg.language('ko')
-        fg.author({'name': site_name})
-        fg.logo('https://upload.wikimedia.org/wikipedia/commons/thumb/4/43/Feed-icon.svg/128px-Feed-icon.svg.png')
-        
-        # 최종 업데이트 시간 (타임존 추가)
-        update_time = datetime.strptime(data['meta']['last_updated'], '%Y-%m-%d %H:%M:%S')
-        update_time = update_time.replace(tzinfo=timezone.utc)  # UTC 타임존 추가
-        fg.updated(update_time)
-        
-        # 공지사항을 피드 항목으로 추가
-        for notice in data['notices']:
-            fe = fg.add_entry()
-            
-            # 고유 ID 설정 (URL이 있으면 URL 사용, 없으면 번호와 제목으로 생성)
-            if notice.get('url'):
-                fe.id(notice['url'])
-            else:
-                # 제목과 번호로 가상 ID 생성
-                notice_id = f"{site_url}/notice/{notice.get('number', '')}-{re.sub(r'[^\w]', '-', notice.get('title', ''))}"
-                fe.id(notice_id)
-            
-            # 제목 설정
-            fe.title(notice.get('title', '제목 없음'))
-            
-            # 링크 설정
-            if notice.get('url'):
-                fe.link(href=notice['url'])
-            else:
-                fe.link(href=site_url)
-            
-            # 본문 생성 (간단한 HTML 형식)
-            content = f"""
-            <div>
-                <h3>{notice.get('title', '제목 없음')}</h3>
-                <p>작성자: {notice.get('author', '정보 없음')}</p>
-                <p>날짜: {notice.get('date', '정보 없음')}</p>
-                <p>조회수: {notice.get('views', '정보 없음')}</p>
-                <a href="{notice.get('url', site_url)}">원문 보기</a>
-            </div>
-            """
-            fe.content(content, type='html')
-            
-            # 요약
-            fe.summary(f"{notice.get('title', '제목 없음')} - {notice.get('date', '')}")
-            
-            # 날짜 변환 시도
-            try:
-                # 다양한 날짜 형식 처리
-                date_str = notice.get('date', '')
-                date_formats = [
-                    '%Y-%m-%d',              # 2023-01-15
-                    '%Y.%m.%d',              # 2023.01.15
-                    '%Y/%m/%d',              # 2023/01/15
-                    '%Y-%m-%d %H:%M',        # 2023-01-15 14:30
-                    '%Y.%m.%d %H:%M',        # 2023.01.15 14:30
-                    '%Y/%m/%d %H:%M',        # 2023/01/15 14:30
-                    '%Y-%m-%d %H:%M:%S',     # 2023-01-15 14:30:45
-                ]
-                
-                parsed_date = None
-                for fmt in date_formats:
-                    try:
-                        parsed_date = datetime.strptime(date_str, fmt)
-                        break
-                    except ValueError:
-                        continue
-                
-                if parsed_date:
-                    # 타임존 정보 추가
-                    parsed_date = parsed_date.replace(tzinfo=timezone.utc)
-                    fe.published(parsed_date)
-                    fe.updated(parsed_date)
-                else:
-                    # 날짜 파싱 실패시 현재 시간 사용 (타임존 정보 추가)
-                    now = datetime.now(timezone.utc)
-                    fe.published(now)
-                    fe.updated(now)
-            except Exception as e:
-                logging.warning(f"날짜 변환 실패: {e}")
-                # 현재 시간 사용 (타임존 정보 추가)
-                now = datetime.now(timezone.utc)
-                fe.published(now)
-                fe.updated(now)
-            
-            # 작성자 정보
-            if notice.get('author'):
-                fe.author({'name': notice.get('author')})
-        
-        # RSS 파일 생성
-        fg.rss_file(output_file, pretty=True)
+            links = None
+
+        written += _write_formats(base_path, title, board['url'],
+                                  _updated_time(board), entries, formats, feed_base_url, links)
+        combined += entries[:limit]
+        logging.info(f"{site_name} {board['name']} 피드 생성 완료 (항목 {len(entries)}개, 새로 직렬화 {serialized}개, "
+                     f"보관 페이지 {len(pages)}개)")
+
+    if len(boards) > 1:
+        # 통합 피드: 게시판별 항목을 게시 시각 순으로 합쳐 창 크기만큼 남깁니다
+        combined.sort(key=lambda entry: (entry['published'], entry['key']), reverse=True)
+        first = boards[0]
+        site_name = first['school_name'] or first['school_id']
+        base_path = os.path.join(output_dir, f"{_site_slug(site_name)}_{COMBINED_KIND}")
+        updated = max(_updated_time(board) for board in boards)
+        homepage = first['url'].split('/na/')[0]
+        written += _write_formats(base_path, f"{site_name} {COMBINED_NAME}", homepage, updated,
+                                  combined[:limit], formats, feed_base_url)
+    return written
+
+
+def generate_feeds(school_id=None, output_dir='', limit=FEED_LIMIT, formats=tuple(FEED_FORMATS),
+                   feed_base_url=None, only_changed=False, page_size=ARCHIVE_PAGE_SIZE):
+    """
+    저장소에 등록된 학교마다 게시판별/통합 피드를 생성합니다.
+
+    Args:
+        school_id (str, optional): 학교 ID로 제한
+        output_dir (str): 출력 디렉터리
+        limit (int): 피드마다 넣을 최근 게시물 수
+        formats (iterable): 생성할 형식
+        feed_base_url (str, optional): 피드 파일이 게시되는 URL의 앞부분, 없으면 FEED_BASE_URL
+        only_changed (bool): True이면 마지막 피드 생성 이후 저장소의 게시물이 바뀌지 않았고 피드가 이미 있는 학교는 건너뜁니다
+        page_size (int): 보관 페이지 하나의 게시물 수, 0이면 보관 페이지를 만들지 않음
+
+    Returns:
+        dict: {학교 ID: 생성한 파일 경로 목록 (건너뛴 학교는 None)}
+    """
+    feed_base_url = _base_url(feed_base_url)
+    schools = {}
+    for board in post_store.list_boards():
+        if school_id and board['school_id'] != school_id:
+            continue
+        schools.setdefault(board['school_id'], []).append(post_store.get_board(board['url']))
+
+    results = {}
+    for sid, boards in schools.items():
+        if only_changed and _unchanged(boards, output_dir, formats, feed_base_url, page_size):
+            results[sid] = None
+            continue
+        results[sid] = generate_school_feeds(boards, output_dir, limit, formats, feed_base_url, page_size)
+    return results
+
+
+def _unchanged(boards, output_dir, formats, feed_base_url, page_size):
+    """
+    마지막 피드 생성 때 기록한 게시판 변경 번호와 설정이 모든 게시판에서 지금과 같으면 True입니다.
+    변경 번호는 게시물이 저장될 때 올라가므로 피드 생성 사이에 크롤링이 여러 번 있었어도 변경을 놓치지 않고,
+    게시물 수와 관계없이 게시판마다 작은 파일 하나만 읽습니다.
+    """
+    for board in boards:
+        if not all(os.path.exists(feed_path(board, fmt, output_dir)) for fmt in formats):
+            return False
+        cache = _read_entry_cache(board)
+        if (cache.get('revision') != board['revision'] or cache.get('base_url') != feed_base_url
+                or cache.get('page_size') != page_size):
+            return False
+    return True
+
+
+def generate_rss_feed(board_url, output_file=None, feed_url=None, limit=FEED_LIMIT):
+    """
+    저장소에 있는 게시판 하나의 게시물을 RSS 피드로 변환합니다.
+    이전 실행에서 직렬화한 항목은 다시 만들지 않고, 새로 생기거나 바뀐 게시물만 직렬화합니다.
+
+    Args:
+        board_url (str): 게시판 목록 페이지 URL (저장소의 게시판 키)
+        output_file (str, optional): 출력할 RSS 파일 경로, 없으면 기본 이름 사용
+        feed_url (str, optional): 피드 URL, 없으면 FEED_BASE_URL 아래의 파일 이름
+        limit (int): 피드에 넣을 최근 게시물 수 (창 크기)
+
+    Returns:
+        str: 생성된 RSS 파일 경로
+    """
+    try:
+        board = post_store.get_board(board_url)
+        if board is None:
+            logging.error(f"저장소에 없는 게시판입니다: {board_url}")
+            return None
+        output_file = output_file or feed_path(board)
+        feed_url = feed_url or f"{_base_url()}/{os.path.basename(output_file)}"
+
+        entries, _ = _board_entries(board, limit)
+        rss = FEED_FORMATS['rss']
+        write_feed(output_file, rss.head(_board_title(board), board['url'], feed_url, _updated_time(board)),
+                   (entry['rss'] for entry in entries), rss.tail, rss.separator)
         logging.info(f"RSS 피드 생성 완료: {output_file}")
-        
         return output_file
-        
+
     except Exception as e:
         logging.error(f"RSS 피드 생성 중 오류 발생: {e}")
         return None
 
-if __name__ == "__main__":
-    # JSON 파일 목록 찾기
-    json_files = [f for f in os.listdir('.') if f.endswith('_notices_api.json')]
-    
-    for json_file in json_files:
-        print(f"'{json_file}' 파일을 RSS 피드로 변환 중...")
-        output_file = generate_rss_feed(json_file)
-        if output_file:
-            print(f"RSS 피드 생성 완료: {output_file}")
+
+def generate_archive_feed(output_file, fmt="rss", board_url=None, school_id=None, title=None, feed_url=None,
+                          posts=None):
+    """
+    저장소의 게시물 전체(또는 학교/게시판 하나)를 보관 피드로 씁니다.
+    게시물을 하나씩 읽어 직렬화하는 즉시 파일에 쓰므로 항목 수와 관계없이 메모리 사용량이 일정합니다.
+
+    Args:
+        output_file (str): 출력 파일 경로
+        fmt (str): 피드 형식 (rss, atom, json)
+        board_url (str, optional): 게시판 목록 URL로 제한
+        school_id (str, optional): 학교 ID로 제한
+        title (str, optional): 피드 제목, 없으면 "게시물 보관함"
+        feed_url (str, optional): 피드 URL, 없으면 FEED_BASE_URL 아래의 파일 이름
+        posts (iterable, optional): 저장소 대신 사용할 게시물 (post_store.iter_posts()와 같은 형태)
+
+    Returns:
+        int: 쓴 항목 수
+    """
+    feed_format = FEED_FORMATS[fmt]
+    title = title or "게시물 보관함"
+    feed_url = feed_url or f"{_base_url()}/{os.path.basename(output_file)}"
+    site_url = board_url or feed_url
+    updated = datetime.now(timezone.utc).replace(microsecond=0)
+    if posts is None:
+        posts = post_store.iter_posts(board_url, school_id)
+
+    def items():
+        for post in posts:
+            entry = normalize_entry(post, post.get('board_url') or site_url, updated, post.get('board_name', ''))
+            yield feed_format.item(entry)
+
+    count = write_feed(output_file, feed_format.head(title, site_url, feed_url, updated), items(),
+                       feed_format.tail, feed_format.separator)
+    logging.info(f"보관 피드 생성 완료: {output_file} ({fmt}, 항목 {count}개)")
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="게시물 저장소의 게시판을 RSS/Atom/JSON 피드로 변환")
+    parser.add_argument("--limit", type=int, default=FEED_LIMIT, help="피드에 넣을 최근 게시물 수")
+    parser.add_argument("--formats", nargs="+", choices=list(FEED_FORMATS), default=list(FEED_FORMATS),
+                        help="생성할 피드 형식")
+    parser.add_argument("--output-dir", default='', help="피드 출력 디렉터리 (기본값: 현재 디렉터리)")
+    parser.add_argument("--school", help="학교 ID로 제한")
+    parser.add_argument("--base-url", default=FEED_BASE_URL,
+                        help="피드 파일이 게시되는 URL의 앞부분 (기본값: FEED_BASE_URL 환경 변수 또는 GitHub Pages 주소)")
+    parser.add_argument("--archive-page-size", type=int, default=ARCHIVE_PAGE_SIZE,
+                        help="보관 페이지 하나의 게시물 수 (0이면 보관 페이지를 만들지 않음)")
+    parser.add_argument("--archive", metavar="OUTPUT", help="저장소의 모든 게시물을 보관 피드 하나로 출력")
+    parser.add_argument("--format", choices=list(FEED_FORMATS), default="rss", help="보관 피드 형식")
+    args = parser.parse_args()
+    try:
+        base_url = _base_url(args.base_url)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.archive:
+        count = generate_archive_feed(args.archive, args.format, school_id=args.school,
+                                      feed_url=f"{base_url}/{os.path.basename(args.archive)}")
+        print(f"보관 피드 생성 완료: {args.archive} (항목 {count}개)")
+        return
+
+    # 마지막 피드 생성 이후 게시물이 바뀌지 않은 학교는 기존 피드를 그대로 둡니다
+    results = generate_feeds(args.school, args.output_dir, args.limit, args.formats, base_url,
+                             only_changed=True, page_size=args.archive_page_size)
+    for school_id, written in results.items():
+        if written is None:
+            print(f"[{school_id}] 변경 없음, 피드 유지")
         else:
-            print(f"RSS 피드 생성 실패: {json_file}") 
\ No newline at end of file
+            print(f"[{school_id}] 피드 {len(written)}개 생성: {', '.join(written)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+학교 설정
+schools.json에 등록된 학교 목록(홈페이지 게시판 ID, NEIS 학교 코드)을 읽어오는 모듈입니다.
+기본 경로 대신 다른 설정 파일을 쓰려면 SCHOOLS_CONFIG 환경변수에 경로를 지정합니다.
+"""
+
+import json
+import os
+from collections import namedtuple
+
+CONFIG_PATH = os.getenv(
+    "SCHOOLS_CONFIG",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'schools.json')
+)
+
+# 학교 하나
+#   id         - 학교 홈페이지 사이트 ID (예: shingal-m), 결과 파일 이름에도 사용
+#   homepage   - 학교 홈페이지 주소 (예: https://shingal-m.goeyi.kr/shingal-m)
+#   atpt_code  - NEIS 시도교육청 코드 (예: J10 경기도교육청)
+#   neis_code  - NEIS 학교 코드
+#   boards     - {게시판 종류: {"mi", "bbs_id"}} (게시판 종류는 notices, letters)
+School = namedtuple('School', ['id', 'name', 'homepage', 'atpt_code', 'neis_code', 'boards'])
+
+LIST_PATH = "/na/ntt/selectNttList.do"
+
+_cache = {}
+
+
+def _load(path):
+    path = path or CONFIG_PATH
+    if path not in _cache:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        schools = [
+            School(
+                id=entry['id'],
+                name=entry['name'],
+                homepage=entry['homepage'].rstrip('/'),
+                atpt_code=entry.get('atpt_code', 'J10'),
+                neis_code=entry.get('neis_code', ''),
+                boards=entry.get('boards', {})
+            )
+            for entry in data['schools']
+        ]
+        _cache[path] = (data.get('default') or schools[0].id, schools)
+    return _cache[path]
+
+
+def load_schools(path=None):
+    """
+    설정 파일의 모든 학교를 읽어옵니다.
+
+    Args:
+        path (str, optional): 설정 파일 경로, 없으면 CONFIG_PATH
+
+    Returns:
+        list: School 목록
+    """
+    return list(_load(path)[1])
+
+
+def get_school(school_id=None, path=None):
+    """
+    학교 하나를 찾습니다.
+
+    Args:
+        school_id (str, optional): 학교 ID, 없으면 설정 파일의 기본 학교
+        path (str, optional): 설정 파일 경로
+
+    Returns:
+        School: 학교 설정
+
+    Raises:
+        KeyError: 설정 파일에 없는 학교인 경우
+    """
+    default_id, schools = _load(path)
+    school_id = school_id or default_id
+    for school in schools:
+        if school.id == school_id:
+            return school
+    raise KeyError(f"schools.json에 없는 학교입니다: {school_id}")
+
+
+def board_url(school, board):
+    """
+    학교 게시판 목록 페이지 URL을 만듭니다.
+
+    Args:
+        school (School): 학교 설정
+        board (str): 게시판 종류 (notices, letters)
+
+    Returns:
+        str: 목록 페이지 URL, 게시판이 설정되지 않았으면 None
+    """
+    ids = school.boards.get(board)
+    if not ids:
+        return None
+    return f"{school.homepage}{LIST_PATH}?mi={ids['mi']}&bbsId={ids['bbs_id']}"
@@ -1,9 +1,14 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import requests
-from datetime import datetime, timedelta
+import http_client
+import page_templates
+import school_config
+import site_build
+from datetime import datetime
 import calendar
+from collections import namedtuple
+from functools import lru_cache
 import os
 import json
 from dotenv import load_dotenv
@@ -13,9 +18,27 @@ load_dotenv()
 
 # 학교 및 API 정보
 API_KEY = os.getenv("NEIS_API_KEY", "dafe93db7c0d4c6eb8ba9a8f5aaee96b")  # 환경변수에서 가져오거나 기본값 사용
-ATPT_OFCDC_SC_CODE = "J10"  # 경기도교육청
-SD_SCHUL_CODE = "7751033"   # 신갈중학교
-SCHOOL_NAME = "신갈중학교"
+SCHOOL = school_config.get_school()  # schools.json의 기본 학교
+ATPT_OFCDC_SC_CODE = SCHOOL.atpt_code
+SD_SCHUL_CODE = SCHOOL.neis_code
+SCHOOL_NAME = SCHOOL.name
+
+WEEK_NAMES = ['월', '화', '수', '목', '금', '토', '일']
+
+# 달력의 하루
+#   day      - 날짜 (1~31)
+#   date     - YYYYMMDD (학사일정의 AA_YMD와 같은 형식)
+#   label    - 일정 목록에 표시하는 날짜 (YYYY.MM.DD)
+#   weekday  - 요일 이름 (월~일)
+#   sunday   - 일요일이면 True
+#   events   - 그날의 일정 이름 목록
+CalendarDay = namedtuple('CalendarDay', ['day', 'date', 'label', 'weekday', 'sunday', 'events'])
+
+# 한 달 달력 (한 줄 달력, 표 달력, 일정 목록이 모두 이 모델 하나로 렌더링됩니다)
+#   days     - CalendarDay 목록 (1일부터)
+#   weeks    - 월요일부터 시작하는 주 단위 표 (앞뒤 빈 칸은 None)
+#   parts    - 날짜순 일정 목록 [(CalendarDay, 일정 이름)]을 화면 열 수에 맞게 나눈 목록
+MonthCalendar = namedtuple('MonthCalendar', ['year', 'month', 'days', 'weeks', 'parts'])
 
 # JSON 파일에서 학사일정 가져오기 함수
 def get_schedule_from_json(year, month):
@@ -73,15 +96,21 @@ def get_schedule_from_api(api_key, atpt_code, school_code, year, month):
         "pSize": 100
     }
     try:
-        response = requests.get(base_url, params=params)
+        response = http_client.get(base_url, params=params)
         data = response.json()
         if 'SchoolSchedule' not in data:
+            # INFO-200은 해당 기간에 일정이 없다는 뜻이고, 그 외 코드는 API 오류입니다
+            code = data.get('RESULT', {}).get('CODE', '')
+            if code and code != 'INFO-200':
+                print(f"학사일정 API 오류: {code} {data['RESULT'].get('MESSAGE', '')}")
+                return None
             return []
         rows = data['SchoolSchedule'][1]['row']
         return rows
     except Exception as e:
+        # 실패는 None으로 구분하여 빈 달력으로 기존 페이지를 덮어쓰지 않도록 합니다
         print(f"학사일정 정보 가져오기 실패: {str(e)}")
-        return []
+        return None
 
 # 학사일정 가져오기 함수 (통합)
 def get_schedule_info(api_key, atpt_code, school_code, year, month):
@@ -99,1216 +128,95 @@ def get_schedule_info(api_key, atpt_code, school_code, year, month):
         
         if schedules:
             print(f"API에서 {len(schedules)}개의 일정을 가져왔습니다.")
-        else:
+        elif schedules is None:
             print("API에서도 데이터를 가져오지 못했습니다.")
+        else:
+            print(f"{year}년 {month}월 일정이 없습니다.")
         
         return schedules
 
-def generate_schedule_html(schedules, school_name, year, month):
-    # 날짜별 일정 매핑
-    schedule_map = {}
-    print(f"처리할 일정 개수: {len(schedules)}")
-    
+@lru_cache(maxsize=None)
+def _month_layout(year, month):
+    """
+    학교와 상관없는 달력 틀을 만듭니다. 같은 달을 여러 학교에 렌더링해도 한 번만 계산합니다.
+
+    Returns:
+        tuple: ((날짜, YYYYMMDD, YYYY.MM.DD, 요일 번호), ...), 주 단위 표 (날짜 번호, 빈 칸은 0)
+    """
+    first_weekday, last_day = calendar.monthrange(year, month)
+    dates = tuple((d, f"{year}{month:02d}{d:02d}", f"{year}.{month:02d}.{d:02d}", (first_weekday + d - 1) % 7)
+                  for d in range(1, last_day + 1))
+    return dates, tuple(tuple(week) for week in calendar.monthcalendar(year, month))
+
+def build_month(schedules, year, month):
+    """
+    학사일정으로 한 달 달력 모델을 만듭니다. 그 달에 속하지 않는 일정은 무시합니다.
+
+    Args:
+        schedules (list): 학사일정 목록 ({"AA_YMD": YYYYMMDD, "EVENT_NM": 일정 이름})
+        year (int): 연도
+        month (int): 월
+
+    Returns:
+        MonthCalendar: 한 달 달력
+    """
+    events_by_date = {}
     for item in schedules:
-        date = item['AA_YMD']
-        event = item['EVENT_NM']
-        print(f"일정 처리: {date} - {event}")
-        if date not in schedule_map:
-            schedule_map[date] = []
-        schedule_map[date].append(event)
-    
-    print(f"날짜별 일정 매핑 완료: {len(schedule_map)}개 날짜")
-    for date, events in schedule_map.items():
-        print(f"  {date}: {events}")
-
-    # 달력 생성 (기본: 한 줄 형태, 세로 축소시: 표 형태)
-    last_day = calendar.monthrange(year, month)[1]
-    
-    # 기본 달력 (한 줄 형태)
-    days_row = ''
-    for d in range(1, last_day+1):
-        date_str = f"{year}{str(month).zfill(2)}{str(d).zfill(2)}"
-        has_event = date_str in schedule_map
-        if has_event:
-            print(f"달력에 일정 표시: {date_str} - {schedule_map[date_str]}")
-        weekday = calendar.weekday(year, month, d)
-        is_sun = (weekday == 6)
-        circle_class = 'event-circle' if has_event else ''
-        sun_class = 'sunday' if is_sun else ''
-        if has_event:
-            events_text = ', '.join(schedule_map[date_str])
-            days_row += f'<th><span class="calendar-num {circle_class} {sun_class}" title="{events_text}">{d}</span></th>'
-        else:
-            days_row += f'<th><span class="calendar-num {circle_class} {sun_class}">{d}</span></th>'
-    week_names = ['월', '화', '수', '목', '금', '토', '일']
-    week_row = ''
-    for d in range(1, last_day+1):
-        weekday = calendar.weekday(year, month, d)
-        is_sun = (weekday == 6)
-        sun_class = 'sunday' if is_sun else ''
-        week_row += f'<td class="{sun_class}">{week_names[weekday]}</td>'
-    
-    # 표 형태 달력 (세로 축소시 사용)
-    table_calendar_html = ''
-    week_names = ['월', '화', '수', '목', '금', '토', '일']
-    
-    # 첫 주 시작일 계산
-    first_weekday = calendar.weekday(year, month, 1)
-    current_day = 1
-    
-    table_calendar_html += '<table class="table-calendar">'
-    # 요일 헤더 추가
-    table_calendar_html += '<tr>'
-    for day_name in week_names:
-        is_sun = (day_name == '일')
-        sun_class = 'sunday' if is_sun else ''
-        table_calendar_html += f'<th class="{sun_class}">{day_name}</th>'
-    table_calendar_html += '</tr>'
-    table_calendar_html += '<tr>'
-    for i in range(7):
-        if i < first_weekday:
-            table_calendar_html += '<td></td>'
-        else:
-            date_str = f"{year}{str(month).zfill(2)}{str(current_day).zfill(2)}"
-            has_event = date_str in schedule_map
-            if has_event:
-                print(f"표 달력에 일정 표시: {date_str} - {schedule_map[date_str]}")
-            is_sun = (i == 6)
-            circle_class = 'event-circle' if has_event else ''
-            sun_class = 'sunday' if is_sun else ''
-            if has_event:
-                events_text = ', '.join(schedule_map[date_str])
-                table_calendar_html += f'<td class="{sun_class}"><span class="calendar-num {circle_class}" title="{events_text}">{current_day}</span></td>'
-            else:
-                table_calendar_html += f'<td class="{sun_class}"><span class="calendar-num {circle_class}">{current_day}</span></td>'
-            current_day += 1
-    table_calendar_html += '</tr>'
-    
-    # 나머지 주들
-    while current_day <= last_day:
-        table_calendar_html += '<tr>'
-        for i in range(7):
-            if current_day <= last_day:
-                date_str = f"{year}{str(month).zfill(2)}{str(current_day).zfill(2)}"
-                has_event = date_str in schedule_map
-                if has_event:
-                    print(f"표 달력 나머지 주에 일정 표시: {date_str} - {schedule_map[date_str]}")
-                is_sun = (i == 6)
-                circle_class = 'event-circle' if has_event else ''
-                sun_class = 'sunday' if is_sun else ''
-                if has_event:
-                    events_text = ', '.join(schedule_map[date_str])
-                    table_calendar_html += f'<td class="{sun_class}"><span class="calendar-num {circle_class}" title="{events_text}">{current_day}</span></td>'
-                else:
-                    table_calendar_html += f'<td class="{sun_class}"><span class="calendar-num {circle_class}">{current_day}</span></td>'
-                current_day += 1
-            else:
-                table_calendar_html += '<td></td>'
-        table_calendar_html += '</tr>'
-    
-    table_calendar_html += '</table>'
-    
-    calendar_html = f'<div class="calendar-wrapper">'
-    calendar_html += f'<table class="schedule-calendar" style="margin-bottom:18px;">'
-    calendar_html += f'<tr>{days_row}</tr>'
-    calendar_html += f'<tr>{week_row}</tr>'
-    calendar_html += '</table>'
-    calendar_html += f'<div class="table-calendar-wrapper">{table_calendar_html}</div>'
-    calendar_html += '</div>'
-
-    # 일정 리스트 (날짜순, 표 형태)
-    sorted_events = sorted([(d, e) for d, evs in schedule_map.items() for e in evs], key=lambda x: x[0])
-    
-    # 일정을 세 부분으로 나누기 (12개 초과시)
-    total_events = len(sorted_events)
-    if total_events == 0:
-        event_list_html = '<tr><td colspan="2">이번 달 학사일정이 없습니다.</td></tr>'
-    else:
-        if total_events <= 12:
-            # 12개 이하: 두 부분으로 나누기
-            first_part_html = ''
-            for i, (date, event) in enumerate(sorted_events[:6]):
-                first_part_html += f'<tr><td>{date[:4]}.{date[4:6]}.{date[6:]}</td><td>{event}</td></tr>'
-            
-            second_part_html = ''
-            for date, event in sorted_events[6:]:
-                second_part_html += f'<tr><td>{date[:4]}.{date[4:6]}.{date[6:]}</td><td>{event}</td></tr>'
-            
-            event_list_html = {
-                'first_part': first_part_html,
-                'second_part': second_part_html,
-                'has_second_part': len(sorted_events) > 6,
-                'has_third_part': False
-            }
-        else:
-            # 12개 초과: 세 부분으로 나누기
-            events_per_part = (total_events + 2) // 3  # 균등하게 분배
-            
-            first_part_html = ''
-            for i, (date, event) in enumerate(sorted_events[:events_per_part]):
-                first_part_html += f'<tr><td>{date[:4]}.{date[4:6]}.{date[6:]}</td><td>{event}</td></tr>'
-            
-            second_part_html = ''
-            for date, event in sorted_events[events_per_part:events_per_part*2]:
-                second_part_html += f'<tr><td>{date[:4]}.{date[4:6]}.{date[6:]}</td><td>{event}</td></tr>'
-            
-            third_part_html = ''
-            for date, event in sorted_events[events_per_part*2:]:
-                third_part_html += f'<tr><td>{date[:4]}.{date[4:6]}.{date[6:]}</td><td>{event}</td></tr>'
-            
-            event_list_html = {
-                'first_part': first_part_html,
-                'second_part': second_part_html,
-                'third_part': third_part_html,
-                'has_second_part': True,
-                'has_third_part': True
-            }
-
-    # CSS: 달력 한 줄, 일정 표 스타일 추가
-    css_style = '''
-        @font-face {
-            font-family: 'SeoulAlrim';
-            src: url('font/SeoulAlrimTTF-Medium.ttf') format('truetype');
-            font-weight: normal;
-            font-style: normal;
-        }
-        body { 
-            background: #4A90E2; 
-            font-family: 'SeoulAlrim', sans-serif; 
-            margin: 0; 
-            padding: 0; 
-            height: 100vh; 
-            overflow: hidden;
-        }
-        .page-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            background: linear-gradient(90deg, #4A90E2, #357ABD);
-            padding: 30px 90px;
-            box-shadow: 0 8px 32px rgba(53, 122, 189, 0.18);
-            flex-shrink: 0;
-            min-height: 80px;
-            box-sizing: border-box;
-        }
-        .header-left {
-            display: flex;
-            align-items: center;
-            gap: 30px;
-        }
-        .header-main-title {
-            font-size: 5.8rem;
-            font-weight: 900; 
-            color: #FFFFFF;
-            letter-spacing: -2px;
-            text-shadow: 2px 2px 4px rgba(0, 0, 0, 0.1);
-            margin: 0;
-        }
-        .header-right {
-            display: flex;
-            align-items: center;
-            gap: 60px;
-        }
-        .page-header .weather, 
-        .page-header .date-time {
-            font-size: 2.2rem;
-            color: #FFFFFF;
-            display: flex;
-            align-items: center;
-            gap: 12px;
-            text-shadow: 1px 1px 2px rgba(0, 0, 0, 0.1);
-        }
-        .page-header .date-time {
-            line-height: 1.3;
-            text-align: right;
-            font-size: 1.8rem;
-        }
-        .page-header .weather {
-            display: flex;
-            align-items: center;
-            gap: 15px;
-        }
-        .page-header .weather-content {
-            display: flex;
-            flex-direction: column;
-            align-items: flex-start;
-            gap: 5px;
-        }
-        .page-header .weather-icon {
-            width: 45px;
-            height: 45px;
-            flex-shrink: 0;
-        }
-        .page-header .weather-temp {
-            font-size: 2.2rem;
-        }
-        .page-header .school-name {
-            font-size: 2.2rem;
-            color: #FFFFFF;
-            font-weight: 700;
-            text-shadow: 1px 1px 2px rgba(0, 0, 0, 0.1);
-            white-space: nowrap;
-        }
-        .main-content {
-            background: #FFFFFF;
-            border-radius: 20px;
-            box-shadow: 0 8px 40px rgba(53, 122, 189, 0.18);
-            margin: 20px auto;
-            padding: 20px 60px;
-            max-width: 2000px;
-            width: 95%;
-            max-height: calc(100vh - 140px);
-            box-sizing: border-box;
-            overflow-y: auto;
-        }
-        .calendar-section { 
-            margin-bottom: 20px; 
-        }
-        .calendar-section h2 {
-            font-size: 3.5rem;
-            color: #357ABD;
-            margin-bottom: 15px;
-            font-weight: 700;
-        }
-        .calendar-wrapper {
-            position: relative;
-        }
-        .schedule-calendar {
-            width: 100%;
-            border-collapse: collapse;
-            font-size: 2.2rem;
-            margin-bottom: 20px;
-            table-layout: fixed;
-        }
-        .schedule-calendar th, .schedule-calendar td {
-            text-align: center;
-            padding: 8px 0;
-            border: none;
-            width: calc(100% / 31);
-        }
-        .table-calendar-wrapper {
-            display: none;
-        }
-        .table-calendar {
-            width: 100%;
-            border-collapse: collapse;
-            font-size: 1.8rem;
-            margin-bottom: 20px;
-        }
-        .table-calendar td {
-            text-align: center;
-            padding: 8px 4px;
-            border: 1px solid #eee;
-            height: 40px;
-            vertical-align: middle;
-        }
-        .table-calendar th {
-            text-align: center;
-            padding: 10px 4px;
-            background: #E3F2FD;
-            color: #357ABD;
-            font-weight: 700;
-            border: 1px solid #eee;
-        }
-        .calendar-num {
-            display: inline-block;
-            width: 2.5rem;
-            height: 2.5rem;
-            line-height: 2.5rem;
-            border-radius: 50%;
-            font-size: 1.8rem;
-            font-weight: 700;
-            color: #222;
-            background: transparent;
-            transition: background 0.2s;
-        }
-        .event-circle {
-            background: #357ABD !important;
-            color: white !important;
-            font-weight: 900;
-            box-shadow: 0 2px 4px rgba(53, 122, 189, 0.3);
-            cursor: pointer;
-            position: relative;
-        }
-        
-        .event-circle:hover {
-            background: #2E6DA4 !important;
-            transform: scale(1.1);
-            transition: all 0.2s ease;
-        }
-        .sunday {
-            color: #e23a3a !important;
-        }
-        .schedule-calendar td.sunday {
-            color: #e23a3a !important;
-        }
-        .event-list-section { 
-            margin-top: 15px; 
-        }
-        .event-list-container {
-            display: flex;
-            gap: 40px;
-            margin-top: 15px;
-        }
-        .event-list-part {
-            flex: 1;
-        }
-        .event-list-container.three-columns {
-            gap: 20px;
-        }
-        .event-list-container.three-columns .event-list-part {
-            flex: 1;
-        }
-        .event-list-container.three-columns .event-list-table {
-            font-size: 1.8rem;
-        }
-        .event-list-container.three-columns .event-list-table td:first-child {
-            font-size: 1.6rem;
-            width: 100px;
-        }
-        .event-list-container.three-columns .event-list-table td:last-child {
-            font-size: 1.8rem;
-        }
-        .event-list-part h3 {
-            font-size: 2rem;
-            color: #357ABD;
-            margin-bottom: 10px;
-            font-weight: 700;
-        }
-        .event-list-table {
-            width: 100%;
-            border-collapse: collapse;
-            font-size: 2.2rem;
-        }
-        .event-list-table td {
-            border-bottom: 1px solid #eee;
-            padding: 12px 8px;
-            text-align: left;
-        }
-        .event-list-table td:first-child {
-            color: #357ABD;
-            font-weight: 700;
-            width: 120px;
-            font-size: 2rem;
-        }
-        .event-list-table td:last-child {
-            color: #222;
-            font-size: 2.2rem;
-        }
-        @media (max-width: 1380px) {
-            .page-header {
-                flex-direction: column;
-                padding: 25px;
-                gap: 20px;
-                height: auto;
-                min-height: 80px;
-            }
-            .header-left, .header-right {
-                width: 100%;
-                justify-content: center;
-                gap: 40px;
-            }
-            .header-main-title {
-                font-size: 5rem;
-            }
-            .page-header .school-name {
-                font-size: 2.2rem;
-            }
-            .main-content { 
-                padding: 20px 40px; 
-                max-height: calc(100vh - 140px);
-            }
-            .calendar-section h2 {
-                font-size: 3rem;
-            }
-            .schedule-calendar {
-                display: none;
-            }
-            .table-calendar-wrapper {
-                display: block;
-            }
-            .event-list-container {
-                flex-direction: column;
-                gap: 20px;
-            }
-        }
-        @media (max-width: 900px) {
-            .main-content { 
-                padding: 20px; 
-                max-height: calc(100vh - 140px);
-            }
-            .header-main-title { font-size: 4rem; }
-            .calendar-section h2 { font-size: 2.5rem; }
-            .schedule-calendar { 
-                display: none;
-                font-size: 1.8rem; 
-            }
-            .table-calendar-wrapper {
-                display: block;
-            }
-            .calendar-num {
-                width: 2rem;
-                height: 2rem;
-                line-height: 2rem;
-                font-size: 1.5rem;
-            }
-            .event-list-table { font-size: 1.8rem; }
-            .event-list-table td:first-child { font-size: 1.6rem; }
-            .event-list-table td:last-child { font-size: 1.8rem; }
-        }
-        @media (max-width: 600px) {
-            .main-content { 
-                padding: 15px; 
-                max-height: calc(100vh - 140px);
-            }
-            .header-main-title { font-size: 3rem; }
-            .page-header { padding: 15px; }
-            .calendar-section h2 { font-size: 2rem; }
-            .schedule-calendar { 
-                display: none;
-                font-size: 1.5rem; 
-            }
-            .table-calendar-wrapper {
-                display: block;
-            }
-            .calendar-num {
-                width: 1.8rem;
-                height: 1.8rem;
-                line-height: 1.8rem;
-                font-size: 1.3rem;
-            }
-            .event-list-table { font-size: 1.5rem; }
-            .event-list-table td:first-child { font-size: 1.4rem; }
-            .event-list-table td:last-child { font-size: 1.5rem; }
-        }
-        @media (max-height: 800px) and (max-width: 1999px) {
-            .page-header {
-                padding: 15px 20px;
-                min-height: 60px;
-            }
-            .header-main-title {
-                font-size: 3.5rem;
-            }
-            .page-header .weather, 
-            .page-header .date-time,
-            .page-header .school-name {
-                font-size: 1.8rem;
-            }
-            .page-header .weather-icon {
-                width: 40px;
-                height: 40px;
-            }
-            .main-content {
-                margin: 20px auto;
-                padding: 25px 30px;
-                max-height: calc(100vh - 100px);
-            }
-            .calendar-section h2 {
-                font-size: 1.8rem;
-                margin-bottom: 15px;
-            }
-            .schedule-calendar {
-                display: none;
-            }
-            .table-calendar-wrapper {
-                display: block;
-            }
-            .table-calendar {
-                font-size: 1.6rem;
-                margin-bottom: 15px;
-            }
-            .table-calendar td {
-                padding: 6px 3px;
-                height: 35px;
-            }
-            .table-calendar th {
-                padding: 8px 3px;
-                font-size: 1.4rem;
-            }
-            .calendar-num {
-                width: 1.8rem;
-                height: 1.8rem;
-                line-height: 1.8rem;
-                font-size: 1.2rem;
-            }
-            .event-list-section {
-                margin-top: 15px;
-            }
-            .event-list-table {
-                font-size: 1.6rem;
-            }
-            .event-list-table td {
-                padding: 8px 6px;
-            }
-            .event-list-table td:first-child {
-                font-size: 1.4rem;
-                width: 100px;
-            }
-            .event-list-table td:last-child {
-                font-size: 1.6rem;
-            }
-        }
-
-        /* 32:9 비율 최적화 (16:9에서 너비만 2배로 늘어진 경우) */
-        @media (max-height: 800px) and (min-width: 2000px) {
-            .page-header {
-                padding: 15px 20px;
-                min-height: 60px;
-            }
-            .header-main-title {
-                font-size: 2.8rem;
-            }
-            .page-header .weather, 
-            .page-header .date-time,
-            .page-header .school-name {
-                font-size: 1.5rem;
-            }
-            .page-header .weather-icon {
-                width: 35px;
-                height: 35px;
-            }
-            .main-content {
-                margin: 20px auto;
-                padding: 25px 30px;
-                max-height: calc(100vh - 100px);
-            }
-            .calendar-section h2 {
-                font-size: 1.5rem;
-                margin-bottom: 15px;
-            }
-            .schedule-calendar {
-                display: none;
-            }
-            .table-calendar-wrapper {
-                display: block;
-            }
-            .table-calendar {
-                font-size: 1.3rem;
-                margin-bottom: 15px;
-            }
-            .table-calendar td {
-                padding: 6px 3px;
-                height: 35px;
-            }
-            .table-calendar th {
-                padding: 8px 3px;
-                font-size: 1.2rem;
-            }
-            .calendar-num {
-                width: 1.6rem;
-                height: 1.6rem;
-                line-height: 1.6rem;
-                font-size: 1rem;
-            }
-            .event-list-section {
-                margin-top: 15px;
-            }
-            .event-list-table {
-                font-size: 1.3rem;
-            }
-            .event-list-table td {
-                padding: 8px 6px;
-            }
-            .event-list-table td:first-child {
-                font-size: 1.2rem;
-                width: 100px;
-            }
-            .event-list-table td:last-child {
-                font-size: 1.3rem;
-            }
-        }
-        @media (max-height: 600px) and (max-width: 1999px) {
-            .page-header {
-                padding: 10px 15px;
-                min-height: 50px;
-            }
-            .header-main-title {
-                font-size: 3rem;
-            }
-            .page-header .weather, 
-            .page-header .date-time,
-            .page-header .school-name {
-                font-size: 1.6rem;
-            }
-            .page-header .weather-icon {
-                width: 35px;
-                height: 35px;
-            }
-            .main-content {
-                margin: 15px auto;
-                padding: 20px 25px;
-                max-height: calc(100vh - 80px);
-            }
-            .calendar-section h2 {
-                font-size: 1.6rem;
-                margin-bottom: 10px;
-            }
-            .schedule-calendar {
-                display: none;
-            }
-            .table-calendar-wrapper {
-                display: block;
-            }
-            .table-calendar {
-                font-size: 1.4rem;
-                margin-bottom: 10px;
-            }
-            .table-calendar td {
-                padding: 4px 2px;
-                height: 30px;
-            }
-            .table-calendar th {
-                padding: 6px 2px;
-                font-size: 1.2rem;
-            }
-            .calendar-num {
-                width: 1.6rem;
-                height: 1.6rem;
-                line-height: 1.6rem;
-                font-size: 1.1rem;
-            }
-            .event-list-section {
-                margin-top: 10px;
-            }
-            .event-list-table {
-                font-size: 1.4rem;
-            }
-            .event-list-table td {
-                padding: 6px 4px;
-            }
-            .event-list-table td:first-child {
-                font-size: 1.2rem;
-                width: 90px;
-            }
-            .event-list-table td:last-child {
-                font-size: 1.4rem;
-            }
-        }
-
-        /* 32:9 비율에서 매우 낮은 높이일 때 */
-        @media (max-height: 600px) and (min-width: 2000px) {
-            .page-header {
-                padding: 10px 15px;
-                min-height: 50px;
-            }
-            .header-main-title {
-                font-size: 2.4rem;
-            }
-            .page-header .weather, 
-            .page-header .date-time,
-            .page-header .school-name {
-                font-size: 1.3rem;
-            }
-            .page-header .weather-icon {
-                width: 30px;
-                height: 30px;
-            }
-            .main-content {
-                margin: 15px auto;
-                padding: 20px 25px;
-                max-height: calc(100vh - 80px);
-            }
-            .calendar-section h2 {
-                font-size: 1.3rem;
-                margin-bottom: 10px;
-            }
-            .schedule-calendar {
-                display: none;
-            }
-            .table-calendar-wrapper {
-                display: block;
-            }
-            .table-calendar {
-                font-size: 1.1rem;
-                margin-bottom: 10px;
-            }
-            .table-calendar td {
-                padding: 4px 2px;
-                height: 30px;
-            }
-            .table-calendar th {
-                padding: 6px 2px;
-                font-size: 1rem;
-            }
-            .calendar-num {
-                width: 1.4rem;
-                height: 1.4rem;
-                line-height: 1.4rem;
-                font-size: 0.9rem;
-            }
-            .event-list-section {
-                margin-top: 10px;
-            }
-            .event-list-table {
-                font-size: 1.1rem;
-            }
-            .event-list-table td {
-                padding: 6px 4px;
-            }
-            .event-list-table td:first-child {
-                font-size: 1rem;
-                width: 90px;
-            }
-            .event-list-table td:last-child {
-                font-size: 1.1rem;
-            }
-        }
-        @media (max-width: 480px) {
-            .page-header {
-                padding: 15px 10px;
-                gap: 15px;
-                height: auto;
-                min-height: 80px;
-            }
-            .header-left, .header-right {
-                gap: 20px;
-            }
-            .header-main-title { 
-                font-size: 2.5rem; 
-                text-align: center;
-            }
-            .page-header .weather, 
-            .page-header .date-time,
-            .page-header .school-name {
-                font-size: 1.6rem;
-            }
-            .page-header .weather-icon {
-                width: 35px;
-                height: 35px;
-            }
-            .page-header .weather-temp {
-                font-size: 1.6rem;
-            }
-            .main-content { 
-                padding: 15px 10px; 
-                margin: 15px auto;
-                width: 98%;
-                max-height: calc(100vh - 140px);
-            }
-            .calendar-section h2 { 
-                font-size: 1.8rem; 
-                margin-bottom: 15px;
-            }
-            .schedule-calendar { 
-                display: none;
-                font-size: 1.3rem; 
-                margin-bottom: 20px;
-            }
-            .table-calendar-wrapper {
-                display: block;
-            }
-            .schedule-calendar th, 
-            .schedule-calendar td {
-                padding: 6px 2px;
-            }
-            .calendar-num {
-                width: 1.6rem;
-                height: 1.6rem;
-                line-height: 1.6rem;
-                font-size: 1.1rem;
-            }
-            .event-list-table { 
-                font-size: 1.3rem; 
-            }
-            .event-list-table td {
-                padding: 10px 6px;
-            }
-            .event-list-table td:first-child { 
-                font-size: 1.2rem; 
-                width: 100px;
-            }
-            .event-list-table td:last-child { 
-                font-size: 1.3rem; 
-            }
-        }
-        @media (max-height: 600px) {
-            .page-header {
-                padding: 15px 20px;
-                min-height: 60px;
-            }
-            .header-main-title {
-                font-size: 3.5rem;
-            }
-            .page-header .weather, 
-            .page-header .date-time,
-            .page-header .school-name {
-                font-size: 1.8rem;
-            }
-            .page-header .weather-icon {
-                width: 40px;
-                height: 40px;
-            }
-            .main-content {
-                margin: 20px auto;
-                padding: 25px 30px;
-            }
-            .calendar-section h2 {
-                font-size: 1.8rem;
-                margin-bottom: 15px;
-            }
-            .schedule-calendar {
-                font-size: 1.6rem;
-                margin-bottom: 20px;
-            }
-            .calendar-num {
-                width: 1.8rem;
-                height: 1.8rem;
-                line-height: 1.8rem;
-                font-size: 1.3rem;
-            }
-            .event-list-table {
-                font-size: 1.6rem;
-            }
-            .event-list-table td {
-                padding: 8px 6px;
-            }
-        }
-    '''
-    js_code = f'''
-        function updateDateTime() {{
-            const now = new Date();
-            const year = now.getFullYear();
-            const month = String(now.getMonth() + 1).padStart(2, '0');
-            const day = String(now.getDate()).padStart(2, '0');
-            const weekDays = ['일', '월', '화', '수', '목', '금', '토'];
-            const weekDay = weekDays[now.getDay()];
-            let hours = now.getHours();
-            const ampm = hours >= 12 ? '오후' : '오전';
-            hours = hours % 12;
-            hours = hours ? hours : 12; 
-            const displayHours = String(hours).padStart(2, '0');
-            const minutes = String(now.getMinutes()).padStart(2, '0');
-            const dateString = `${{year}}.${{month}}.${{day}} ${{weekDay}}요일`;
-            const timeString = `${{ampm}} ${{displayHours}}:${{minutes}}`;
-            document.getElementById('date-time').innerHTML = `${{dateString}}<br>${{timeString}}`;
-        }}
-        // 날씨 캐시 설정
-        const WEATHER_CACHE_KEY = 'headerWeatherData_v2';
-        const WEATHER_TIMESTAMP_KEY = 'headerWeatherTimestamp_v2';
-        const WEATHER_UPDATE_INTERVAL = 60 * 60 * 1000; // 1시간 (밀리초)
-
-        // 캐시에서 날씨 데이터 가져오기
-        function getCachedWeatherData() {{
-            try {{
-                const cachedData = localStorage.getItem(WEATHER_CACHE_KEY);
-                const timestamp = localStorage.getItem(WEATHER_TIMESTAMP_KEY);
-                
-                if (cachedData && timestamp) {{
-                    const data = JSON.parse(cachedData);
-                    const lastUpdate = parseInt(timestamp);
-                    const now = Date.now();
-                    
-                    // 1시간이 지나지 않았다면 캐시된 데이터 사용
-                    if (now - lastUpdate < WEATHER_UPDATE_INTERVAL) {{
-                        console.log('캐시된 헤더 날씨 데이터 사용 중...');
-                        return data;
-                    }}
-                }}
-            }} catch (error) {{
-                console.error('날씨 캐시 데이터 읽기 실패:', error);
-            }}
-            return null;
-        }}
-
-        // 날씨 데이터를 캐시에 저장하기
-        function saveWeatherDataToCache(data) {{
-            try {{
-                localStorage.setItem(WEATHER_CACHE_KEY, JSON.stringify(data));
-                localStorage.setItem(WEATHER_TIMESTAMP_KEY, Date.now().toString());
-                console.log('헤더 날씨 데이터가 캐시에 저장되었습니다.');
-            }} catch (error) {{
-                console.error('날씨 캐시 저장 실패:', error);
-            }}
-        }}
-
-        // 날씨 데이터를 화면에 표시하는 함수
-        function displayWeatherData(weatherData) {{
-            const temp = Math.round(weatherData.main.temp);
-            const weatherInfo = getWeatherInfo(
-                weatherData.weather[0].main, 
-                weatherData.weather[0].description, 
-                weatherData.isDay
-            );
-            document.querySelector('.weather').innerHTML =
-                `<img class='weather-icon' src='images/${{weatherInfo.icon}}' alt='날씨아이콘'>
-                 <div class='weather-content'>
-                    <div>${{weatherInfo.text}}</div>
-                    <div class='weather-temp'>${{temp}}℃</div>
-                 </div>`;
-        }}
-
-        // 초기 날씨 데이터 로드 함수
-        async function loadInitialWeather() {{
-            // 먼저 캐시에서 데이터 확인
-            const cachedData = getCachedWeatherData();
-            if (cachedData) {{
-                console.log('캐시된 헤더 날씨 데이터로 초기 로드 중...');
-                displayWeatherData(cachedData);
-                return;
-            }}
-            
-            // 캐시에 데이터가 없거나 만료된 경우에만 API 호출
-            console.log('헤더 날씨 데이터 초기 로드 중...');
-            await fetchWeather();
-        }}
-
-        // 날씨 정보 업데이트 함수 (1시간마다)
-        async function updateWeatherIfNeeded() {{
-            // 먼저 캐시에서 데이터 확인
-            const cachedData = getCachedWeatherData();
-            if (cachedData) {{
-                // 캐시가 유효하면 표시 함수 호출하지 않음 (이미 표시되어 있음)
-                console.log('캐시된 헤더 날씨 데이터가 유효합니다.');
-                return;
-            }}
-            
-            // 캐시에 데이터가 없거나 만료된 경우에만 API 호출
-            console.log('헤더 날씨 정보 업데이트 중...');
-            await fetchWeather();
-        }}
-
-        async function fetchWeather() {{
-            const apiKey = '{os.getenv("OPENWEATHER_API_KEY", "")}';
-            const lat = 37.2857;
-            const lon = 127.1109;
-            const url = `https://api.openweathermap.org/data/2.5/weather?lat=${{lat}}&lon=${{lon}}&appid=${{apiKey}}&units=metric`;
-            
-            try {{
-                const res = await fetch(url);
-                const data = await res.json();
-                
-                if (!data.weather || !data.weather[0]) throw new Error('Invalid weather data');
-                
-                // 현재 시간을 기준으로 낮/밤 판단
-                const now = new Date();
-                const currentHour = now.getHours();
-                const isDay = currentHour >= 6 && currentHour < 18; // 6시~18시는 낮
-                
-                // isDay 정보를 데이터에 추가
-                data.isDay = isDay;
-                
-                // 데이터를 화면에 표시
-                displayWeatherData(data);
-                
-                // 성공적으로 데이터를 가져왔다면 캐시에 저장
-                saveWeatherDataToCache(data);
-                
-            }} catch (e) {{
-                console.error("Weather fetch error: ", e);
-                document.querySelector('.weather').textContent = '날씨 정보를 불러올 수 없습니다';
-            }}
-        }}
-        // OpenWeatherMap API 2.5와 커스텀 날씨 아이콘 매핑
-        function getWeatherInfo(weatherMain, weatherDescription, isDay = true) {{
-            // 메인 날씨 조건별 매핑
-            const mainWeatherMap = {{
-                'Clear': {{ 
-                    text: '맑음', 
-                    icon: 'weather/1.png' // 태양 아이콘
-                }},
-                'Clouds': {{
-                    text: '구름',
-                    icon: getCloudIcon(weatherDescription) // 구름 정도에 따라 다른 아이콘
-                }},
-                'Rain': {{
-                    text: '비',
-                    icon: getRainIcon(weatherDescription) // 비의 강도에 따라 다른 아이콘
-                }},
-                'Drizzle': {{
-                    text: '이슬비',
-                    icon: 'weather/14.png' // 물방울 아이콘
-                }},
-                'Thunderstorm': {{
-                    text: '뇌우',
-                    icon: 'weather/7.png' // 번개 아이콘
-                }},
-                'Snow': {{
-                    text: '눈',
-                    icon: 'weather/5.png' // 눈송이 아이콘
-                }},
-                'Mist': {{
-                    text: '안개',
-                    icon: 'weather/16.png' // 안개 아이콘
-                }},
-                'Fog': {{
-                    text: '짙은 안개',
-                    icon: 'weather/16.png' // 안개 아이콘
-                }},
-                'Smoke': {{
-                    text: '연기',
-                    icon: 'weather/16.png' // 안개 아이콘 (비슷한 시야 제한)
-                }},
-                'Haze': {{
-                    text: '실안개',
-                    icon: 'weather/16.png' // 안개 아이콘
-                }},
-                'Dust': {{
-                    text: '먼지',
-                    icon: 'weather/11.png' // 바람 아이콘
-                }},
-                'Sand': {{
-                    text: '모래바람',
-                    icon: 'weather/11.png' // 바람 아이콘
-                }},
-                'Ash': {{
-                    text: '화산재',
-                    icon: 'weather/16.png' // 안개 아이콘
-                }},
-                'Squall': {{
-                    text: '돌풍',
-                    icon: 'weather/11.png' // 바람 아이콘
-                }},
-                'Tornado': {{
-                    text: '토네이도',
-                    icon: 'weather/11.png' // 바람 아이콘
-                }}
-            }};
-
-            // 구름 상태에 따른 아이콘 선택
-            function getCloudIcon(description) {{
-                const desc = description.toLowerCase();
-                if (desc.includes('few clouds')) {{
-                    return 'weather/3.png'; // 부분적으로 구름 낀 맑은 날씨
-                }} else if (desc.includes('scattered clouds') || desc.includes('broken clouds')) {{
-                    return 'weather/2.png'; // 구름 많음
-                }} else if (desc.includes('overcast')) {{
-                    return 'weather/8.png'; // 완전히 흐림
-                }}
-                return 'weather/2.png'; // 기본 구름 아이콘
-            }}
-
-            // 비의 강도에 따른 아이콘 선택
-            function getRainIcon(description) {{
-                const desc = description.toLowerCase();
-                if (desc.includes('light rain') || desc.includes('drizzle')) {{
-                    return 'weather/14.png'; // 가벼운 비 (물방울)
-                }} else if (desc.includes('heavy rain') || desc.includes('extreme rain')) {{
-                    return 'weather/6.png'; // 폭우
-                }} else if (desc.includes('thunderstorm')) {{
-                    return 'weather/10.png'; // 천둥번개를 동반한 비
-                }}
-                return 'weather/4.png'; // 기본 비 아이콘
-            }}
+        events_by_date.setdefault(item['AA_YMD'], []).append(item['EVENT_NM'])
 
-            // 야간 모드 처리 (달 아이콘 사용)
-            function getNightIcon(weatherMain) {{
-                if (weatherMain === 'Clear') {{
-                    return 'weather/15.png'; // 달과 별 아이콘
-                }}
-                // 다른 날씨는 동일한 아이콘 사용
-                return mainWeatherMap[weatherMain]?.icon || 'weather/1.png';
-            }}
+    dates, grid = _month_layout(year, month)
+    days = [CalendarDay(d, date, label, WEEK_NAMES[weekday], weekday == 6, events_by_date.get(date, []))
+            for d, date, label, weekday in dates]
+    weeks = [[days[d - 1] if d else None for d in week] for week in grid]
 
-            // 메인 날씨 정보 가져오기
-            let weatherInfo = mainWeatherMap[weatherMain] || {{ 
-                text: weatherMain, 
-                icon: 'weather/1.png' 
-            }};
-
-            // 야간인 경우 아이콘 변경
-            if (!isDay && weatherMain === 'Clear') {{
-                weatherInfo.icon = getNightIcon(weatherMain);
-            }}
-
-            return weatherInfo;
-        }}
-
-        // 초기 로드 및 주기적 업데이트 설정
-        setInterval(updateDateTime, 1000);
-        updateDateTime();
-        loadInitialWeather();
-        
-        // 5분마다 날씨 업데이트 체크
-        setInterval(updateWeatherIfNeeded, 5 * 60 * 1000);
-        
-        // 페이지가 포커스를 받았을 때 업데이트 체크
-        window.addEventListener('focus', function() {{
-            updateWeatherIfNeeded();
-        }});
-        
-        // 페이지가 보이게 될 때 업데이트 체크 (탭 전환 시)
-        document.addEventListener('visibilitychange', function() {{
-            if (!document.hidden) {{
-                updateWeatherIfNeeded();
-            }}
-        }});
-    '''
-    # event_list_html 렌더링 부분을 분리하여 f-string 오류 방지
-    if isinstance(event_list_html, dict):
-        if event_list_html.get('has_third_part', False):
-            # 세 부분으로 나누기 (12개 초과)
-            event_list_html_rendered = f'''
-                <div class="event-list-container three-columns">
-                    <div class="event-list-part">
-                        <table class="event-list-table">
-                            {event_list_html['first_part']}
-                        </table>
-                    </div>
-                    <div class="event-list-part">
-                        <table class="event-list-table">
-                            {event_list_html['second_part']}
-                        </table>
-                    </div>
-                    <div class="event-list-part">
-                        <table class="event-list-table">
-                            {event_list_html['third_part']}
-                        </table>
-                    </div>
-                </div>
-            '''
-        else:
-            # 두 부분으로 나누기 (12개 이하)
-            event_list_html_rendered = f'''
-                <div class="event-list-container">
-                    <div class="event-list-part">
-                        <table class="event-list-table">
-                            {event_list_html['first_part']}
-                        </table>
-                    </div>
-                    {f'<div class="event-list-part"><table class="event-list-table">{event_list_html["second_part"]}</table></div>' if event_list_html['has_second_part'] else ''}
-                </div>
-            '''
+    # 일정 목록 (날짜순): 12개 이하는 6개씩 두 부분, 12개 초과는 균등하게 세 부분으로 나눕니다
+    events = [(day, event) for day in days for event in day.events]
+    if len(events) <= 12:
+        parts = [events[:6], events[6:]]
     else:
-        event_list_html_rendered = f'''
-            <table class="event-list-table">
-                {event_list_html}
-            </table>
-        '''
+        events_per_part = (len(events) + 2) // 3
+        parts = [events[i:i + events_per_part] for i in range(0, events_per_part * 3, events_per_part)]
+    return MonthCalendar(year, month, days, weeks, [part for part in parts if part])
 
-    html_content = f'''
-    <!DOCTYPE html>
-    <html lang="ko">
-    <head>
-        <meta charset="UTF-8">
-        <title>{school_name} {year}년 {month}월 학사일정</title>
-        <style>{css_style}</style>
-        <link href="https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@400;700;900&display=swap" rel="stylesheet">
-    </head>
-    <body>
-        <header class="page-header">
-            <div class="header-left">
-                <div class="header-main-title">학사일정</div>
-            </div>
-            <div class="header-right">
-                <div class="weather">날씨 정보를 불러오는 중...</div>
-                <div class="date-time" id="date-time"></div>
-                <div class="school-name">{school_name}</div>
-            </div>
-        </header>
-        <div class="main-content">
-            <div class="calendar-section">
-                <h2 style="font-size:3.3rem; color:#357ABD; margin-bottom:10px;">{year}년 {month}월</h2>
-                {calendar_html}
-            </div>
-            <div class="event-list-section">
-                {event_list_html_rendered}
-            </div>
-        </div>
-        <script>{js_code}</script>
-    </body>
-    </html>
-    '''
-    return html_content
+def generate_schedule_html(schedules, school_name, year, month):
+    """
+    학사일정을 templates/schedule.html로 렌더링합니다.
+    달력은 기본으로 한 줄 형태이고, 화면이 좁으면 표 형태(weeks)로 바뀝니다.
+    """
+    month_calendar = build_month(schedules, year, month)
+    return page_templates.render(
+        "schedule.html",
+        page_title="학사일정",
+        year=year,
+        month=month,
+        days=month_calendar.days,
+        weeks=month_calendar.weeks,
+        week_names=WEEK_NAMES,
+        parts=month_calendar.parts,
+        school_name=school_name,
+        weather_key=os.getenv("OPENWEATHER_API_KEY", "")
+    )
+
+def schedule_page_nodes(schedules, school_name, year, month):
+    """
+    학사일정 페이지의 빌드 노드를 만듭니다 (site_build 참고).
+    """
+    parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return site_build.page_nodes(
+        os.path.join(parent_dir, "school_schedule.html"),
+        "schedule.html",
+        {"schedules": schedules, "school_name": school_name, "month": [year, month]},
+        lambda: generate_schedule_html(schedules, school_name, year, month),
+        [__file__]
+    )
+
+def write_schedule_page(schedules, school_name, year, month):
+    """
+    학사일정 HTML 파일을 생성합니다.
+    입력 데이터가 이전 실행과 같으면 렌더링과 파일 쓰기를 건너뜁니다.
+    """
+    result = site_build.build(schedule_page_nodes(schedules, school_name, year, month))
+    print(site_build.format_result(result))
 
 def main():
     # 오늘 기준 월
@@ -1316,11 +224,12 @@ def main():
     year = now.year
     month = now.month
     schedules = get_schedule_info(API_KEY, ATPT_OFCDC_SC_CODE, SD_SCHUL_CODE, year, month)
-    html_content = generate_schedule_html(schedules, SCHOOL_NAME, year, month)
-    parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    with open(os.path.join(parent_dir, "school_schedule.html"), "w", encoding="utf-8") as f:
-        f.write(html_content)
-    print("학사일정 HTML 파일이 생성되었습니다.")
+    if schedules is None:
+        print("학사일정을 가져오지 못해 기존 HTML 파일을 그대로 유지합니다.")
+    else:
+        write_schedule_page(schedules, SCHOOL_NAME, year, month)
+    for line in http_client.format_stats():
+        print(line)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
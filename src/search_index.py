@@ -0,0 +1,285 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+게시물 전문 검색
+게시물 저장소(data/posts.db)의 제목과 상세 페이지 본문을 SQLite FTS5로 색인하고 순위 검색하는 모듈입니다.
+한국어는 띄어쓰기와 조사 때문에 단어 단위 색인으로는 잘 찾히지 않으므로, 한글/한자는 두 글자씩 겹쳐 자른
+바이그램으로, 영문/숫자는 단어 그대로 토큰화한 텍스트를 색인합니다. 검색어도 같은 방식으로 나누어 모든 토큰이
+들어 있는 게시물을 bm25 점수(제목 가중치 높음)로 정렬합니다.
+
+사용법:
+    python search_index.py 입학식                  # 검색
+    python search_index.py 방과후 신청 --board letters --limit 10
+    python search_index.py --reindex               # 색인 전체 다시 만들기
+"""
+
+import argparse
+import hashlib
+import re
+import time
+from contextlib import closing
+
+import post_detail
+import post_store
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS search_docs (
+    id INTEGER PRIMARY KEY,
+    board_id INTEGER NOT NULL,
+    ntt_sn INTEGER NOT NULL,
+    row_hash TEXT NOT NULL,
+    body_hash TEXT NOT NULL DEFAULT '',
+    UNIQUE (board_id, ntt_sn)
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS post_search USING fts5(
+    title,
+    body,
+    tokenize = 'unicode61 remove_diacritics 0'
+);
+"""
+
+# bm25 열 가중치 (제목, 본문)
+TITLE_WEIGHT = 5.0
+BODY_WEIGHT = 1.0
+
+DEFAULT_LIMIT = 20
+
+# 한글/한자 연속 구간과 그 밖의 글자(영문, 숫자 등) 연속 구간
+CJK_RUN = r'[가-힣ㄱ-ㆎ一-鿿]+'
+TOKEN_PATTERN = re.compile(rf'({CJK_RUN})|([^\W_]+)')
+
+
+def tokenize(text):
+    """
+    색인/검색용 토큰 목록을 만듭니다.
+    한글/한자 구간은 겹치는 두 글자 단위로, 그 밖의 단어는 소문자로 그대로 사용합니다.
+
+    Args:
+        text (str): 원문
+
+    Returns:
+        list: 토큰 목록 (예: "입학식 안내" -> ["입학", "학식", "안내"])
+    """
+    tokens = []
+    for cjk, word in TOKEN_PATTERN.findall(text.lower()):
+        if cjk:
+            if len(cjk) == 1:
+                tokens.append(cjk)
+            else:
+                tokens.extend(cjk[i:i + 2] for i in range(len(cjk) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+
+def _body_hash(body):
+    return hashlib.sha1(body.encode('utf-8')).hexdigest() if body else ''
+
+
+def _ensure_schema(conn):
+    conn.executescript(SCHEMA)
+
+
+def _load_body(url, details):
+    detail = details.get(url) if details else None
+    if detail is None:
+        detail = post_detail.load_cached_detail(url)
+    return (detail or {}).get('body', '')
+
+
+def update_index(details=None, path=None):
+    """
+    저장소에 새로 들어왔거나 제목이 바뀐 게시물, 본문을 새로 가져온 게시물만 색인에 반영합니다.
+    처리량은 전체 게시물 수가 아니라 바뀐 게시물 수에 비례합니다.
+
+    Args:
+        details (dict, optional): post_detail.fetch_post_details()의 결과 {URL: 상세 정보}
+        path (str, optional): 데이터베이스 파일 경로
+
+    Returns:
+        int: 색인을 갱신한 게시물 수
+    """
+    with closing(post_store.connect(path)) as conn, conn:
+        _ensure_schema(conn)
+        candidates = conn.execute(
+            """
+            SELECT p.board_id, p.ntt_sn, p.title, p.url, p.row_hash, d.id AS doc_id, d.body_hash
+            FROM posts p LEFT JOIN search_docs d ON d.board_id = p.board_id AND d.ntt_sn = p.ntt_sn
+            WHERE d.id IS NULL OR d.row_hash != p.row_hash
+            """
+        ).fetchall()
+        rows = {(row['board_id'], row['ntt_sn']): row for row in candidates}
+
+        if details:
+            # 본문이 새로 들어온 게시물도 다시 색인합니다
+            urls = [url for url, detail in details.items() if detail.get('body')]
+            for start in range(0, len(urls), 500):
+                chunk = urls[start:start + 500]
+                for row in conn.execute(
+                    f"""
+                    SELECT p.board_id, p.ntt_sn, p.title, p.url, p.row_hash, d.id AS doc_id, d.body_hash
+                    FROM posts p LEFT JOIN search_docs d ON d.board_id = p.board_id AND d.ntt_sn = p.ntt_sn
+                    WHERE p.url IN ({','.join('?' * len(chunk))})
+                    """,
+                    chunk
+                ):
+                    if row['body_hash'] != _body_hash(details[row['url']]['body']):
+                        rows[(row['board_id'], row['ntt_sn'])] = row
+
+        if not rows:
+            return 0
+
+        deletes = []
+        documents = []
+        for row in rows.values():
+            body = _load_body(row['url'], details)
+            if row['doc_id'] is not None:
+                deletes.append((row['doc_id'],))
+            documents.append((row, body))
+
+        if deletes:
+            conn.executemany("DELETE FROM post_search WHERE rowid = ?", deletes)
+            conn.executemany("DELETE FROM search_docs WHERE id = ?", deletes)
+        for row, body in documents:
+            cursor = conn.execute(
+                "INSERT INTO search_docs (board_id, ntt_sn, row_hash, body_hash) VALUES (?, ?, ?, ?)",
+                (row['board_id'], row['ntt_sn'], row['row_hash'], _body_hash(body))
+            )
+            conn.execute(
+                "INSERT INTO post_search (rowid, title, body) VALUES (?, ?, ?)",
+                (cursor.lastrowid, ' '.join(tokenize(row['title'])), ' '.join(tokenize(body)))
+            )
+        return len(documents)
+
+
+def rebuild_index(path=None):
+    """
+    색인을 비우고 저장소의 모든 게시물로 다시 만듭니다.
+
+    Returns:
+        int: 색인한 게시물 수
+    """
+    with closing(post_store.connect(path)) as conn, conn:
+        _ensure_schema(conn)
+        conn.execute("DELETE FROM post_search")
+        conn.execute("DELETE FROM search_docs")
+    count = update_index(path=path)
+    with closing(post_store.connect(path)) as conn:
+        conn.execute("INSERT INTO post_search (post_search) VALUES ('optimize')")
+        conn.commit()
+    return count
+
+
+def _match_expression(query):
+    tokens = tokenize(query)
+    if not tokens:
+        return None
+    terms = []
+    for token in dict.fromkeys(tokens):
+        # 한 글자 한글 검색어는 그 글자로 시작하는 바이그램을 접두어로 찾습니다
+        if len(token) == 1 and re.fullmatch(CJK_RUN, token):
+            terms.append(f'"{token}"*')
+        else:
+            terms.append('"' + token.replace('"', '""') + '"')
+    return ' '.join(terms)
+
+
+def _snippet(body, query, width=60):
+    if not body:
+        return ''
+    lowered = body.lower()
+    positions = [lowered.find(word) for word in query.lower().split() if word]
+    positions = [pos for pos in positions if pos >= 0]
+    start = max(0, min(positions) - width // 3) if positions else 0
+    text = ' '.join(body[start:start + width].split())
+    return ('…' if start else '') + text + ('…' if start + width < len(body) else '')
+
+
+def search(query, limit=DEFAULT_LIMIT, board=None, school_id=None, path=None):
+    """
+    제목/본문에서 검색어의 모든 토큰을 포함하는 게시물을 관련도 순으로 찾습니다.
+
+    Args:
+        query (str): 검색어
+        limit (int): 최대 결과 수
+        board (str, optional): 게시판 종류로 제한 (notices, letters)
+        school_id (str, optional): 학교 ID로 제한
+        path (str, optional): 데이터베이스 파일 경로
+
+    Returns:
+        list: [{"school_name", "board", "ntt_sn", "number", "title", "date", "url", "score", "snippet"}]
+    """
+    expression = _match_expression(query)
+    if expression is None:
+        return []
+
+    sql = f"""
+        SELECT b.school_name, b.name AS board, p.ntt_sn, p.number, p.title, p.date, p.url,
+               bm25(post_search, {TITLE_WEIGHT}, {BODY_WEIGHT}) AS score
+        FROM post_search
+        JOIN search_docs d ON d.id = post_search.rowid
+        JOIN posts p ON p.board_id = d.board_id AND p.ntt_sn = d.ntt_sn
+        JOIN boards b ON b.id = d.board_id
+        WHERE post_search MATCH ?
+    """
+    params = [expression]
+    if board:
+        sql += " AND b.kind = ?"
+        params.append(board)
+    if school_id:
+        sql += " AND b.school_id = ?"
+        params.append(school_id)
+    sql += " ORDER BY score LIMIT ?"
+    params.append(limit)
+
+    with closing(post_store.connect(path)) as conn:
+        _ensure_schema(conn)
+        rows = conn.execute(sql, params).fetchall()
+
+    results = []
+    for row in rows:
+        result = dict(row)
+        result['ntt_sn'] = str(result['ntt_sn'])
+        result['snippet'] = _snippet(_load_body(row['url'], None), query)
+        results.append(result)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="공지사항/가정통신문 전문 검색")
+    parser.add_argument("query", nargs="*", help="검색어")
+    parser.add_argument("--limit", type=int, default=DEFAULT_LIMIT, help="최대 결과 수")
+    parser.add_argument("--board", choices=["notices", "letters"], help="게시판 종류로 제한")
+    parser.add_argument("--school", help="학교 ID로 제한")
+    parser.add_argument("--reindex", action="store_true", help="색인 전체 다시 만들기")
+    args = parser.parse_args()
+
+    if args.reindex:
+        started = time.perf_counter()
+        count = rebuild_index()
+        print(f"게시물 {count}개 색인 완료 ({time.perf_counter() - started:.2f}초)")
+    else:
+        count = update_index()
+        if count:
+            print(f"새로 색인한 게시물: {count}개")
+
+    if not args.query:
+        return
+
+    query = ' '.join(args.query)
+    started = time.perf_counter()
+    results = search(query, args.limit, args.board, args.school)
+    elapsed = time.perf_counter() - started
+
+    print(f"'{query}' 검색 결과 {len(results)}건 ({elapsed * 1000:.1f}ms)")
+    for i, result in enumerate(results, 1):
+        print(f"{i}. [{result['board']}] {result['title']} ({result['date']})")
+        if result['snippet']:
+            print(f"   {result['snippet']}")
+        print(f"   {result['url']}")
+
+
+if __name__ == "__main__":
+    main()
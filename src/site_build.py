@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+사이트 빌드
+출력 페이지 하나를 노드 하나로 보고, 페이지가 의존하는 데이터(게시판 스냅숏, NEIS 응답, 학사일정 JSON),
+템플릿 조각, 생성기 소스 파일, 공용 스타일/스크립트 묶음을 상류 노드로 연결한 의존성 그래프입니다.
+
+상류가 없는 노드(데이터, 파일)는 내용 해시를 갖고, 나머지 노드의 해시는 상류 노드 해시를 합친 값입니다.
+해시가 이전 빌드(data/build_manifest.json)와 같은 노드는 렌더링하지 않으며,
+서로 의존하지 않는 같은 단계의 노드는 스레드 풀에서 동시에 만듭니다.
+입력이 바뀌지 않았으면 빌드는 작은 파일 몇 개의 해시를 비교하는 것으로 끝납니다.
+
+crawler, meal_crawler, school_schedule_crawler는 각자 페이지 노드를 만들고,
+main_crawler는 모든 노드를 모아 build()를 한 번 호출합니다.
+"""
+
+import hashlib
+import json
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import build_manifest
+import page_minify
+import page_templates
+
+PAGES_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 동시에 만드는 노드 수
+DEFAULT_WORKERS = int(os.getenv("SITE_BUILD_WORKERS", "4"))
+
+# 모든 페이지 출력에 영향을 주는 소스 파일 (렌더링, 압축)
+SHARED_SOURCES = [page_templates.__file__, page_minify.__file__]
+
+# 빌드 그래프의 노드
+#   name    - 노드 이름 (페이지는 출력 파일 경로, 예: meal_info.html / 데이터는 data:..., 파일은 file:...)
+#   deps    - 상류 노드 이름 목록
+#   digest  - 상류가 없는 노드의 내용 해시 (상류가 있으면 None, 빌드 중에 계산)
+#   build   - 노드 해시를 받아 출력을 만들고 새로 만들었으면 True를 반환하는 함수 (출력이 없으면 None)
+Node = namedtuple('Node', ['name', 'deps', 'digest', 'build'])
+
+# 빌드 결과 (노드 이름 목록과 걸린 시간)
+BuildResult = namedtuple('BuildResult', ['built', 'skipped', 'failed', 'elapsed'])
+
+
+def _hash(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def data_node(name, value):
+    """
+    데이터 노드를 만듭니다. 해시는 값을 JSON으로 직렬화한 내용의 해시입니다.
+    """
+    return Node(f"data:{name}", (), _hash(json.dumps(value, ensure_ascii=False, sort_keys=True, default=str)), None)
+
+
+def file_node(path):
+    """
+    소스/템플릿 파일 노드를 만듭니다. 해시는 파일 내용의 해시입니다.
+    """
+    return Node(f"file:{os.path.relpath(os.path.abspath(path), PAGES_DIR)}", (),
+                build_manifest.file_digest(path) or '', None)
+
+
+def asset_nodes(weather_key):
+    """
+    공용 스타일/스크립트 묶음 노드와 그 상류 노드를 만듭니다.
+    묶음 파일 이름은 내용 해시로 정해지므로, 입력이 같고 이전에 만든 묶음 파일이 남아 있으면 다시 만들지 않습니다.
+    """
+    upstream = [file_node(path) for path in page_templates.asset_sources()]
+    upstream.append(data_node("weather_key", weather_key))
+
+    def build(digest):
+        entry = build_manifest.lookup("assets")
+        if (entry and entry.get('inputs') == digest
+                and all(os.path.exists(os.path.join(PAGES_DIR, url)) for url in entry.get('outputs', []))):
+            return False
+        urls = page_templates.asset_urls(weather_key)
+        build_manifest.record("assets", {'inputs': digest, 'outputs': sorted(urls.values())})
+        return True
+
+    return upstream + [Node("assets", tuple(node.name for node in upstream), None, build)]
+
+
+def page_nodes(output_path, template, data, render, generators):
+    """
+    페이지 노드와 그 상류 노드(데이터, 템플릿 조각, 생성기 소스, 공용 묶음)를 만듭니다.
+
+    Args:
+        output_path (str): 출력 파일 경로
+        template (str): 페이지 템플릿 이름 (예: meal.html)
+        data: 페이지를 결정하는 입력 데이터 (JSON 직렬화 가능)
+        render (callable): 인자 없이 HTML 문자열을 반환하는 함수
+        generators (list): 페이지를 만드는 모듈의 소스 파일 경로 목록
+
+    Returns:
+        list: Node 목록 (마지막이 페이지 노드)
+    """
+    name = os.path.relpath(os.path.abspath(output_path), PAGES_DIR)
+    upstream = [data_node(name, data)]
+    upstream += [file_node(path) for path in [*page_templates.template_dependencies(template), *generators,
+                                              *SHARED_SOURCES]]
+
+    def build(digest):
+        # 노드 해시가 곧 페이지 입력이므로 write_page는 해시가 같고 출력 파일이 그대로면 렌더링하지 않습니다
+        return build_manifest.write_page(output_path, {"upstream": digest}, render)
+
+    page = Node(name, (*(node.name for node in upstream), "assets"), None, build)
+    return upstream + asset_nodes(os.getenv("OPENWEATHER_API_KEY", "")) + [page]
+
+
+def _levels(nodes):
+    """
+    노드를 의존 순서대로 단계별로 나눕니다. 한 단계의 노드는 서로 의존하지 않습니다.
+
+    Raises:
+        ValueError: 없는 상류 노드를 참조하거나 순환 의존이 있는 경우
+    """
+    remaining = dict(nodes)
+    done = set()
+    levels = []
+    while remaining:
+        level = [node for node in remaining.values() if all(dep in done for dep in node.deps)]
+        if not level:
+            missing = {dep for node in remaining.values() for dep in node.deps if dep not in nodes}
+            if missing:
+                raise ValueError(f"알 수 없는 상류 노드: {', '.join(sorted(missing))}")
+            raise ValueError(f"순환 의존: {', '.join(sorted(remaining))}")
+        levels.append(level)
+        for node in level:
+            done.add(node.name)
+            del remaining[node.name]
+    return levels
+
+
+def build(nodes, workers=DEFAULT_WORKERS):
+    """
+    그래프의 노드를 의존 순서대로 만듭니다. 해시가 바뀐 노드만 렌더링하고, 같은 단계의 노드는 동시에 만듭니다.
+    만들지 못한 노드의 하류 노드는 만들지 않고 기존 출력을 유지합니다.
+    페이지를 하나라도 새로 쓰면 어느 페이지도 참조하지 않는 이전 묶음 파일을 지웁니다.
+
+    Args:
+        nodes (iterable): Node 목록 (같은 이름의 노드는 하나로 합칩니다)
+        workers (int): 동시에 만드는 노드 수
+
+    Returns:
+        BuildResult: 새로 만든/건너뛴/실패한 노드 이름과 걸린 시간(초)
+    """
+    started = time.perf_counter()
+    graph = {}
+    for node in nodes:
+        graph.setdefault(node.name, node)
+
+    digests = {}
+    built, skipped, failed = [], [], []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for level in _levels(graph):
+            pending = {}
+            for node in level:
+                if any(dep in failed for dep in node.deps):
+                    failed.append(node.name)
+                    continue
+                digests[node.name] = node.digest if node.digest is not None else _hash(
+                    '\0'.join(f"{dep}={digests[dep]}" for dep in node.deps))
+                if node.build:
+                    pending[node.name] = executor.submit(node.build, digests[node.name])
+            for name, future in pending.items():
+                try:
+                    (built if future.result() else skipped).append(name)
+                except Exception as e:
+                    print(f"[{name}] 생성 실패: {e}")
+                    failed.append(name)
+
+    if any(name.endswith('.html') for name in built):
+        page_templates.prune_assets()
+    return BuildResult(built, skipped, failed, time.perf_counter() - started)
+
+
+def format_result(result):
+    """
+    빌드 결과 요약 문자열
+    """
+    total = len(result.built) + len(result.skipped) + len(result.failed)
+    text = f"빌드: 노드 {total}개 중 {len(result.built)}개 새로 생성, {len(result.skipped)}개 변경 없음"
+    if result.failed:
+        text += f", {len(result.failed)}개 실패 ({', '.join(result.failed)})"
+    return f"{text} ({result.elapsed * 1000:.1f}ms)"
@@ -0,0 +1,45 @@
+// 신갈중학교 이미지 슬라이드 기능
+function getSchoolImages() {
+    return [
+        'images/신갈중학교0.jpg',
+        'images/신갈중학교1.jpg',
+        'images/신갈중학교2.jpg'
+    ];
+}
+
+let currentImageIndex = 0;
+let schoolImages = [];
+
+function updateSchoolImage() {
+    const imgElement = document.querySelector('.school-img');
+    if (!imgElement) return;
+
+    // 신갈중학교 이미지 목록 가져오기
+    schoolImages = getSchoolImages();
+
+    // 페이드 아웃 효과
+    imgElement.classList.add('fade-out');
+
+    setTimeout(() => {
+        // 이미지 변경
+        imgElement.src = schoolImages[currentImageIndex];
+
+        // 다음 이미지 인덱스로 이동
+        currentImageIndex = (currentImageIndex + 1) % schoolImages.length;
+
+        // 페이드 인 효과
+        imgElement.classList.remove('fade-out');
+    }, 500);
+}
+
+// 페이지 로드 시 신갈중학교 초기 이미지 설정
+window.addEventListener('load', function() {
+    const schoolImages = getSchoolImages();
+    const imgElement = document.querySelector('.school-img');
+    if (imgElement && schoolImages.length > 0) {
+        imgElement.src = schoolImages[0];
+    }
+});
+
+// 10초마다 학교 이미지 슬라이드
+setInterval(updateSchoolImage, 10 * 1000);
@@ -0,0 +1,275 @@
+// 날씨 캐시 설정
+const WEATHER_CACHE_KEY = 'headerWeatherData_v2';
+const WEATHER_TIMESTAMP_KEY = 'headerWeatherTimestamp_v2';
+const WEATHER_UPDATE_INTERVAL = 60 * 60 * 1000; // 1시간 (밀리초)
+
+// 날짜 구분 기호는 페이지마다 다릅니다 (<body data-date-separator>)
+const DATE_SEPARATOR = document.body.dataset.dateSeparator || '.';
+
+function updateDateTime() {
+    const now = new Date();
+    const year = now.getFullYear();
+    const month = String(now.getMonth() + 1).padStart(2, '0');
+    const day = String(now.getDate()).padStart(2, '0');
+    const weekDays = ['일', '월', '화', '수', '목', '금', '토'];
+    const weekDay = weekDays[now.getDay()];
+
+    let hours = now.getHours();
+    const ampm = hours >= 12 ? '오후' : '오전';
+    hours = hours % 12;
+    hours = hours ? hours : 12; 
+    const displayHours = String(hours).padStart(2, '0');
+    const minutes = String(now.getMinutes()).padStart(2, '0');
+
+    const dateString = `${year}${DATE_SEPARATOR}${month}${DATE_SEPARATOR}${day} ${weekDay}요일`;
+    const timeString = `${ampm} ${displayHours}:${minutes}`;
+
+    document.getElementById('date-time').innerHTML = `${dateString}<br>${timeString}`;
+}
+
+// 캐시에서 날씨 데이터 가져오기
+function getCachedWeatherData() {
+    try {
+        const cachedData = localStorage.getItem(WEATHER_CACHE_KEY);
+        const timestamp = localStorage.getItem(WEATHER_TIMESTAMP_KEY);
+        
+        if (cachedData && timestamp) {
+            const data = JSON.parse(cachedData);
+            const lastUpdate = parseInt(timestamp);
+            const now = Date.now();
+            
+            // 1시간이 지나지 않았다면 캐시된 데이터 사용
+            if (now - lastUpdate < WEATHER_UPDATE_INTERVAL) {
+                console.log('캐시된 헤더 날씨 데이터 사용 중...');
+                return data;
+            }
+        }
+    } catch (error) {
+        console.error('날씨 캐시 데이터 읽기 실패:', error);
+    }
+    return null;
+}
+
+// 날씨 데이터를 캐시에 저장하기
+function saveWeatherDataToCache(data) {
+    try {
+        localStorage.setItem(WEATHER_CACHE_KEY, JSON.stringify(data));
+        localStorage.setItem(WEATHER_TIMESTAMP_KEY, Date.now().toString());
+        console.log('헤더 날씨 데이터가 캐시에 저장되었습니다.');
+    } catch (error) {
+        console.error('날씨 캐시 저장 실패:', error);
+    }
+}
+
+// 날씨 데이터를 화면에 표시하는 함수
+function displayWeatherData(weatherData) {
+    const temp = Math.round(weatherData.main.temp);
+    const weatherInfo = getWeatherInfo(
+        weatherData.weather[0].main, 
+        weatherData.weather[0].description, 
+        weatherData.isDay
+    );
+    document.querySelector('.weather').innerHTML =
+        `<img class='weather-icon' src='images/${weatherInfo.icon}' alt='날씨아이콘'>
+         <div class='weather-content'>
+            <div>${weatherInfo.text}</div>
+            <div class='weather-temp'>${temp}℃</div>
+         </div>`;
+}
+
+// 초기 날씨 데이터 로드 함수
+async function loadInitialWeather() {
+    // 먼저 캐시에서 데이터 확인
+    const cachedData = getCachedWeatherData();
+    if (cachedData) {
+        console.log('캐시된 헤더 날씨 데이터로 초기 로드 중...');
+        displayWeatherData(cachedData);
+        return;
+    }
+    
+    // 캐시에 데이터가 없거나 만료된 경우에만 API 호출
+    console.log('헤더 날씨 데이터 초기 로드 중...');
+    await fetchWeather();
+}
+
+// 날씨 정보 업데이트 함수 (1시간마다)
+async function updateWeatherIfNeeded() {
+    // 먼저 캐시에서 데이터 확인
+    const cachedData = getCachedWeatherData();
+    if (cachedData) {
+        // 캐시가 유효하면 표시 함수 호출하지 않음 (이미 표시되어 있음)
+        console.log('캐시된 헤더 날씨 데이터가 유효합니다.');
+        return;
+    }
+    
+    // 캐시에 데이터가 없거나 만료된 경우에만 API 호출
+    console.log('헤더 날씨 정보 업데이트 중...');
+    await fetchWeather();
+}
+
+async function fetchWeather() {
+    const apiKey = {{ weather_key|tojson }};
+    const lat = 37.2857;
+    const lon = 127.1109;
+    const url = `https://api.openweathermap.org/data/2.5/weather?lat=${lat}&lon=${lon}&appid=${apiKey}&units=metric`;
+    
+    try {
+        const res = await fetch(url);
+        const data = await res.json();
+        
+        if (!data.weather || !data.weather[0]) throw new Error('Invalid weather data');
+        
+        // 현재 시간을 기준으로 낮/밤 판단
+        const now = new Date();
+        const currentHour = now.getHours();
+        const isDay = currentHour >= 6 && currentHour < 18; // 6시~18시는 낮
+        
+        // isDay 정보를 데이터에 추가
+        data.isDay = isDay;
+        
+        // 데이터를 화면에 표시
+        displayWeatherData(data);
+        
+        // 성공적으로 데이터를 가져왔다면 캐시에 저장
+        saveWeatherDataToCache(data);
+        
+    } catch (e) {
+        console.error("Weather fetch error: ", e);
+        document.querySelector('.weather').textContent = '날씨 정보를 불러올 수 없습니다';
+    }
+}
+
+// OpenWeatherMap API 2.5와 커스텀 날씨 아이콘 매핑
+function getWeatherInfo(weatherMain, weatherDescription, isDay = true) {
+    // 메인 날씨 조건별 매핑
+    const mainWeatherMap = {
+        'Clear': { 
+            text: '맑음', 
+            icon: 'weather/1.png' // 태양 아이콘
+        },
+        'Clouds': {
+            text: '구름',
+            icon: getCloudIcon(weatherDescription) // 구름 정도에 따라 다른 아이콘
+        },
+        'Rain': {
+            text: '비',
+            icon: getRainIcon(weatherDescription) // 비의 강도에 따라 다른 아이콘
+        },
+        'Drizzle': {
+            text: '이슬비',
+            icon: 'weather/14.png' // 물방울 아이콘
+        },
+        'Thunderstorm': {
+            text: '뇌우',
+            icon: 'weather/7.png' // 번개 아이콘
+        },
+        'Snow': {
+            text: '눈',
+            icon: 'weather/5.png' // 눈송이 아이콘
+        },
+        'Mist': {
+            text: '안개',
+            icon: 'weather/16.png' // 안개 아이콘
+        },
+        'Fog': {
+            text: '짙은 안개',
+            icon: 'weather/16.png' // 안개 아이콘
+        },
+        'Smoke': {
+            text: '연기',
+            icon: 'weather/16.png' // 안개 아이콘 (비슷한 시야 제한)
+        },
+        'Haze': {
+            text: '실안개',
+            icon: 'weather/16.png' // 안개 아이콘
+        },
+        'Dust': {
+            text: '먼지',
+            icon: 'weather/11.png' // 바람 아이콘
+        },
+        'Sand': {
+            text: '모래바람',
+            icon: 'weather/11.png' // 바람 아이콘
+        },
+        'Ash': {
+            text: '화산재',
+            icon: 'weather/16.png' // 안개 아이콘
+        },
+        'Squall': {
+            text: '돌풍',
+            icon: 'weather/11.png' // 바람 아이콘
+        },
+        'Tornado': {
+            text: '토네이도',
+            icon: 'weather/11.png' // 바람 아이콘
+        }
+    };
+
+    // 구름 상태에 따른 아이콘 선택
+    function getCloudIcon(description) {
+        const desc = description.toLowerCase();
+        if (desc.includes('few clouds')) {
+            return 'weather/3.png'; // 부분적으로 구름 낀 맑은 날씨
+        } else if (desc.includes('scattered clouds') || desc.includes('broken clouds')) {
+            return 'weather/2.png'; // 구름 많음
+        } else if (desc.includes('overcast')) {
+            return 'weather/8.png'; // 완전히 흐림
+        }
+        return 'weather/2.png'; // 기본 구름 아이콘
+    }
+
+    // 비의 강도에 따른 아이콘 선택
+    function getRainIcon(description) {
+        const desc = description.toLowerCase();
+        if (desc.includes('light rain') || desc.includes('drizzle')) {
+            return 'weather/14.png'; // 가벼운 비 (물방울)
+        } else if (desc.includes('heavy rain') || desc.includes('extreme rain')) {
+            return 'weather/6.png'; // 폭우
+        } else if (desc.includes('thunderstorm')) {
+            return 'weather/10.png'; // 천둥번개를 동반한 비
+        }
+        return 'weather/4.png'; // 기본 비 아이콘
+    }
+
+    // 야간 모드 처리 (달 아이콘 사용)
+    function getNightIcon(weatherMain) {
+        if (weatherMain === 'Clear') {
+            return 'weather/15.png'; // 달과 별 아이콘
+        }
+        // 다른 날씨는 동일한 아이콘 사용
+        return mainWeatherMap[weatherMain]?.icon || 'weather/1.png';
+    }
+
+    // 메인 날씨 정보 가져오기
+    let weatherInfo = mainWeatherMap[weatherMain] || { 
+        text: weatherMain, 
+        icon: 'weather/1.png' 
+    };
+
+    // 야간인 경우 아이콘 변경
+    if (!isDay && weatherMain === 'Clear') {
+        weatherInfo.icon = getNightIcon(weatherMain);
+    }
+
+    return weatherInfo;
+}
+
+// 초기 로드 및 주기적 업데이트 설정
+setInterval(updateDateTime, 1000);
+updateDateTime();
+loadInitialWeather();
+
+// 5분마다 날씨 업데이트 체크
+setInterval(updateWeatherIfNeeded, 5 * 60 * 1000);
+
+// 페이지가 포커스를 받았을 때 업데이트 체크
+window.addEventListener('focus', function() {
+    updateWeatherIfNeeded();
+});
+
+// 페이지가 보이게 될 때 업데이트 체크 (탭 전환 시)
+document.addEventListener('visibilitychange', function() {
+    if (!document.hidden) {
+        updateWeatherIfNeeded();
+    }
+});